@@ -2,14 +2,32 @@
 Lambda handler for daily inference pipeline
 """
 
-import json
 import sys
 import traceback
 from pathlib import Path
+from typing import Final
+
+import orjson
 
 # Add src to path
 sys.path.insert(0, "/var/task/src")
 
+# Preload heavy dependencies during Lambda INIT (the pipeline imports them lazily,
+# which would otherwise pay the import cost inside the first invocation)
+import onnxruntime  # noqa: F401
+
+# Import pipeline functions (module scope: loaded once during Lambda INIT)
+from pipeline.daily_pipeline import run_daily_data_fetch, run_daily_inference
+# 推論モジュールも INIT で読み込み、S3クライアント・ONNXセッション等のモジュール状態をウォーム起動間で共有する
+import inference.predict  # noqa: F401
+from common.logging_config import setup_logger
+
+# Config paths
+FETCH_CONFIG: Final[Path] = Path("config/fetch_daily_universe.yaml")
+PREDICT_CONFIG: Final[Path] = Path("config/predict.yaml")
+
+logger = setup_logger(__name__)
+
 
 def lambda_handler(event, context):
     """
@@ -20,35 +38,29 @@ def lambda_handler(event, context):
     print("Lambda handler started", flush=True)
 
     try:
-        # Import pipeline functions
-        from pipeline.daily_pipeline import run_daily_data_fetch, run_daily_inference
-
-        fetch_config = Path("config/fetch_daily_universe.yaml")
-        predict_config = Path("config/predict.yaml")
-
-        print(f"Fetch config: {fetch_config}", flush=True)
-        print(f"Predict config: {predict_config}", flush=True)
+        print(f"Fetch config: {FETCH_CONFIG}", flush=True)
+        print(f"Predict config: {PREDICT_CONFIG}", flush=True)
 
         # Step 1: Fetch daily data
         print("Step 1: Fetching daily data...", flush=True)
-        fetch_success = run_daily_data_fetch(fetch_config)
+        fetch_success = run_daily_data_fetch(FETCH_CONFIG)
 
         if not fetch_success:
             return {
                 "statusCode": 500,
-                "body": json.dumps({"error": "Data fetch failed"}),
+                "body": orjson.dumps({"error": "Data fetch failed"}).decode(),
             }
 
         print("Step 1 completed successfully", flush=True)
 
         # Step 2: Run inference
         print("Step 2: Running inference...", flush=True)
-        inference_success = run_daily_inference(predict_config)
+        inference_success = run_daily_inference(PREDICT_CONFIG)
 
         if not inference_success:
             return {
                 "statusCode": 500,
-                "body": json.dumps({"error": "Inference failed"}),
+                "body": orjson.dumps({"error": "Inference failed"}).decode(),
             }
 
         print("Step 2 completed successfully", flush=True)
@@ -56,18 +68,14 @@ def lambda_handler(event, context):
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"message": "Daily pipeline completed successfully"}),
+            "body": orjson.dumps({"message": "Daily pipeline completed successfully"}).decode(),
         }
 
     except Exception as e:
-        error_msg = f"{type(e).__name__}: {str(e)}"
-        tb = traceback.format_exc()
-        print(f"Error: {error_msg}", flush=True)
-        print(f"Traceback:\n{tb}", flush=True)
+        # スタックトレースはロガー出力時にのみ整形される
+        logger.exception("Daily pipeline failed")
+        error_msg = "".join(traceback.format_exception_only(type(e), e)).strip()
         return {
             "statusCode": 500,
-            "body": json.dumps({
-                "error": error_msg,
-                "traceback": tb[-2000:] if tb else None,
-            }),
+            "body": orjson.dumps({"error": error_msg}).decode(),
         }
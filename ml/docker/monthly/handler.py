@@ -2,14 +2,30 @@
 Lambda handler for monthly finetuning pipeline
 """
 
-import json
 import sys
 import traceback
 from pathlib import Path
+from typing import Final
+
+import orjson
 
 # Add src to path
 sys.path.insert(0, "/var/task/src")
 
+# Preload heavy dependencies during Lambda INIT (the pipeline imports them lazily,
+# which would otherwise pay the import cost inside the first invocation)
+import torch  # noqa: F401
+
+# Import pipeline functions (module scope: loaded once during Lambda INIT)
+from pipeline.monthly_pipeline import run_enrich_universe, run_finetuning
+from common.logging_config import setup_logger
+
+# Config paths
+ENRICH_CONFIG: Final[Path] = Path("config/enrich_universe.yaml")
+FINETUNE_CONFIG: Final[Path] = Path("config/finetune.yaml")
+
+logger = setup_logger(__name__)
+
 
 def lambda_handler(event, context):
     """
@@ -20,35 +36,29 @@ def lambda_handler(event, context):
     print("Lambda handler started", flush=True)
 
     try:
-        # Import pipeline functions
-        from pipeline.monthly_pipeline import run_enrich_universe, run_finetuning
-
-        enrich_config = Path("config/enrich_universe.yaml")
-        finetune_config = Path("config/finetune.yaml")
-
-        print(f"Enrich config: {enrich_config}", flush=True)
-        print(f"Finetune config: {finetune_config}", flush=True)
+        print(f"Enrich config: {ENRICH_CONFIG}", flush=True)
+        print(f"Finetune config: {FINETUNE_CONFIG}", flush=True)
 
         # Step 1: Enrich universe
         print("Step 1: Enriching universe...", flush=True)
-        enrich_success = run_enrich_universe(enrich_config)
+        enrich_success = run_enrich_universe(ENRICH_CONFIG)
 
         if not enrich_success:
             return {
                 "statusCode": 500,
-                "body": json.dumps({"error": "Universe enrichment failed"}),
+                "body": orjson.dumps({"error": "Universe enrichment failed"}).decode(),
             }
 
         print("Step 1 completed successfully", flush=True)
 
         # Step 2: Run finetuning
         print("Step 2: Running finetuning...", flush=True)
-        finetune_success = run_finetuning(finetune_config)
+        finetune_success = run_finetuning(FINETUNE_CONFIG)
 
         if not finetune_success:
             return {
                 "statusCode": 500,
-                "body": json.dumps({"error": "Finetuning failed"}),
+                "body": orjson.dumps({"error": "Finetuning failed"}).decode(),
             }
 
         print("Step 2 completed successfully", flush=True)
@@ -56,18 +66,14 @@ def lambda_handler(event, context):
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"message": "Monthly pipeline completed successfully"}),
+            "body": orjson.dumps({"message": "Monthly pipeline completed successfully"}).decode(),
         }
 
     except Exception as e:
-        error_msg = f"{type(e).__name__}: {str(e)}"
-        tb = traceback.format_exc()
-        print(f"Error: {error_msg}", flush=True)
-        print(f"Traceback:\n{tb}", flush=True)
+        # スタックトレースはロガー出力時にのみ整形される
+        logger.exception("Monthly pipeline failed")
+        error_msg = "".join(traceback.format_exception_only(type(e), e)).strip()
         return {
             "statusCode": 500,
-            "body": json.dumps({
-                "error": error_msg,
-                "traceback": tb[-2000:] if tb else None,
-            }),
+            "body": orjson.dumps({"error": error_msg}).decode(),
         }
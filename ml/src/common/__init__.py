@@ -11,6 +11,9 @@ from .constants import (
     N_OUTPUT_MONTHS,
     WEEKS_PER_YEAR,
     DEFAULT_ONNX_OPSET_VERSION,
+    ModelShapes,
+    SHAPES,
+    SHAPE_WEEKLY,
 )
 from .logging_config import setup_logger
 
@@ -23,6 +26,9 @@ __all__ = [
     "N_OUTPUT_MONTHS",
     "WEEKS_PER_YEAR",
     "DEFAULT_ONNX_OPSET_VERSION",
+    "ModelShapes",
+    "SHAPES",
+    "SHAPE_WEEKLY",
     # Functions
     "setup_logger",
 ]
@@ -5,57 +5,77 @@
 マジックナンバーを集約し、保守性を向上させる。
 """
 
+from dataclasses import dataclass
+from typing import Final, Tuple
+
 # =============================================================================
 # モデル構造定数
 # =============================================================================
 
 # 週次時系列特徴量
-N_WEEKS_INPUT = 156  # 入力週数（3年）
-N_WEEKLY_FEATURES = 23  # 週次特徴量の数
+N_WEEKS_INPUT: Final[int] = 156  # 入力週数（3年）
+N_WEEKLY_FEATURES: Final[int] = 23  # 週次特徴量の数
 
 # 静的特徴量
-N_STATIC_FEATURES = 6  # 静的特徴量の数
+N_STATIC_FEATURES: Final[int] = 6  # 静的特徴量の数
 
 # 位置特徴量
-N_POSITION_FEATURES = 2  # 位置特徴量の数
+N_POSITION_FEATURES: Final[int] = 2  # 位置特徴量の数
 
 # 出力
-N_OUTPUT_MONTHS = 12  # 予測対象月数（1〜12ヶ月）
+N_OUTPUT_MONTHS: Final[int] = 12  # 予測対象月数（1〜12ヶ月）
+
+
+@dataclass(frozen=True, slots=True)
+class ModelShapes:
+    """モデル入出力の形状定数（イミュータブル）"""
+
+    N_WEEKS_INPUT: int = N_WEEKS_INPUT
+    N_WEEKLY_FEATURES: int = N_WEEKLY_FEATURES
+    N_STATIC_FEATURES: int = N_STATIC_FEATURES
+    N_POSITION_FEATURES: int = N_POSITION_FEATURES
+    N_OUTPUT_MONTHS: int = N_OUTPUT_MONTHS
+
+
+SHAPES: Final[ModelShapes] = ModelShapes()
+
+# 週次時系列入力の形状 (N_WEEKS_INPUT, N_WEEKLY_FEATURES)
+SHAPE_WEEKLY: Final[Tuple[int, int]] = (N_WEEKS_INPUT, N_WEEKLY_FEATURES)
 
 # =============================================================================
 # データ処理定数
 # =============================================================================
 
 # 週次特徴量計算
-WEEKS_PER_YEAR = 52
-LOOKBACK_YEARS_DEFAULT = 3  # 静的特徴量計算のデフォルトlookback期間
+WEEKS_PER_YEAR: Final[int] = 52
+LOOKBACK_YEARS_DEFAULT: Final[int] = 3  # 静的特徴量計算のデフォルトlookback期間
 
 # ファインチューニング用データ読み込み
-FINETUNE_LOOKBACK_YEARS = 5  # ファインチューニング時のデータ読み込み期間
+FINETUNE_LOOKBACK_YEARS: Final[int] = 5  # ファインチューニング時のデータ読み込み期間
 
 # 最小データ要件
-MIN_DAILY_RECORDS_PER_TICKER = 200  # 銘柄あたりの最小日次レコード数
+MIN_DAILY_RECORDS_PER_TICKER: Final[int] = 200  # 銘柄あたりの最小日次レコード数
 
 # =============================================================================
 # デフォルトモデルハイパーパラメータ
 # =============================================================================
 
-DEFAULT_LSTM_HIDDEN_SIZE = 128
-DEFAULT_LSTM_NUM_LAYERS = 2
-DEFAULT_LSTM_DROPOUT = 0.2
-DEFAULT_USE_BIDIRECTIONAL = True
+DEFAULT_LSTM_HIDDEN_SIZE: Final[int] = 128
+DEFAULT_LSTM_NUM_LAYERS: Final[int] = 2
+DEFAULT_LSTM_DROPOUT: Final[float] = 0.2
+DEFAULT_USE_BIDIRECTIONAL: Final[bool] = True
 
-DEFAULT_SECTOR_EMBEDDING_DIM = 8
+DEFAULT_SECTOR_EMBEDDING_DIM: Final[int] = 8
 
 DEFAULT_MLP_HIDDEN_SIZES = [256, 128, 64]
-DEFAULT_MLP_DROPOUT = 0.3
-DEFAULT_USE_BATCH_NORM = True
+DEFAULT_MLP_DROPOUT: Final[float] = 0.3
+DEFAULT_USE_BATCH_NORM: Final[bool] = True
 
 # =============================================================================
 # ONNX設定
 # =============================================================================
 
-DEFAULT_ONNX_OPSET_VERSION = 14
+DEFAULT_ONNX_OPSET_VERSION: Final[int] = 14
 
 # ONNX動的軸設定
 ONNX_DYNAMIC_AXES = {
@@ -3,7 +3,9 @@
 """
 
 import logging
-from typing import List, Callable, Any, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Callable, Any, Optional, Set, Union
 from pathlib import Path
 
 
@@ -49,15 +51,20 @@ def process_tickers_with_error_handling(
     process_func: Callable[[str], Any],
     logger: logging.Logger,
     context: Optional[str] = None,
+    max_workers: int = 16,
 ) -> tuple[List[Any], List[str]]:
     """
     ティッカーリストを処理し、成功と失敗を分離
 
+    process_func はスレッドプールで並列実行される（I/O待ちの多い処理向け）。
+    結果・エラーはいずれも入力ティッカーの順序で返す。
+
     Args:
         tickers: ティッカーリスト
         process_func: 各ティッカーを処理する関数
         logger: ロガーインスタンス
         context: エラーコンテキスト
+        max_workers: 並列ワーカー数（CPUバウンドな処理では1を指定すると逐次実行）
 
     Returns:
         tuple[List[Any], List[str]]: (成功結果リスト, エラーメッセージリスト)
@@ -74,18 +81,79 @@ def process_tickers_with_error_handling(
         ...     context="fetching data"
         ... )
     """
-    results = []
-    errors = []
+    results = {}
+    errors = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            executor.submit(process_func, ticker): (idx, ticker)
+            for idx, ticker in enumerate(tickers)
+        }
+        for future in as_completed(futures):
+            idx, ticker = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as e:
+                errors[idx] = handle_ticker_error(ticker, e, logger, context)
+
+    return (
+        [results[i] for i in sorted(results)],
+        [errors[i] for i in sorted(errors)],
+    )
+
+
+# 書き込み可能な領域（キャッシュせず毎回確認する）
+_UNCACHED_DIRS = ("/tmp",)
+
+# 存在が確認できた絶対パス（Lambdaのルートファイルシステムは読み取り専用のためキャッシュ可能）
+# 存在しない結果は後から作成されうるためキャッシュしない
+_EXISTING_PATHS: Set[str] = set()
+_EXISTING_DIRS: Set[str] = set()
+
+
+def _is_uncached(abs_path: str) -> bool:
+    """キャッシュをバイパスする絶対パス（/tmp 配下）かどうか"""
+    return any(abs_path == d or abs_path.startswith(d + os.sep) for d in _UNCACHED_DIRS)
 
-    for ticker in tickers:
-        try:
-            result = process_func(ticker)
-            results.append(result)
-        except Exception as e:
-            error_msg = handle_ticker_error(ticker, e, logger, context)
-            errors.append(error_msg)
 
-    return results, errors
+def is_tmp_path(path: Union[str, Path]) -> bool:
+    """
+    パスが書き込み可能な共有領域（/tmp）配下かどうか
+
+    他ユーザーも書き込める場所のため、キャッシュや信頼できるファイルとして扱わない判定に使う。
+
+    Args:
+        path: 判定するパス（相対パスは現在のディレクトリ基準で絶対パス化する）
+
+    Returns:
+        bool: /tmp 配下の場合 True
+    """
+    return _is_uncached(os.path.abspath(path))
+
+
+def _path_exists(path: Path) -> bool:
+    """存在確認（存在する場合のみ絶対パスでキャッシュ、/tmp 配下はキャッシュをバイパス）"""
+    # abspath は文字列処理のみ（resolve のようにパスの各要素を lstat しない）
+    p = os.path.abspath(path)
+    if p in _EXISTING_PATHS:
+        return True
+    if not os.path.exists(p):
+        return False
+    if not _is_uncached(p):
+        _EXISTING_PATHS.add(p)
+    return True
+
+
+def _path_is_dir(path: Path) -> bool:
+    """ディレクトリ判定（ディレクトリの場合のみ絶対パスでキャッシュ、/tmp 配下はキャッシュをバイパス）"""
+    p = os.path.abspath(path)
+    if p in _EXISTING_DIRS:
+        return True
+    if not os.path.isdir(p):
+        return False
+    if not _is_uncached(p):
+        _EXISTING_DIRS.add(p)
+    return True
 
 
 def validate_file_exists(file_path: Path, file_description: str = "File") -> None:
@@ -102,7 +170,7 @@ def validate_file_exists(file_path: Path, file_description: str = "File") -> Non
     Example:
         >>> validate_file_exists(Path("model.onnx"), "ONNX model")
     """
-    if not file_path.exists():
+    if not _path_exists(file_path):
         raise FileNotFoundError(
             f"{file_description} not found: {file_path}\n"
             f"Please ensure the file exists before running."
@@ -123,12 +191,12 @@ def validate_directory_exists(dir_path: Path, dir_description: str = "Directory"
     Example:
         >>> validate_directory_exists(Path("data/training/daily"), "Daily data directory")
     """
-    if not dir_path.exists():
+    if not _path_exists(dir_path):
         raise NotADirectoryError(
             f"{dir_description} not found: {dir_path}\n"
             f"Please ensure the directory exists before running."
         )
-    if not dir_path.is_dir():
+    if not _path_is_dir(dir_path):
         raise NotADirectoryError(
             f"{dir_description} is not a directory: {dir_path}"
         )
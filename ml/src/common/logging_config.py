@@ -4,7 +4,36 @@
 
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional
+
+_DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 全ロガーで共有するハンドラー（フォーマット文字列ごとに1つ）
+# レベルによるフィルタは各ロガー側で行うため、ハンドラーはNOTSETのままにする
+_DEFAULT_FORMATTER = logging.Formatter(_DEFAULT_FORMAT, datefmt=_DATE_FORMAT)
+_DEFAULT_HANDLER = logging.StreamHandler(sys.stdout)
+_DEFAULT_HANDLER.setFormatter(_DEFAULT_FORMATTER)
+
+_SHARED_HANDLERS: Dict[str, logging.Handler] = {_DEFAULT_FORMAT: _DEFAULT_HANDLER}
+
+
+def _get_shared_handler(format_string: str) -> logging.Handler:
+    """
+    フォーマット文字列に対応する共有ハンドラーを取得（なければ生成）
+
+    Args:
+        format_string: フォーマット文字列
+
+    Returns:
+        logging.Handler: 共有ハンドラー
+    """
+    handler = _SHARED_HANDLERS.get(format_string)
+    if handler is None:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter(format_string, datefmt=_DATE_FORMAT))
+        _SHARED_HANDLERS[format_string] = handler
+    return handler
 
 
 def setup_logger(
@@ -36,20 +65,10 @@ def setup_logger(
 
     logger.setLevel(level)
 
-    # コンソールハンドラー
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(level)
-
-    # フォーマット
+    # コンソールハンドラー（共有インスタンスを使用）
     if format_string is None:
-        format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-
-    formatter = logging.Formatter(
-        format_string,
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+        format_string = _DEFAULT_FORMAT
+    logger.addHandler(_get_shared_handler(format_string))
 
     return logger
 
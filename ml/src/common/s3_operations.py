@@ -5,8 +5,92 @@
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
+
+# S3クライアント（ウォームコンテナでは再利用される）
+_S3_CLIENT = None
+
+# マルチパート転送設定（初回の大容量アップロード時に生成して共有）
+_TRANSFER_CONFIG = None
+
+# copy_object（単一リクエストのサーバーサイドコピー）の上限サイズ
+_COPY_OBJECT_MAX_BYTES = 5 * 1024 ** 3
+
+# これ未満のファイルは put_object 1回でアップロード（TransferManager を経由しない）
+_PUT_OBJECT_MAX_BYTES = 8 * 1024 ** 2
+
+# 複数ファイルを並列アップロードする際の最大ワーカー数
+_UPLOAD_MAX_WORKERS = 4
+
+
+def _get_s3():
+    """
+    共有S3クライアントを取得（初回呼び出し時のみ生成）
+
+    boto3 のインポートもここで行うため、S3を使わない呼び出し元は
+    boto3/botocore の読み込みコストを負担しない。
+
+    Returns:
+        boto3 S3クライアント
+    """
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        import boto3
+        from botocore.config import Config
+
+        _S3_CLIENT = boto3.client(
+            "s3",
+            config=Config(
+                max_pool_connections=50,
+                retries={"mode": "standard", "max_attempts": 3},
+            ),
+        )
+    return _S3_CLIENT
+
+
+def _get_transfer_config():
+    """
+    共有マルチパート転送設定を取得（初回呼び出し時のみ生成）
+
+    Returns:
+        boto3.s3.transfer.TransferConfig
+    """
+    global _TRANSFER_CONFIG
+    if _TRANSFER_CONFIG is None:
+        from boto3.s3.transfer import TransferConfig
+
+        _TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=16 * 1024 ** 2,
+            multipart_chunksize=16 * 1024 ** 2,
+            max_concurrency=20,
+            use_threads=True,
+        )
+    return _TRANSFER_CONFIG
+
+
+def _upload_file(s3_client, local_path: Path, size: int, bucket: str, key: str) -> None:
+    """
+    ファイルサイズに応じて put_object / マルチパート転送を切り替えてアップロード
+
+    Args:
+        s3_client: boto3 S3クライアント
+        local_path: ローカルファイルパス
+        size: ファイルサイズ（バイト）
+        bucket: S3バケット名
+        key: S3キー（パス）
+    """
+    if size < _PUT_OBJECT_MAX_BYTES:
+        s3_client.put_object(Bucket=bucket, Key=key, Body=local_path.read_bytes())
+    else:
+        s3_client.upload_file(
+            os.fspath(local_path),
+            bucket,
+            key,
+            Config=_get_transfer_config(),
+        )
 
 
 def upload_with_latest(
@@ -45,20 +129,15 @@ def upload_with_latest(
         ['s3://my-bucket/predictions/predictions_20251220_120000.json',
          's3://my-bucket/predictions/latest.json']
     """
-    import boto3
-
     if not local_path.exists():
         raise FileNotFoundError(f"Local file not found: {local_path}")
 
-    s3_client = boto3.client("s3")
+    s3_client = _get_s3()
+    size = local_path.stat().st_size
     uploaded_uris = []
 
     # Upload with timestamp/specific key
-    s3_client.upload_file(
-        str(local_path),
-        bucket,
-        key,
-    )
+    _upload_file(s3_client, local_path, size, bucket, key)
     uri = f"s3://{bucket}/{key}"
     uploaded_uris.append(uri)
 
@@ -67,11 +146,15 @@ def upload_with_latest(
 
     # Upload as latest if specified
     if latest_key:
-        s3_client.upload_file(
-            str(local_path),
-            bucket,
-            latest_key,
-        )
+        if size <= _COPY_OBJECT_MAX_BYTES:
+            # 同一内容なのでサーバーサイドコピーで再アップロードを省略
+            s3_client.copy_object(
+                Bucket=bucket,
+                Key=latest_key,
+                CopySource={"Bucket": bucket, "Key": key},
+            )
+        else:
+            _upload_file(s3_client, local_path, size, bucket, latest_key)
         latest_uri = f"s3://{bucket}/{latest_key}"
         uploaded_uris.append(latest_uri)
 
@@ -81,6 +164,47 @@ def upload_with_latest(
     return uploaded_uris
 
 
+def upload_many_with_latest(
+    jobs: List[Tuple[Path, str, Optional[str]]],
+    bucket: str,
+    logger: Optional[logging.Logger] = None,
+) -> List[str]:
+    """
+    複数ファイルを並列に upload_with_latest する
+
+    各ファイルのアップロードは独立しているためスレッドプールで同時に実行する
+    （boto3クライアントはスレッドセーフ）。
+
+    Args:
+        jobs: (ローカルファイルパス, S3キー, latest版S3キー) のリスト
+        bucket: S3バケット名
+        logger: ロガーインスタンス
+
+    Returns:
+        List[str]: アップロードされたS3 URIのリスト（jobs の順序）
+    """
+    if not jobs:
+        return []
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(_UPLOAD_MAX_WORKERS, len(jobs))) as executor:
+        futures = {
+            executor.submit(
+                upload_with_latest,
+                local_path=local_path,
+                bucket=bucket,
+                key=key,
+                latest_key=latest_key,
+                logger=logger,
+            ): idx
+            for idx, (local_path, key, latest_key) in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return [uri for idx in sorted(results) for uri in results[idx]]
+
+
 def upload_checkpoint_to_s3(
     checkpoint_path: Path,
     bucket: str,
@@ -152,22 +276,11 @@ def upload_onnx_to_s3(
         ...     logger=logger
         ... )
     """
-    uploaded_uris = []
-
     # Upload ONNX model
     filename = onnx_path.name
     key = f"{prefix}/{filename}"
     latest_key = f"{prefix}/latest.onnx" if upload_latest else None
-
-    uploaded_uris.extend(
-        upload_with_latest(
-            local_path=onnx_path,
-            bucket=bucket,
-            key=key,
-            latest_key=latest_key,
-            logger=logger,
-        )
-    )
+    jobs = [(onnx_path, key, latest_key)]
 
     # Upload metadata JSON if it exists
     if upload_metadata:
@@ -175,15 +288,6 @@ def upload_onnx_to_s3(
         if metadata_path.exists():
             metadata_key = f"{prefix}/{metadata_path.name}"
             metadata_latest_key = f"{prefix}/latest.json" if upload_latest else None
+            jobs.append((metadata_path, metadata_key, metadata_latest_key))
 
-            uploaded_uris.extend(
-                upload_with_latest(
-                    local_path=metadata_path,
-                    bucket=bucket,
-                    key=metadata_key,
-                    latest_key=metadata_latest_key,
-                    logger=logger,
-                )
-            )
-
-    return uploaded_uris
+    return upload_many_with_latest(jobs, bucket=bucket, logger=logger)
@@ -10,11 +10,23 @@ Historical daily market data backfill for stock universe
 from __future__ import annotations
 
 import argparse
+import logging
 import os
 import sys
+import tempfile
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, DefaultDict, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pandas as pd
 import yaml
@@ -31,13 +43,25 @@ from data.utils.config import (
     resolve_universe_yaml_path,
 )
 from data.utils.universe_loader import get_tickers_from_universe_yaml
-from data.utils.io import ensure_dir, write_json
-from data.utils.s3io import put_json
-from data.utils.yfin import safe_history
-from data.utils.aggregate import build_by_date
+from data.utils.io import ZSTD_SUFFIX, dumps_json, ensure_dir, write_json
+from data.utils.s3io import get_s3_client, put_json
+from data.utils.yfin import safe_history_batch, safe_history_many
+from data.utils.aggregate import SqliteByDate, build_by_date
 
 logger = setup_logger(__name__)
 
+# 取得ループの進捗ログを出力する間隔（銘柄数）
+PROGRESS_EVERY = 50
+
+# S3への日付ファイルの並列アップロード数
+S3_UPLOAD_MAX_WORKERS = 32
+
+# build_by_date をプロセス並列化する銘柄数の下限（プロセス起動コストを償却できる規模）
+BUILD_PROCESS_MIN_TICKERS = 200
+
+# プロセスプールへ同時に投入する build_by_date タスク数の上限（ワーカー数あたり）
+BUILD_IN_FLIGHT_PER_WORKER = 4
+
 
 def fetch_historical_data(
     tickers: List[str],
@@ -46,7 +70,10 @@ def fetch_historical_data(
     use_adj: bool,
     fields: List[str],
     retry: RetryConfig,
-) -> tuple[Dict[str, List[Dict[str, Any]]], Optional[pd.Timestamp]]:
+    max_workers: int = 16,
+    store: Optional[SqliteByDate] = None,
+    build_workers: int = 1,
+) -> tuple[Mapping[str, List[Dict[str, Any]]], Optional[pd.Timestamp]]:
     """
     複数銘柄の履歴データを取得し、日付ごとに集約する
 
@@ -57,6 +84,10 @@ def fetch_historical_data(
         use_adj: 調整後終値を使用するか
         fields: 取得するフィールドリスト
         retry: リトライ設定
+        max_workers: バッチで取得できなかった銘柄を個別取得する並列ワーカー数
+        store: 指定した場合はレコードをメモリではなくこのストアに書き出す（ストリーミングモード）
+        build_workers: build_by_date を実行するプロセス数
+            （2以上かつ銘柄数が BUILD_PROCESS_MIN_TICKERS を超える場合のみプロセス並列化）
 
     Returns:
         (by_date, latest_dt): 日付ごとのデータ辞書と最新日時
@@ -64,52 +95,256 @@ def fetch_historical_data(
     Raises:
         ValueError: データが1件も取得できなかった場合
     """
-    by_date: Dict[str, List[Dict[str, Any]]] = {}
+    by_date: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
     latest_dt: Optional[pd.Timestamp] = None
     failed_tickers: List[str] = []
 
-    for idx, tk in enumerate(tickers, 1):
-        print(f"[{idx}/{len(tickers)}] Fetching {tk} (period={period})...", end=" ")
-
-        try:
-            df = safe_history(tk, period, interval, retry.times, retry.sleep_seconds)
-
-            if df.empty:
-                print("NO DATA")
+    # 複数銘柄をまとめて取得（取得できなかった銘柄は個別に再取得）
+    logger.info(f"Downloading {len(tickers)} tickers in batches (period={period})...")
+    histories = safe_history_batch(tickers, period, interval, retry.times, retry.sleep_seconds)
+
+    # バッチで取得できなかった銘柄は個別に並列取得（リトライはラウンド単位でバックオフ）
+    missing = [tk for tk in tickers if tk not in histories]
+    fetch_errors: Dict[str, str] = {}
+    if missing:
+        logger.info(f"Fetching {len(missing)} tickers individually...")
+        fetched, fetch_errors = safe_history_many(
+            missing, period, interval, retry.times, retry.sleep_seconds, max_workers=max_workers
+        )
+        histories.update(fetched)
+
+    def _update_latest(ticker_latest: Optional[pd.Timestamp]) -> None:
+        nonlocal latest_dt
+        if ticker_latest is not None and (latest_dt is None or ticker_latest > latest_dt):
+            latest_dt = ticker_latest
+
+    # 銘柄数が多い場合は CPU バウンドな build_by_date を別プロセスで実行する（GIL を回避）
+    build_executor: Optional[ProcessPoolExecutor] = None
+    if build_workers > 1 and len(tickers) > BUILD_PROCESS_MIN_TICKERS:
+        build_executor = ProcessPoolExecutor(max_workers=build_workers)
+    pending_builds: Deque[Tuple[int, str, int, Future]] = deque()
+
+    def _drain_builds(max_pending: int) -> None:
+        # 投入順（= 銘柄の処理順）に取り出して集約し、日付内のレコード順を保つ
+        while len(pending_builds) > max_pending:
+            idx, tk, rows, future = pending_builds.popleft()
+            try:
+                ticker_by_date, ticker_latest = future.result()
+                if store is None:
+                    for day_str, recs in ticker_by_date.items():
+                        by_date[day_str].extend(recs)
+                else:
+                    store.add(ticker_by_date)
+                _update_latest(ticker_latest)
+                logger.debug(f"[{idx}/{len(tickers)}] {tk}: OK ({rows} rows)")
+            except Exception as e:
+                logger.warning(f"[{idx}/{len(tickers)}] {tk}: ERROR: {e}")
                 failed_tickers.append(tk)
-                continue
 
-            ticker_by_date, ticker_latest = build_by_date(tk, df, use_adj, fields)
-
-            # マージ
-            for day_str, records in ticker_by_date.items():
-                by_date.setdefault(day_str, []).extend(records)
+    try:
+        # 集約は入力順に単一スレッドで共有 by_date へ直接追記する
+        for idx, tk in enumerate(tickers, 1):
+            try:
+                # 集約済みの銘柄は参照を外してメモリを解放する
+                df = histories.pop(tk, None)
+                if df is None:
+                    raise RuntimeError(fetch_errors.get(tk, "No data returned"))
+
+                if df.empty:
+                    logger.warning(f"[{idx}/{len(tickers)}] {tk}: NO DATA")
+                    failed_tickers.append(tk)
+                    continue
+
+                if build_executor is not None:
+                    pending_builds.append(
+                        (idx, tk, len(df), build_executor.submit(build_by_date, tk, df, use_adj, fields))
+                    )
+                    _drain_builds(build_workers * BUILD_IN_FLIGHT_PER_WORKER)
+                else:
+                    if store is None:
+                        _, ticker_latest = build_by_date(tk, df, use_adj, fields, by_date=by_date)
+                    else:
+                        ticker_by_date, ticker_latest = build_by_date(tk, df, use_adj, fields)
+                        store.add(ticker_by_date)
+                    _update_latest(ticker_latest)
+                    logger.debug(f"[{idx}/{len(tickers)}] {tk}: OK ({len(df)} rows)")
+
+            except Exception as e:
+                logger.warning(f"[{idx}/{len(tickers)}] {tk}: ERROR: {e}")
+                failed_tickers.append(tk)
 
-            if latest_dt is None or (ticker_latest is not None and ticker_latest > latest_dt):
-                latest_dt = ticker_latest
+            # 進捗は一定件数ごとにまとめて出力
+            if idx % PROGRESS_EVERY == 0 or idx == len(tickers):
+                logger.info(f"Progress: {idx}/{len(tickers)} tickers ({len(failed_tickers)} failed)")
 
-            print(f"OK ({len(ticker_by_date)} days)")
+        _drain_builds(0)
+    finally:
+        if build_executor is not None:
+            build_executor.shutdown(cancel_futures=True)
 
-        except Exception as e:
-            print(f"ERROR: {e}")
-            failed_tickers.append(tk)
+    result = dict(by_date) if store is None else store
 
-    if not by_date:
+    if not result:
         raise ValueError(
             f"No data collected. All {len(tickers)} tickers failed. "
             f"Failed tickers: {', '.join(failed_tickers)}"
         )
 
     if failed_tickers:
-        print(f"\n[WARNING] Failed to fetch {len(failed_tickers)}/{len(tickers)} tickers:")
-        for tk in failed_tickers:
-            print(f"  - {tk}")
+        logger.warning(
+            f"Failed to fetch {len(failed_tickers)}/{len(tickers)} tickers: {', '.join(failed_tickers)}"
+        )
+
+    return result, latest_dt
+
+
+def _day_payload(by_date: Mapping[str, List[Dict[str, Any]]], day_str: str) -> Dict[str, Any]:
+    """日付ファイルのJSONペイロードを組み立てる"""
+    symbols = by_date[day_str]
+    return {
+        "as_of": day_str,
+        "count": len(symbols),
+        "symbols": symbols,
+    }
+
 
-    return by_date, latest_dt
+def _non_empty_dates(by_date: Mapping[str, List[Dict[str, Any]]]) -> List[str]:
+    """
+    レコードが1件以上ある日付をソートして返す（空の日付はファイルを書き出さない）
+
+    SqliteByDate はレコードのある日付のみを列挙するため、日付ごとの読み出しを省略する。
+    """
+    if isinstance(by_date, SqliteByDate):
+        return list(by_date)
+    return [day_str for day_str in sorted(by_date) if by_date[day_str]]
+
+
+def _iter_day_payloads(
+    by_date: Mapping[str, List[Dict[str, Any]]],
+    sorted_dates: List[str],
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    日付順に (ファイル名の語幹, ペイロード) を返す
+
+    最後に最新日のペイロードをそのまま "latest" として返す
+    （latest.json 用にペイロードを組み立て直さない）。
+    """
+    payload: Optional[Dict[str, Any]] = None
+    for day_str in sorted_dates:
+        payload = _day_payload(by_date, day_str)
+        yield day_str, payload
+    if payload is not None:
+        yield "latest", payload
+
+
+def _day_file_suffix(name: str, compress: bool) -> str:
+    """日付ファイルの拡張子（圧縮時は .json.zst、latest は常に .json）"""
+    if compress and name != "latest":
+        return ".json" + ZSTD_SUFFIX
+    return ".json"
+
+
+def _map_bounded(
+    executor: ThreadPoolExecutor,
+    fn: Callable[..., Any],
+    items: Iterable[Tuple[Any, ...]],
+    max_in_flight: int,
+) -> Iterator[Any]:
+    """
+    items の各引数タプルで fn を並列実行し、完了順に結果を返す
+
+    items は必要になった時点で1件ずつ取り出し、同時に保持するタスク数を
+    max_in_flight までに制限する（全ペイロードを一度にメモリへ展開しない）。
+    """
+    pending = set()
+    for args in items:
+        if len(pending) >= max_in_flight:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+        pending.add(executor.submit(fn, *args))
+    for future in as_completed(pending):
+        yield future.result()
+
+
+def upload_backfill_ndjson(
+    by_date: Mapping[str, List[Dict[str, Any]]],
+    sorted_dates: List[str],
+    bucket: str,
+    key: str,
+    s3_client: Any,
+) -> None:
+    """
+    全日付のデータを1つのNDJSON（1行1日付）にまとめてマルチパートアップロードする
+
+    Args:
+        by_date: 日付ごとのデータ辞書
+        sorted_dates: ソート済みの日付リスト
+        bucket: S3バケット名
+        key: アップロード先のS3キー
+        s3_client: boto3 S3クライアント
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    transfer_config = TransferConfig(
+        multipart_chunksize=25 * 1024 * 1024,
+        max_concurrency=20,
+        use_threads=True,
+    )
+
+    # 64MBまではメモリ上、それを超えると一時ファイルに退避
+    with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as buf:
+        for day_str in sorted_dates:
+            line = _day_payload(by_date, day_str)
+            buf.write(dumps_json(line, indent=None))
+            buf.write(b"\n")
+        buf.seek(0)
+
+        s3_client.upload_fileobj(
+            buf,
+            bucket,
+            key,
+            ExtraArgs={"ContentType": "application/x-ndjson; charset=utf-8"},
+            Config=transfer_config,
+        )
+
+
+def _put_daily_files(
+    by_date: Mapping[str, List[Dict[str, Any]]],
+    sorted_dates: List[str],
+    bucket: str,
+    daily_prefix: str,
+    s3_client: Any,
+    compress: bool = False,
+) -> None:
+    """
+    日付ごとのJSONファイルと latest.json を並列にS3へPUTする（共有クライアントを使用）
+
+    compress=True の場合、日付ファイルは zstd 圧縮した .json.zst として保存する
+    （latest.json は他のコンポーネントが直接読むため常に非圧縮）。
+    """
+    items = (
+        (
+            bucket,
+            f"{daily_prefix}/{name}{_day_file_suffix(name, compress)}",
+            payload,
+            2,
+            s3_client,
+            compress and name != "latest",
+        )
+        for name, payload in _iter_day_payloads(by_date, sorted_dates)
+    )
+    total = len(sorted_dates) + 1
+
+    with ThreadPoolExecutor(max_workers=S3_UPLOAD_MAX_WORKERS) as executor:
+        results = _map_bounded(executor, put_json, items, max_in_flight=S3_UPLOAD_MAX_WORKERS * 2)
+        for idx, _ in enumerate(results, 1):
+            if idx % 100 == 0 or idx == total:
+                print(f"  Progress: {idx}/{total} files uploaded")
 
 
 def save_backfill_output(
-    by_date: Dict[str, List[Dict[str, Any]]],
+    by_date: Mapping[str, List[Dict[str, Any]]],
     cfg: Dict[str, Any],
     base_dir: Path,
 ) -> None:
@@ -121,7 +356,9 @@ def save_backfill_output(
         cfg: 全体設定
         base_dir: ベースディレクトリ（ml/）
     """
-    sorted_dates = sorted(by_date.keys())
+    sorted_dates = _non_empty_dates(by_date)
+    if not sorted_dates:
+        raise ValueError("No records to save: every date has 0 symbols")
 
     env = cfg.get("env", "local")
     env_cfg = cfg.get(env, {})
@@ -133,29 +370,33 @@ def save_backfill_output(
             outdir = base_dir / outdir
         outdir = outdir.resolve()
         ensure_dir(outdir)
+        compress = bool(output_cfg.get("compress", False))
 
         print(f"\n[INFO] Saving to local directory: {outdir}")
-        for idx, day_str in enumerate(sorted_dates, 1):
-            symbols = by_date[day_str]
-            payload = {
-                "as_of": day_str,
-                "count": len(symbols),
-                "symbols": symbols,
-            }
-            write_json(outdir / f"{day_str}.json", payload)
-
-            if idx % 100 == 0 or idx == len(sorted_dates):
-                print(f"  Progress: {idx}/{len(sorted_dates)} files written")
-
-        # latest.json
-        latest_day = sorted_dates[-1]
-        latest_payload = {
-            "as_of": latest_day,
-            "count": len(by_date[latest_day]),
-            "symbols": by_date[latest_day],
-        }
-        write_json(outdir / "latest.json", latest_payload)
 
+        # ファイル書き込み（シリアライズ + システムコール）を並列に実行
+        # 日付ファイルのパスは Path を経由せず文字列で組み立てる
+        outdir_str = os.fspath(outdir)
+        # latest.json は最新日のペイロードを使い回して一緒に書き出す
+        items = (
+            (
+                f"{outdir_str}/{name}{_day_file_suffix(name, compress)}",
+                payload,
+                2,
+                compress and name != "latest",
+            )
+            for name, payload in _iter_day_payloads(by_date, sorted_dates)
+        )
+        total = len(sorted_dates) + 1
+
+        max_workers = min(16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = _map_bounded(executor, write_json, items, max_in_flight=max_workers * 2)
+            for idx, _ in enumerate(results, 1):
+                if idx % 100 == 0 or idx == total:
+                    print(f"  Progress: {idx}/{total} files written")
+
+        latest_day = sorted_dates[-1]
         print(f"[OK] Local saved: {len(sorted_dates)} files")
         print(f"[OK] Latest: {outdir / 'latest.json'} ({latest_day})")
 
@@ -163,33 +404,26 @@ def save_backfill_output(
         s3_cfg = cfg.get("s3", {})
         bucket = str(s3_cfg["bucket"])
         daily_prefix = str(output_cfg.get("daily_prefix", "market_data/training/daily"))
+        aggregate = bool(output_cfg.get("aggregate", False))
+        compress = bool(output_cfg.get("compress", False))
 
         print(f"\n[INFO] Uploading to S3: s3://{bucket}/{daily_prefix}")
-        for idx, day_str in enumerate(sorted_dates, 1):
-            symbols = by_date[day_str]
-            payload = {
-                "as_of": day_str,
-                "count": len(symbols),
-                "symbols": symbols,
-            }
-
-            key = f"{daily_prefix}/{day_str}.json"
-            put_json(bucket=bucket, key=key, payload=payload)
+        s3_client = get_s3_client()
 
-            if idx % 100 == 0 or idx == len(sorted_dates):
-                print(f"  Progress: {idx}/{len(sorted_dates)} files uploaded")
-
-        # latest.json
         latest_day = sorted_dates[-1]
-        latest_payload = {
-            "as_of": latest_day,
-            "count": len(by_date[latest_day]),
-            "symbols": by_date[latest_day],
-        }
         latest_key = f"{daily_prefix}/latest.json"
-        put_json(bucket=bucket, key=latest_key, payload=latest_payload)
 
+        # 日次データの読み込み（推論・学習）は日付ごとのJSONを読むため、常に日付ごとにアップロードする
+        # latest.json も日付ファイルと一緒に並列アップロードされる
+        _put_daily_files(by_date, sorted_dates, bucket, daily_prefix, s3_client, compress=compress)
         print(f"[OK] S3 uploaded: {len(sorted_dates)} files")
+
+        if aggregate:
+            # アーカイブ: 全日付を1ファイルにまとめてマルチパートアップロード（読み込み側では使用しない）
+            ndjson_key = f"{daily_prefix}/backfill.ndjson"
+            upload_backfill_ndjson(by_date, sorted_dates, bucket, ndjson_key, s3_client)
+            print(f"[OK] S3 uploaded archive: s3://{bucket}/{ndjson_key} ({len(sorted_dates)} days)")
+
         print(f"[OK] Latest: s3://{bucket}/{latest_key} ({latest_day})")
 
 
@@ -215,6 +449,18 @@ def parse_args() -> argparse.Namespace:
         help="Path to config yaml file (環境変数: CONFIG_PATH)",
     )
 
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Buffer per-date records in a temporary SQLite file instead of memory (長期間・多銘柄向け)",
+    )
+
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors from the fetch loop",
+    )
+
     args = parser.parse_args()
 
     if not args.config:
@@ -227,6 +473,8 @@ def main() -> None:
     """メイン関数"""
     try:
         args = parse_args()
+        if args.quiet:
+            logger.setLevel(logging.WARNING)
         config_path = Path(args.config).resolve()
 
         if not config_path.exists():
@@ -259,6 +507,8 @@ def main() -> None:
         interval = str(yf_cfg.get("interval", "1d"))
         period = str(yf_cfg.get("period", "5y"))
         use_adj = bool(yf_cfg.get("use_adjclose", True))
+        parallel = int(yf_cfg.get("parallel", 16))
+        build_workers = int(yf_cfg.get("build_workers", 0)) or (os.cpu_count() or 1)
 
         fields = list(cfg.get("fields", ["open", "high", "low", "close", "adjclose", "volume"]))
 
@@ -270,33 +520,46 @@ def main() -> None:
 
         print(f"[INFO] Backfill parameters:")
         print(f"  period: {period}, interval: {interval}")
-        print(f"  use_adjclose: {use_adj}")
+        print(f"  use_adjclose: {use_adj}, parallel: {parallel}")
         print(f"  fields: {', '.join(fields)}")
         print(f"  retry: {retry.times} times, sleep: {retry.sleep_seconds}s\n")
 
-        # Fetch historical data
-        print("[INFO] Fetching historical data...")
-        by_date, latest_dt = fetch_historical_data(
-            tickers=tickers,
-            period=period,
-            interval=interval,
-            use_adj=use_adj,
-            fields=fields,
-            retry=retry,
-        )
-
-        total_records = sum(len(v) for v in by_date.values())
-        date_range = f"{min(by_date.keys())} to {max(by_date.keys())}"
-
-        print(f"\n[SUCCESS] Collected {total_records} records across {len(by_date)} days")
-        print(f"[INFO] Date range: {date_range}")
-
-        # Save output
-        save_backfill_output(by_date, cfg, base_dir)
+        # ストリーミングモードではレコードを一時SQLiteファイルに書き出す
+        store = SqliteByDate() if args.streaming else None
+        try:
+            # Fetch historical data
+            print(f"[INFO] Fetching historical data... (streaming: {args.streaming})")
+            by_date, latest_dt = fetch_historical_data(
+                tickers=tickers,
+                period=period,
+                interval=interval,
+                use_adj=use_adj,
+                fields=fields,
+                retry=retry,
+                max_workers=parallel,
+                store=store,
+                build_workers=build_workers,
+            )
+
+            if store is not None:
+                total_records = store.total_records()
+            else:
+                total_records = sum(len(v) for v in by_date.values())
+            sorted_dates = _non_empty_dates(by_date)
+            date_range = f"{sorted_dates[0]} to {sorted_dates[-1]}"
+
+            print(f"\n[SUCCESS] Collected {total_records} records across {len(sorted_dates)} days")
+            print(f"[INFO] Date range: {date_range}")
+
+            # Save output
+            save_backfill_output(by_date, cfg, base_dir)
+        finally:
+            if store is not None:
+                store.close()
 
         print("\n" + "=" * 60)
         print("[SUCCESS] Daily data backfill completed!")
-        print(f"[INFO] Total: {total_records} records, {len(by_date)} days")
+        print(f"[INFO] Total: {total_records} records, {len(sorted_dates)} days")
         print("=" * 60)
 
     except Exception as e:
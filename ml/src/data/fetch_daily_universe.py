@@ -10,11 +10,12 @@ Daily market data fetcher for stock universe
 from __future__ import annotations
 
 import argparse
+import logging
 import os
 import sys
 from datetime import datetime, timezone, date
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 import yaml
@@ -39,10 +40,19 @@ from data.utils.config import (
 from data.utils.universe_loader import get_tickers_from_universe_yaml
 from data.utils.io import write_daily_payloads
 from data.utils.s3io import put_json
-from data.utils.yfin import safe_history, select_row_for_asof, map_row_fields
+from data.utils.yfin import (
+    safe_history_batch,
+    safe_history_many,
+    select_row_for_asof,
+    map_row_fields,
+    resolve_field_columns,
+)
 
 logger = setup_logger(__name__)
 
+# 取得ループの進捗ログを出力する間隔（銘柄数）
+PROGRESS_EVERY = 50
+
 
 def fetch_daily_data(
     tickers: List[str],
@@ -52,6 +62,7 @@ def fetch_daily_data(
     use_adj: bool,
     fields: List[str],
     retry: RetryConfig,
+    max_workers: int = 16,
 ) -> tuple[List[Dict[str, Any]], date]:
     """
     複数銘柄の日次データを取得する
@@ -64,6 +75,7 @@ def fetch_daily_data(
         use_adj: 調整後終値を使用するか
         fields: 取得するフィールドリスト
         retry: リトライ設定
+        max_workers: バッチで取得できなかった銘柄を個別取得する並列ワーカー数
 
     Returns:
         (records, chosen_as_of): 取得したレコードリストと実際の取得日
@@ -75,15 +87,33 @@ def fetch_daily_data(
     chosen_as_of: Optional[date] = None
     failed_tickers: List[str] = []
 
-    for idx, tk in enumerate(tickers, 1):
-        print(f"[{idx}/{len(tickers)}] Fetching {tk}...", end=" ")
+    # 複数銘柄をまとめて取得（取得できなかった銘柄は個別に再取得）
+    logger.info(f"Downloading {len(tickers)} tickers in batches...")
+    histories = safe_history_batch(tickers, period, interval, retry.times, retry.sleep_seconds)
+
+    # バッチで取得できなかった銘柄は個別に並列取得（リトライはラウンド単位でバックオフ）
+    missing = [tk for tk in tickers if tk not in histories]
+    fetch_errors: Dict[str, str] = {}
+    if missing:
+        logger.info(f"Fetching {len(missing)} tickers individually...")
+        fetched, fetch_errors = safe_history_many(
+            missing, period, interval, retry.times, retry.sleep_seconds, max_workers=max_workers
+        )
+        histories.update(fetched)
+
+    # 列構成ごとに fields → 列名の対応を1回だけ計算して使い回す
+    field_columns_cache: Dict[Tuple[str, ...], List[Tuple[str, Optional[str]]]] = {}
 
+    # 集約は入力順に単一スレッドで行う
+    for idx, tk in enumerate(tickers, 1):
         try:
-            df = safe_history(tk, period, interval, retry.times, retry.sleep_seconds)
+            df = histories.pop(tk, None)
+            if df is None:
+                raise RuntimeError(fetch_errors.get(tk, "No data returned"))
             row = select_row_for_asof(df, as_of_d)
 
             if row is None:
-                print(f"NO DATA (as_of={as_of_d or 'auto'})")
+                logger.warning(f"[{idx}/{len(tickers)}] {tk}: NO DATA (as_of={as_of_d or 'auto'})")
                 failed_tickers.append(tk)
                 continue
 
@@ -93,15 +123,22 @@ def fetch_daily_data(
                 chosen_as_of = rd
 
             item = {"ticker": tk}
-            item.update(map_row_fields(row, use_adj, fields))
+            col_key = tuple(row.index)
+            if col_key not in field_columns_cache:
+                field_columns_cache[col_key] = resolve_field_columns(col_key, use_adj, fields)
+            item.update(map_row_fields(row, use_adj, fields, field_columns_cache[col_key]))
             records.append(item)
 
-            print(f"OK (date={rd})")
+            logger.debug(f"[{idx}/{len(tickers)}] {tk}: OK (date={rd})")
 
         except Exception as e:
-            print(f"ERROR: {e}")
+            logger.warning(f"[{idx}/{len(tickers)}] {tk}: ERROR: {e}")
             failed_tickers.append(tk)
 
+        # 進捗は一定件数ごとにまとめて出力
+        if idx % PROGRESS_EVERY == 0 or idx == len(tickers):
+            logger.info(f"Progress: {idx}/{len(tickers)} tickers ({len(failed_tickers)} failed)")
+
     if not records:
         raise ValueError(
             f"No records collected. All {len(tickers)} tickers failed. "
@@ -109,9 +146,9 @@ def fetch_daily_data(
         )
 
     if failed_tickers:
-        print(f"\n[WARNING] Failed to fetch {len(failed_tickers)}/{len(tickers)} tickers:")
-        for tk in failed_tickers:
-            print(f"  - {tk}")
+        logger.warning(
+            f"Failed to fetch {len(failed_tickers)}/{len(tickers)} tickers: {', '.join(failed_tickers)}"
+        )
 
     # 最終的な日付を決定
     final_date = chosen_as_of or (as_of_d or datetime.now(timezone.utc).date())
@@ -186,6 +223,12 @@ def parse_args() -> argparse.Namespace:
         help="Path to config yaml file (環境変数: CONFIG_PATH)",
     )
 
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only log warnings and errors from the fetch loop",
+    )
+
     args = parser.parse_args()
 
     if not args.config:
@@ -198,6 +241,8 @@ def main() -> None:
     """メイン関数"""
     try:
         args = parse_args()
+        if args.quiet:
+            logger.setLevel(logging.WARNING)
         config_path = Path(args.config).resolve()
 
         if not config_path.exists():
@@ -232,6 +277,7 @@ def main() -> None:
         interval = str(yf_cfg.get("interval", "1d"))
         period = str(yf_cfg.get("period", "3d"))
         use_adj = bool(yf_cfg.get("use_adjclose", True))
+        parallel = int(yf_cfg.get("parallel", 16))
 
         fields = list(cfg.get("fields", ["open", "high", "low", "close", "adjclose", "volume"]))
 
@@ -244,7 +290,7 @@ def main() -> None:
         print(f"[INFO] Fetch parameters:")
         print(f"  as_of: {as_of_d or 'auto (latest)'}")
         print(f"  period: {period}, interval: {interval}")
-        print(f"  use_adjclose: {use_adj}")
+        print(f"  use_adjclose: {use_adj}, parallel: {parallel}")
         print(f"  fields: {', '.join(fields)}")
         print(f"  retry: {retry.times} times, sleep: {retry.sleep_seconds}s\n")
 
@@ -258,6 +304,7 @@ def main() -> None:
             use_adj=use_adj,
             fields=fields,
             retry=retry,
+            max_workers=parallel,
         )
 
         day_str = final_date.isoformat()
@@ -1,10 +1,16 @@
 # ml/src/data/utils/aggregate.py
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple
+import os
+import sqlite3
+import tempfile
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple
 import pandas as pd
 
-from .yfin import map_row_fields, normalize_history_index
+from .io import dumps_json, loads_json
+from .yfin import map_df_field_columns, normalize_history_index
 
 
 def build_by_date(
@@ -12,6 +18,7 @@ def build_by_date(
     df: pd.DataFrame,
     use_adj: bool,
     fields: List[str],
+    by_date: Optional[DefaultDict[str, List[Dict[str, Any]]]] = None,
 ) -> Tuple[Dict[str, List[Dict[str, Any]]], Optional[pd.Timestamp]]:
     """
     yfinance の history DataFrame から日付ごとのデータ構造を構築する
@@ -21,21 +28,93 @@ def build_by_date(
         df (pd.DataFrame): yfinance の history DataFrame
         use_adj (bool): 'close' フィールドに調整後終値を使用するかどうか
         fields (List[str]): 取得するフィールドのリスト
+        by_date (Optional[DefaultDict]): 追記先の日付ごとのデータ構造
+            （複数銘柄を1つに集約する場合に指定。None の場合は新規作成）
     Returns:
         Tuple[Dict[str, List[Dict[str, Any]]], Optional[pd.Timestamp]]:
-            - 日付ごとのデータ構造
+            - 日付ごとのデータ構造（by_date を指定した場合はそのもの）
             - 最新の日時（Timestamp）
     """
-    by_date: Dict[str, List[Dict[str, Any]]] = {}
-    latest_dt: Optional[pd.Timestamp] = None
+    if by_date is None:
+        by_date = defaultdict(list)
 
     dfi = normalize_history_index(df)
-    for idx, row in dfi.iterrows():
-        day_str = idx.date().isoformat()
+    if len(dfi) == 0:
+        return by_date, None
+
+    # 列ごとに Python 値のリストへ一括変換（map_row_fields と同じ変換規則）
+    values = map_df_field_columns(dfi, use_adj, fields)
+
+    day_strs = dfi.index.strftime("%Y-%m-%d")
+    columns = [values[f] for f in fields]
+    for day_str, row_values in zip(day_strs, zip(*columns)):
         rec: Dict[str, Any] = {"ticker": ticker}
-        rec.update(map_row_fields(row, use_adj, fields))
-        by_date.setdefault(day_str, []).append(rec)
-        if latest_dt is None or idx > latest_dt:
-            latest_dt = idx
+        rec.update(zip(fields, row_values))
+        by_date[day_str].append(rec)
+
+    # インデックスはソート済みのため末尾が最新
+    latest_dt = dfi.index[-1]
 
     return by_date, latest_dt
+
+
+class SqliteByDate(Mapping):
+    """
+    日付ごとのレコードを一時SQLiteファイルに保持する by_date 互換のストア
+
+    長期間・多銘柄のバックフィルで、全レコードを Python の dict として
+    メモリに保持しないために使用する。読み出しは日付単位で行われ、
+    同一日付内のレコードは追加順（= 銘柄の処理順）で返す。
+    """
+
+    def __init__(self, dir: Optional[str] = None) -> None:
+        fd, self.path = tempfile.mkstemp(prefix="by_date_", suffix=".sqlite", dir=dir)
+        os.close(fd)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("CREATE TABLE records (day TEXT NOT NULL, rec BLOB NOT NULL)")
+        self._conn.execute("CREATE INDEX idx_records_day ON records (day)")
+
+    def add(self, by_date: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        1銘柄分の日付ごとのレコードを追加する
+
+        Args:
+            by_date (Dict[str, List[Dict[str, Any]]]): build_by_date の結果
+        """
+        rows = (
+            (day_str, dumps_json(rec, indent=None))
+            for day_str, records in by_date.items()
+            for rec in records
+        )
+        with self._conn:
+            self._conn.executemany("INSERT INTO records (day, rec) VALUES (?, ?)", rows)
+
+    def __getitem__(self, day_str: str) -> List[Dict[str, Any]]:
+        cur = self._conn.execute(
+            "SELECT rec FROM records WHERE day = ? ORDER BY rowid", (day_str,)
+        )
+        records = [loads_json(rec) for (rec,) in cur]
+        if not records:
+            raise KeyError(day_str)
+        return records
+
+    def __iter__(self) -> Iterator[str]:
+        cur = self._conn.execute("SELECT DISTINCT day FROM records ORDER BY day")
+        return (day_str for (day_str,) in cur.fetchall())
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(DISTINCT day) FROM records").fetchone()[0]
+
+    def total_records(self) -> int:
+        """全レコード数を返す"""
+        return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def close(self) -> None:
+        """接続を閉じ、一時ファイルを削除する"""
+        self._conn.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
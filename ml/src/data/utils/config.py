@@ -6,6 +6,8 @@
 """
 from __future__ import annotations
 
+import copy
+import functools
 from dataclasses import dataclass
 from datetime import datetime, date
 from pathlib import Path
@@ -13,6 +15,12 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    # libyaml の C 実装（利用できない環境では純Python実装にフォールバック）
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 @dataclass(frozen=True)
 class RetryConfig:
@@ -20,16 +28,35 @@ class RetryConfig:
     sleep_seconds: float = 1.0
 
 
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    YAML ファイルをパースする（パスと更新時刻をキーにキャッシュ）
+
+    Args:
+        path_str (str): 読み込むファイルの絶対パス
+        mtime_ns (int): ファイルの更新時刻（ns）。変更時にキャッシュを無効化するためのキー
+    Returns:
+        Dict[str, Any]: 読み込んだ YAML データ
+    """
+    return yaml.load(Path(path_str).read_text(encoding="utf-8"), Loader=_Loader) or {}
+
+
 def load_yaml(path: Path) -> Dict[str, Any]:
     """
     YAML ファイルを読み込む
 
+    同じファイルの再読み込みはキャッシュから返す（ファイルが更新されていれば再パース）。
+    呼び出し側で変更できるよう、キャッシュのコピーを返す。
+
     Args:
         path (Path): 読み込むファイルのパス
     Returns:
         Dict[str, Any]: 読み込んだ YAML データ
     """
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    path = Path(path).resolve()
+    data = _load_yaml_cached(str(path), path.stat().st_mtime_ns)
+    return copy.deepcopy(data)
 
 
 def load_config(path: Path) -> Dict[str, Any]:
@@ -156,15 +183,27 @@ def download_universe_from_s3(bucket: str, key: str, local_path: Optional[Path]
 
     Returns:
         Path: ダウンロードしたファイルのローカルパス
+
+    Note:
+        ダウンロード時に ETag をサイドカーファイル（<name>.etag）へ保存し、
+        次回以降は head_object で ETag が一致すればダウンロードを省略する。
     """
-    import boto3
+    from .s3io import get_s3_client
 
     if local_path is None:
         filename = key.split("/")[-1]
         local_path = Path("/tmp") / filename
 
-    s3_client = boto3.client('s3')
+    s3_client = get_s3_client()
+    etag = s3_client.head_object(Bucket=bucket, Key=key)["ETag"]
+    etag_path = local_path.with_name(local_path.name + ".etag")
+
+    if local_path.exists() and etag_path.exists():
+        if etag_path.read_text(encoding="utf-8") == etag:
+            return local_path
+
     s3_client.download_file(bucket, key, str(local_path))
+    etag_path.write_text(etag, encoding="utf-8")
 
     return local_path
 
@@ -214,8 +253,8 @@ def upload_universe_to_s3(local_path: Path, bucket: str, key: str) -> None:
         bucket: S3バケット名
         key: S3キー
     """
-    import boto3
+    from .s3io import get_s3_client
 
-    s3_client = boto3.client('s3')
+    s3_client = get_s3_client()
     s3_client.upload_file(str(local_path), bucket, key)
     print(f"[INFO] Uploaded to s3://{bucket}/{key}")
@@ -7,12 +7,28 @@
 from __future__ import annotations
 
 import json
+import os
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 # =============================================================================
 # 定数定義
@@ -29,9 +45,39 @@ COLUMN_MAPPING = {
     "volume": "Volume",
 }
 
+# 日次JSONの価格フィールド（常に数値または null）
+PRICE_KEYS = ("open", "high", "low", "close", "adjclose")
+
 # 必須カラム
 REQUIRED_COLUMNS = ["Date", "Ticker", "Open", "High", "Low", "Close", "AdjClose", "Volume"]
 
+# S3からの並列読み込みワーカー数（I/Oバウンドのため CPU 数より多めに取る）
+# 共有S3クライアントの接続プール（s3io.get_s3_client: 64）を超えない範囲で設定する
+S3_READ_MAX_WORKERS = 32
+
+# zstd 圧縮した日次JSONの拡張子と圧縮レベル
+ZSTD_SUFFIX = ".zst"
+ZSTD_LEVEL = 3
+
+# 日次JSONの as_of / ファイル名の日付フォーマット
+DATE_FORMAT = "%Y-%m-%d"
+
+# 日次JSONファイルとして扱う拡張子（非圧縮 / zstd 圧縮）
+DAILY_JSON_SUFFIXES = (".json", ".json" + ZSTD_SUFFIX)
+
+# zstd の圧縮/展開コンテキストはスレッド間で共有できないためスレッドごとに保持する
+_ZSTD_LOCAL = threading.local()
+
+# 日次JSON本文の先頭にある as_of（"as_of": "YYYY-MM-DD"）
+_AS_OF_PATTERN = re.compile(rb'"as_of"\s*:\s*"([^"]*)"')
+
+# S3 Select が使えない（無効なアカウント・権限なし等）と分かった後は全件ダウンロードに切り替える
+_S3_SELECT_ENABLED = True
+# S3 Select を無効化するエラーコード（一時的なスロットリングや 5xx ではその呼び出しだけ全件読み込みにする）
+_S3_SELECT_UNSUPPORTED_CODES = frozenset({"MethodNotAllowed", "NotImplemented", "AccessDenied"})
+# as_of を探すために読む日次JSONの先頭バイト数（as_of は先頭のキー）
+_AS_OF_HEAD_BYTES = 1024
+
 
 def ensure_dir(p: Path) -> None:
     """
@@ -52,14 +98,216 @@ def ensure_dir(p: Path) -> None:
         raise OSError(f"Failed to create directory: {p}. Error: {e}") from e
 
 
-def write_json(path: Path, payload: Dict[str, Any], indent: int = 2) -> None:
+def dumps_json(payload: Dict[str, Any], indent: Optional[int] = 2) -> bytes:
+    """
+    JSON を UTF-8 バイト列にシリアライズする
+
+    orjson が利用可能で indent が 2 または None の場合は orjson を使用し、
+    それ以外は標準ライブラリの json にフォールバックする。
+
+    Args:
+        payload (Dict[str, Any]): シリアライズする JSON データ
+        indent (Optional[int]): JSONのインデント（None の場合は改行なし）
+
+    Returns:
+        bytes: UTF-8 エンコードされた JSON
+
+    Raises:
+        TypeError: payloadがJSON serializable でない場合
+    """
+    if orjson is not None and indent in (2, None):
+        # OPT_NON_STR_KEYS: 標準 json と同様に数値キーなどを文字列キーとして出力
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option)
+    return json.dumps(payload, ensure_ascii=False, indent=indent).encode("utf-8")
+
+
+def _require_zstandard() -> None:
+    """zstandard が利用できない場合に例外を発生させる"""
+    if zstandard is None:
+        raise RuntimeError(
+            "zstandard is not installed but zstd-compressed JSON is requested. "
+            "Install it with: pip install zstandard"
+        )
+
+
+def compress_zstd(data: bytes) -> bytes:
+    """
+    バイト列を zstd で圧縮する
+
+    Args:
+        data (bytes): 圧縮するデータ
+
+    Returns:
+        bytes: 圧縮後のデータ（フレームに元のサイズを含む）
+
+    Raises:
+        RuntimeError: zstandard がインストールされていない場合
+    """
+    _require_zstandard()
+    cctx = getattr(_ZSTD_LOCAL, "cctx", None)
+    if cctx is None:
+        cctx = _ZSTD_LOCAL.cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return cctx.compress(data)
+
+
+def decompress_zstd(data: bytes) -> bytes:
+    """
+    zstd で圧縮されたバイト列を展開する
+
+    Args:
+        data (bytes): 圧縮されたデータ
+
+    Returns:
+        bytes: 展開後のデータ
+
+    Raises:
+        RuntimeError: zstandard がインストールされていない場合
+    """
+    _require_zstandard()
+    dctx = getattr(_ZSTD_LOCAL, "dctx", None)
+    if dctx is None:
+        dctx = _ZSTD_LOCAL.dctx = zstandard.ZstdDecompressor()
+    return dctx.decompress(data)
+
+
+def loads_json(data: bytes, compressed: bool = False) -> Any:
+    """
+    JSON バイト列をパースする（orjson が利用可能な場合は orjson を使用）
+
+    Args:
+        data (bytes): JSON バイト列
+        compressed (bool): data が zstd 圧縮されているか
+
+    Returns:
+        Any: パース済みJSON
+    """
+    if compressed:
+        data = decompress_zstd(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json_file(path: Union[str, Path]) -> Any:
+    """
+    JSON ファイルを読み込む（拡張子が .zst の場合は zstd 展開してからパース）
+
+    Args:
+        path (Union[str, Path]): 読み込むファイルのパス
+
+    Returns:
+        Any: パース済みJSON
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return loads_json(data, compressed=str(path).endswith(ZSTD_SUFFIX))
+
+
+def daily_file_date(name: str) -> str:
+    """
+    日次JSONのファイル名（またはS3キー）から日付文字列を取り出す
+
+    Args:
+        name (str): ファイル名またはS3キー（例: "2025-12-18.json", "prefix/2025-12-18.json.zst"）
+
+    Returns:
+        str: 日付文字列（例: "2025-12-18"）
+    """
+    filename = name.rsplit("/", 1)[-1]
+    for suffix in reversed(DAILY_JSON_SUFFIXES):
+        if filename.endswith(suffix):
+            return filename[: -len(suffix)]
+    return filename
+
+
+def is_daily_json_name(name: str) -> bool:
+    """日次JSON（非圧縮 / zstd 圧縮）のファイル名かどうか（latest.json は除く）"""
+    return name.endswith(DAILY_JSON_SUFFIXES) and daily_file_date(name) != "latest"
+
+
+def _daily_sort_key(name: str) -> Tuple[str, bool]:
+    """日次JSONの並び順（日付順、同じ日付なら非圧縮の .json を先にする）"""
+    return daily_file_date(name), name.endswith(ZSTD_SUFFIX)
+
+
+def _dedupe_daily_by_date(files: List[Any]) -> List[Any]:
+    """
+    _daily_sort_key の順に並んだ日次ファイルから、同じ日付の2件目以降（.json があるときの .json.zst）を除く
+
+    Args:
+        files (List[Any]): 並び替え済みのファイルパスまたはS3キー
+
+    Returns:
+        List[Any]: 1日1ファイルに絞ったリスト
+    """
+    deduped = []
+    last_date = None
+    for f in files:
+        date = daily_file_date(f.name if isinstance(f, Path) else f)
+        if date != last_date:
+            deduped.append(f)
+            last_date = date
+    return deduped
+
+
+def list_local_daily_files(daily_data_dir: Path) -> List[Path]:
+    """
+    ローカルの日次JSONファイルを日付順に列挙する（latest.json は除外）
+
+    同じ日付の .json と .json.zst が両方ある場合（日次取得とバックフィルの出力先が同じ場合）は .json だけを返す。
+
+    Args:
+        daily_data_dir (Path): 日次データディレクトリ
+
+    Returns:
+        List[Path]: 日付順のファイルパス（1日1ファイル）
+    """
+    files = [f for f in daily_data_dir.iterdir() if is_daily_json_name(f.name)]
+    files.sort(key=lambda f: _daily_sort_key(f.name))
+    return _dedupe_daily_by_date(files)
+
+
+def _slice_by_date(files: List[Any], lo: str, hi: Optional[str]) -> List[Any]:
+    """
+    日付順に並んだ日次ファイルから lo <= 日付 <= hi の範囲を二分探索で切り出す
+
+    Args:
+        files (List[Any]): 日付順のファイルパスまたはS3キー
+        lo (str): 下限日付（YYYY-MM-DD、含む）
+        hi (Optional[str]): 上限日付（YYYY-MM-DD、含む。None の場合は上限なし）
+
+    Returns:
+        List[Any]: 範囲内のファイル
+    """
+    def file_date(f: Any) -> str:
+        return daily_file_date(f.name if isinstance(f, Path) else f)
+
+    start = bisect_left(files, lo, key=file_date)
+    stop = bisect_right(files, hi, lo=start, key=file_date) if hi else len(files)
+    return files[start:stop]
+
+
+def write_json(
+    path: Union[str, Path],
+    payload: Dict[str, Any],
+    indent: int = 2,
+    compress: bool = False,
+) -> None:
     """
     JSON ファイルを書き出す
 
+    一時ファイルに書いてから os.replace で置き換える。既存のパスがリンク（write_daily_payloads の
+    latest.json）でもリンク先のファイルを上書きせず、読み手に書きかけの内容を見せない。
+
     Args:
-        path (Path): 書き出すファイルのパス
+        path (Union[str, Path]): 書き出すファイルのパス
+            （大量のファイルを書く場合は Path を組み立てずに str を渡せる）
         payload (Dict[str, Any]): 書き出す JSON データ
         indent (int): JSONのインデント（デフォルト: 2）
+        compress (bool): zstd 圧縮して書き出すか（拡張子は呼び出し側で .json.zst とする）
 
     Returns:
         None
@@ -69,8 +317,19 @@ def write_json(path: Path, payload: Dict[str, Any], indent: int = 2) -> None:
         TypeError: payloadがJSON serializable でない場合
     """
     try:
-        content = json.dumps(payload, ensure_ascii=False, indent=indent)
-        path.write_text(content, encoding="utf-8")
+        data = dumps_json(payload, indent=indent)
+        if compress:
+            data = compress_zstd(data)
+        path = os.fspath(path)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.lexists(tmp_path):
+                os.unlink(tmp_path)
+            raise
     except TypeError as e:
         raise TypeError(f"Payload is not JSON serializable: {e}") from e
     except OSError as e:
@@ -81,6 +340,9 @@ def write_daily_payloads(outdir: Path, day_str: str, payload: Dict[str, Any]) ->
     """
     日付ごとの JSON ファイルと latest.json を書き出す
 
+    latest.json は日付ファイルへの相対シンボリックリンクとし、同じ内容を二重に書き出さない。
+    シンボリックリンクを作れない環境ではハードリンク、それも不可ならファイルとして書き出す。
+
     Args:
         outdir (Path): 書き出すディレクトリのパス
         day_str (str): 書き出す日付文字列（YYYY-MM-DD）
@@ -94,14 +356,329 @@ def write_daily_payloads(outdir: Path, day_str: str, payload: Dict[str, Any]) ->
         TypeError: payloadがJSON serializable でない場合
     """
     ensure_dir(outdir)
-    write_json(outdir / f"{day_str}.json", payload)
-    write_json(outdir / "latest.json", payload)
+    day_name = f"{day_str}.json"
+    write_json(outdir / day_name, payload)
+
+    # 一時名でリンクを作ってから置き換え、latest.json が存在しない瞬間を作らない
+    latest = outdir / "latest.json"
+    tmp_link = outdir / f".latest.json.{os.getpid()}.tmp"
+    try:
+        tmp_link.unlink(missing_ok=True)
+        try:
+            os.symlink(day_name, tmp_link)
+        except (OSError, NotImplementedError):
+            os.link(outdir / day_name, tmp_link)
+        os.replace(tmp_link, latest)
+    except OSError:
+        tmp_link.unlink(missing_ok=True)
+        write_json(latest, payload)
 
 
 # =============================================================================
 # 日次データ読み込み（統一インターフェース）
 # =============================================================================
 
+def _get_s3_read_client():
+    """
+    並列読み込み用のS3クライアントを取得する
+
+    呼び出しごとに生成せず、接続プールの大きい共有クライアント（s3io.get_s3_client）を使い回す。
+    """
+    from .s3io import get_s3_client
+
+    return get_s3_client()
+
+
+def _list_s3_json_keys(
+    s3_client,
+    bucket: str,
+    prefix: str,
+    sort: bool = True,
+) -> List[str]:
+    """
+    S3プレフィックス配下の日次JSONキー一覧を取得（latest.json は除外、.json.zst を含む）
+
+    同じ日付の .json と .json.zst が両方ある場合は .json だけを返す。
+
+    Args:
+        s3_client: boto3 S3クライアント
+        bucket: S3バケット名
+        prefix: S3プレフィックス
+        sort: キーをソートするか（list_objects_v2 は辞書順で返すため通常は不要）
+
+    Returns:
+        List[str]: S3オブジェクトキーのリスト（1日1キー）
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    keys = []
+
+    for page in paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        PaginationConfig={"PageSize": 1000},
+    ):
+        for obj in page.get("Contents", []):
+            key = obj["Key"]
+            if is_daily_json_name(key):
+                keys.append(key)
+
+    # 辞書順では同じ日付の "X.json" と "X.json.zst" は隣り合い、.json が先に来る
+    if sort:
+        keys.sort(key=_daily_sort_key)
+    return _dedupe_daily_by_date(keys)
+
+
+def _read_s3_body(s3_client, bucket: str, key: str) -> bytes:
+    """
+    S3上の日次JSONオブジェクトの本文を読み込む（キーが .zst で終わる場合は zstd 展開する）
+
+    Args:
+        s3_client: boto3 S3クライアント
+        bucket: S3バケット名
+        key: S3オブジェクトキー
+
+    Returns:
+        bytes: JSON 本文
+    """
+    body = s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+    if key.endswith(ZSTD_SUFFIX):
+        body = decompress_zstd(body)
+    return body
+
+
+def _read_s3_json(s3_client, bucket: str, key: str) -> Dict[str, Any]:
+    """
+    S3上のJSONオブジェクトを読み込む
+
+    orjson が利用可能な場合は bytes をそのままパースし、decode のコピーを省く。
+
+    Args:
+        s3_client: boto3 S3クライアント
+        bucket: S3バケット名
+        key: S3オブジェクトキー
+
+    Returns:
+        Dict: パース済みJSON
+    """
+    return loads_json(_read_s3_body(s3_client, bucket, key))
+
+
+def _read_s3_json_many(
+    s3_client,
+    bucket: str,
+    keys: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    複数のS3 JSONオブジェクトを並列に読み込む
+
+    Args:
+        s3_client: boto3 S3クライアント
+        bucket: S3バケット名
+        keys: S3オブジェクトキーのリスト
+
+    Returns:
+        List[Dict]: パース済みJSON（keys と同じ順序）
+    """
+    if not keys:
+        return []
+
+    max_workers = min(S3_READ_MAX_WORKERS, len(keys))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda key: _read_s3_json(s3_client, bucket, key), keys))
+
+
+def _select_s3_symbol(
+    s3_client,
+    bucket: str,
+    key: str,
+    ticker: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    S3 Select で日次JSONから指定銘柄のレコードだけを取得する（サーバー側で抽出）
+
+    Args:
+        s3_client: boto3 S3クライアント
+        bucket: S3バケット名
+        key: S3オブジェクトキー（非圧縮の .json）
+        ticker: 銘柄ティッカー
+
+    Returns:
+        Optional[Dict]: 銘柄のレコード（含まれない場合はNone）
+
+    Raises:
+        ClientError: S3 Select が利用できない場合
+    """
+    ticker_literal = ticker.replace("'", "''")
+    response = s3_client.select_object_content(
+        Bucket=bucket,
+        Key=key,
+        ExpressionType="SQL",
+        Expression=f"SELECT * FROM S3Object[*].symbols[*] s WHERE s.ticker = '{ticker_literal}'",
+        InputSerialization={"JSON": {"Type": "DOCUMENT"}},
+        OutputSerialization={"JSON": {}},
+    )
+    chunks = [
+        event["Records"]["Payload"] for event in response["Payload"] if "Records" in event
+    ]
+    # 出力は1レコード1行の JSON Lines
+    lines = b"".join(chunks).splitlines()
+    return loads_json(lines[0]) if lines else None
+
+
+def _read_s3_ticker_symbol(
+    s3_client,
+    bucket: str,
+    key: str,
+    ticker: str,
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    S3上の日次JSON 1件から指定銘柄の (日付, レコード) を取得する
+
+    非圧縮の .json は S3 Select で該当レコードのみ取得し、.json.zst や
+    S3 Select が使えない場合はオブジェクト全体を読み込んで探索する。
+    日付はどちらの場合も本文の as_of（なければファイル名の日付）を使う。
+
+    Args:
+        s3_client: boto3 S3クライアント
+        bucket: S3バケット名
+        key: S3オブジェクトキー
+        ticker: 銘柄ティッカー
+
+    Returns:
+        Optional[Tuple[str, Dict]]: (日付文字列, 銘柄のレコード)。含まれない場合はNone
+    """
+    global _S3_SELECT_ENABLED
+
+    if _S3_SELECT_ENABLED and not key.endswith(ZSTD_SUFFIX):
+        from botocore.exceptions import ClientError
+
+        try:
+            symbol = _select_s3_symbol(s3_client, bucket, key, ticker)
+            if symbol is None:
+                return None
+            # 日付は全件読み込みの場合と同じく本文の as_of を使う（先頭だけをレンジ取得）
+            head = s3_client.get_object(
+                Bucket=bucket, Key=key, Range=f"bytes=0-{_AS_OF_HEAD_BYTES - 1}"
+            )["Body"].read()
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in _S3_SELECT_UNSUPPORTED_CODES:
+                _S3_SELECT_ENABLED = False
+        else:
+            match = _AS_OF_PATTERN.search(head)
+            if match and match.group(1):
+                return match.group(1).decode("utf-8"), symbol
+
+    return _find_ticker_symbol(_read_s3_body(s3_client, bucket, key), ticker, key)
+
+
+def _find_ticker_symbol(
+    raw: bytes,
+    ticker: str,
+    name: str,
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    日次JSONの本文から指定銘柄の (日付, レコード) を取り出す
+
+    銘柄の各レコードは入れ子のないオブジェクトなので、ティッカー文字列の位置から
+    前後の波括弧までを切り出してそのレコードだけをパースする（他銘柄は dict 化しない）。
+    ティッカー文字列を含まない本文はパースせずに None を返し、含むのに切り出しで
+    見つからない場合のみ全体をパースして探索する。
+
+    Args:
+        raw: 日次JSONの本文（展開済み）
+        ticker: 銘柄ティッカー
+        name: ファイル名またはS3キー（as_of がない場合の日付に使用）
+
+    Returns:
+        Optional[Tuple[str, Dict]]: (日付文字列, 銘柄のレコード)。含まれない場合はNone
+    """
+    # ティッカー文字列を含まないファイルは一致しえないためパースしない
+    # （dumps_json は非ASCII文字をエスケープせず UTF-8 で書き出す）
+    if ticker.encode("utf-8") not in raw:
+        return None
+
+    # JSON 上の表記（"7203.T"）で本文を探す
+    needle = json.dumps(ticker, ensure_ascii=False).encode("utf-8")
+    pos = raw.find(needle)
+    while pos != -1:
+        start = raw.rfind(b"{", 0, pos)
+        end = raw.find(b"}", pos)
+        if start != -1 and end != -1:
+            try:
+                symbol = loads_json(raw[start : end + 1])
+            except ValueError:
+                symbol = None
+            if isinstance(symbol, dict) and symbol.get("ticker") == ticker:
+                match = _AS_OF_PATTERN.search(raw)
+                as_of_date = match.group(1).decode("utf-8") if match else ""
+                return as_of_date or daily_file_date(name), symbol
+        pos = raw.find(needle, pos + 1)
+
+    daily_data = loads_json(raw)
+    as_of_date = daily_data.get("as_of") or daily_file_date(name)
+    for symbol in daily_data.get("symbols", []):
+        if symbol.get("ticker") == ticker:
+            return as_of_date, symbol
+    return None
+
+
+def _new_symbol_columns() -> Dict[str, List[Any]]:
+    """
+    日次データの列ごとのリストを作成する
+
+    列名は COLUMN_MAPPING の変換後の名前。日付は行ごとには持たず、ファイルごとの
+    日付（"Date"）と行数（"DateCount"）を記録して DataFrame 化の際に展開する。
+    """
+    return {name: [] for name in (*COLUMN_MAPPING.values(), "Date", "DateCount")}
+
+
+def _append_symbol_columns(
+    columns: Dict[str, List[Any]],
+    present_keys: set,
+    date_str: str,
+    symbols: List[Dict[str, Any]],
+) -> None:
+    """
+    1日分の symbols を列ごとのリストに追記する
+
+    1ファイル分の列をすべて組み立ててから追記するため、途中で例外が発生しても
+    各列の長さは揃ったままになる。
+
+    Args:
+        columns: _new_symbol_columns で作成した列ごとのリスト
+        present_keys: 出現した JSON キーの集合（同じファイル内の銘柄は同じキーを持つため先頭のみ確認）
+        date_str: 日付文字列
+        symbols: 日次JSONの symbols
+    """
+    file_columns = {dst: [sym.get(src) for sym in symbols] for src, dst in COLUMN_MAPPING.items()}
+    if symbols:
+        present_keys.update(symbols[0].keys())
+    for name, values in file_columns.items():
+        columns[name].extend(values)
+    columns["Date"].append(date_str)
+    columns["DateCount"].append(len(symbols))
+
+
+def _frame_from_symbol_columns(columns: Dict[str, List[Any]], present_keys: set) -> pd.DataFrame:
+    """
+    列ごとのリストから DataFrame を組み立てる（行ごとの dict を経由しない）
+
+    Args:
+        columns: _append_symbol_columns で追記した列ごとのリスト
+        present_keys: 出現した JSON キーの集合（一度も出現しなかった列は含めない）
+
+    Returns:
+        DataFrame: 日次データ
+    """
+    data: Dict[str, Any] = {
+        dst: columns[dst] for src, dst in COLUMN_MAPPING.items() if src in present_keys
+    }
+    # 日付はファイルごとに1回だけパースし、行数分に展開する
+    file_dates = pd.to_datetime(columns["Date"], format=DATE_FORMAT)
+    data["Date"] = file_dates.repeat(columns["DateCount"])
+    return pd.DataFrame(data)
+
+
 def load_daily_data_from_local(
     daily_data_dir: Path,
     lookback_days: Optional[int] = None,
@@ -118,8 +695,7 @@ def load_daily_data_from_local(
     Returns:
         DataFrame: 日次データ（Ticker, Dateでソート済み）
     """
-    json_files = sorted(daily_data_dir.glob("*.json"))
-    json_files = [f for f in json_files if f.name != "latest.json"]
+    json_files = list_local_daily_files(daily_data_dir)
 
     if not json_files:
         raise ValueError(f"No JSON files found in {daily_data_dir}")
@@ -133,27 +709,18 @@ def load_daily_data_from_local(
         cutoff_date = ref_date - timedelta(days=lookback_days)
         cutoff_str = cutoff_date.strftime("%Y-%m-%d")
 
-        filtered_files = []
-        for f in json_files:
-            try:
-                file_date = f.stem  # "YYYY-MM-DD"
-                if file_date >= cutoff_str:
-                    if as_of_date is None or file_date <= as_of_date:
-                        filtered_files.append(f)
-            except Exception:
-                continue
-        json_files = filtered_files
+        json_files = _slice_by_date(json_files, cutoff_str, as_of_date)
 
     if not json_files:
         raise ValueError(f"No JSON files found after filtering in {daily_data_dir}")
 
-    # データ読み込み
-    records = []
+    # データ読み込み（列ごとのリストに追記し、最後に1回だけ DataFrame 化する）
+    columns = _new_symbol_columns()
+    present_keys: set = set()
     errors = []
     for json_file in json_files:
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_file(json_file)
 
             date_str = data.get("as_of")
             if not date_str:
@@ -165,9 +732,7 @@ def load_daily_data_from_local(
                 errors.append(f"{json_file.name}: no symbols data")
                 continue
 
-            for sym in symbols:
-                sym["Date"] = date_str
-                records.append(sym)
+            _append_symbol_columns(columns, present_keys, date_str, symbols)
         except json.JSONDecodeError as e:
             errors.append(f"{json_file.name}: JSON parse error - {e}")
             continue
@@ -181,11 +746,8 @@ def load_daily_data_from_local(
         for err in errors:
             logger.warning(f"Data loading warning: {err}")
 
-    df = pd.DataFrame(records)
-    df["Date"] = pd.to_datetime(df["Date"])
-
-    # カラム名を標準化
-    df = df.rename(columns=COLUMN_MAPPING)
+    # カラム名は標準化済み（COLUMN_MAPPING）
+    df = _frame_from_symbol_columns(columns, present_keys)
 
     # 必須カラムの確認
     missing_cols = set(REQUIRED_COLUMNS) - set(df.columns)
@@ -213,21 +775,10 @@ def load_daily_data_from_s3(
     Returns:
         DataFrame: 日次データ
     """
-    import boto3
-
-    s3_client = boto3.client("s3")
-
-    # S3からファイル一覧を取得
-    paginator = s3_client.get_paginator("list_objects_v2")
-    json_files = []
-
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-        for obj in page.get("Contents", []):
-            key = obj["Key"]
-            if key.endswith(".json") and not key.endswith("latest.json"):
-                json_files.append(key)
+    s3_client = _get_s3_read_client()
 
-    json_files.sort()
+    # S3からファイル一覧を取得（list_objects_v2 はキーの辞書順で返す）
+    json_files = _list_s3_json_keys(s3_client, bucket, prefix, sort=False)
 
     if not json_files:
         raise ValueError(f"No JSON files found in s3://{bucket}/{prefix}")
@@ -241,38 +792,64 @@ def load_daily_data_from_s3(
         cutoff_date = ref_date - timedelta(days=lookback_days)
         cutoff_str = cutoff_date.strftime("%Y-%m-%d")
 
-        filtered_files = []
-        for key in json_files:
-            try:
-                filename = key.split("/")[-1]
-                file_date = filename.replace(".json", "")
-                if file_date >= cutoff_str:
-                    if as_of_date is None or file_date <= as_of_date:
-                        filtered_files.append(key)
-            except Exception:
-                continue
-        json_files = filtered_files
-
-    # データ読み込み
-    records = []
-    for key in json_files:
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        data = json.loads(response["Body"].read().decode("utf-8"))
+        json_files = _slice_by_date(json_files, cutoff_str, as_of_date)
 
+    # データ読み込み（列ごとのリストに追記し、最後に1回だけ DataFrame 化する）
+    columns = _new_symbol_columns()
+    present_keys: set = set()
+    for data in _read_s3_json_many(s3_client, bucket, json_files):
         date_str = data.get("as_of")
         symbols = data.get("symbols", [])
+        _append_symbol_columns(columns, present_keys, date_str, symbols)
 
-        for sym in symbols:
-            sym["Date"] = date_str
-            records.append(sym)
+    # カラム名は標準化済み（COLUMN_MAPPING）
+    df = _frame_from_symbol_columns(columns, present_keys)
 
-    df = pd.DataFrame(records)
-    df["Date"] = pd.to_datetime(df["Date"])
+    return df.sort_values(["Ticker", "Date"]).reset_index(drop=True)
 
-    # カラム名を標準化
-    df = df.rename(columns=COLUMN_MAPPING)
 
-    return df.sort_values(["Ticker", "Date"]).reset_index(drop=True)
+def daily_data_version_s3(bucket: str, prefix: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    S3上の日次JSONの版を取得する（本文は読まず、一覧のキーと ETag だけを見る）
+
+    ファイルの追加・上書き・削除のいずれでも値が変わるため、読み込み結果のキャッシュキーに使える。
+
+    Args:
+        bucket: S3バケット名
+        prefix: S3プレフィックス
+
+    Returns:
+        Tuple[Tuple[str, str], ...]: (キー, ETag) のタプル（キーの辞書順）
+    """
+    s3_client = _get_s3_read_client()
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return tuple(
+        (obj["Key"], obj["ETag"])
+        for page in paginator.paginate(
+            Bucket=bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": 1000},
+        )
+        for obj in page.get("Contents", [])
+        if is_daily_json_name(obj["Key"])
+    )
+
+
+def daily_data_version_local(daily_data_dir: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    ローカルの日次JSONの版を取得する（本文は読まず、ファイル名・更新時刻・サイズだけを見る）
+
+    Args:
+        daily_data_dir: 日次データディレクトリ
+
+    Returns:
+        Tuple[Tuple[str, int, int], ...]: (ファイル名, mtime_ns, サイズ) のタプル（日付順）
+    """
+    versions = []
+    for f in list_local_daily_files(daily_data_dir):
+        st = f.stat()
+        versions.append((f.name, st.st_mtime_ns, st.st_size))
+    return tuple(versions)
 
 
 def load_daily_data(
@@ -336,51 +913,63 @@ def load_daily_data_for_ticker(
         return _load_daily_data_for_ticker_from_local(Path(daily_data_path), ticker)
 
 
+def _ticker_frame(ticker: str, dates: List[str], symbols: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    1銘柄分の日次データを列ごとに組み立てて DataFrame にする（日付順）
+
+    Args:
+        ticker: 銘柄ティッカー
+        dates: 日付文字列のリスト
+        symbols: 各日付の対象銘柄のデータ（dates と同じ順序）
+
+    Returns:
+        DataFrame: Date, Ticker, Open, High, Low, Close, AdjClose, Volume
+    """
+    data: Dict[str, Any] = {
+        "Date": pd.to_datetime(dates, format=DATE_FORMAT, cache=True),
+        "Ticker": [ticker] * len(dates),
+    }
+    for src, dst in COLUMN_MAPPING.items():
+        if src in PRICE_KEYS:
+            # 価格は float64 の配列として直接作る（欠損の None は NaN になる）
+            data[dst] = np.array([sym.get(src) for sym in symbols], dtype=np.float64)
+        elif src != "ticker":
+            data[dst] = [sym.get(src) for sym in symbols]
+
+    df = pd.DataFrame(data)
+    # 日次ファイルは日付順に読み込んでいるため、通常はソート不要
+    if not df["Date"].is_monotonic_increasing:
+        df.sort_values("Date", inplace=True)
+        df.reset_index(drop=True, inplace=True)
+    return df
+
+
 def _load_daily_data_for_ticker_from_local(
     daily_data_dir: Path,
     ticker: str,
 ) -> pd.DataFrame:
     """ローカルから指定銘柄の日次データを読み込む"""
-    json_files = sorted(daily_data_dir.glob("*.json"))
-    json_files = [f for f in json_files if f.name != "latest.json"]
+    json_files = list_local_daily_files(daily_data_dir)
 
     if not json_files:
         raise FileNotFoundError(f"No daily data files found in: {daily_data_dir}")
 
-    records = []
+    dates: List[str] = []
+    matched: List[Dict[str, Any]] = []
     for json_path in json_files:
-        with open(json_path, "r", encoding="utf-8") as f:
-            daily_data = json.load(f)
-
-        as_of_date = daily_data.get("as_of")
-        if not as_of_date:
-            as_of_date = json_path.stem
-
-        symbols = daily_data.get("symbols", [])
-        for symbol in symbols:
-            if symbol.get("ticker") == ticker:
-                record = {
-                    "Date": as_of_date,
-                    "Ticker": ticker,
-                    "Open": symbol.get("open"),
-                    "High": symbol.get("high"),
-                    "Low": symbol.get("low"),
-                    "Close": symbol.get("close"),
-                    "AdjClose": symbol.get("adjclose"),
-                    "Volume": symbol.get("volume"),
-                }
-                records.append(record)
-                break
-
-    if not records:
-        raise ValueError(f"No data found for ticker: {ticker}")
+        raw = json_path.read_bytes()
+        if json_path.name.endswith(ZSTD_SUFFIX):
+            raw = decompress_zstd(raw)
+        found = _find_ticker_symbol(raw, ticker, json_path.name)
+        if found is None:
+            continue
+        dates.append(found[0])
+        matched.append(found[1])
 
-    df = pd.DataFrame(records)
-    df["Date"] = pd.to_datetime(df["Date"])
-    df.sort_values("Date", inplace=True)
-    df.reset_index(drop=True, inplace=True)
+    if not matched:
+        raise ValueError(f"No data found for ticker: {ticker}")
 
-    return df
+    return _ticker_frame(ticker, dates, matched)
 
 
 def _load_daily_data_for_ticker_from_s3(
@@ -388,8 +977,6 @@ def _load_daily_data_for_ticker_from_s3(
     ticker: str,
 ) -> pd.DataFrame:
     """S3から指定銘柄の日次データを読み込む"""
-    import boto3
-
     # Parse S3 URI
     if not s3_uri.startswith("s3://"):
         raise ValueError(f"Invalid S3 URI: {s3_uri}")
@@ -398,55 +985,32 @@ def _load_daily_data_for_ticker_from_s3(
     bucket = parts[0]
     prefix = parts[1] if len(parts) > 1 else ""
 
-    s3_client = boto3.client("s3")
+    s3_client = _get_s3_read_client()
 
-    # S3からファイル一覧を取得
-    paginator = s3_client.get_paginator("list_objects_v2")
-    json_keys = []
-
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-        for obj in page.get("Contents", []):
-            key = obj["Key"]
-            if key.endswith(".json") and not key.endswith("latest.json"):
-                json_keys.append(key)
-
-    json_keys.sort()
+    # S3からファイル一覧を取得（list_objects_v2 はキーの辞書順で返す）
+    json_keys = _list_s3_json_keys(s3_client, bucket, prefix, sort=False)
 
     if not json_keys:
         raise FileNotFoundError(f"No daily data files found in: {s3_uri}")
 
-    records = []
-    for key in json_keys:
-        response = s3_client.get_object(Bucket=bucket, Key=key)
-        daily_data = json.loads(response["Body"].read().decode("utf-8"))
-
-        as_of_date = daily_data.get("as_of")
-        if not as_of_date:
-            filename = key.split("/")[-1]
-            as_of_date = filename.replace(".json", "")
-
-        symbols = daily_data.get("symbols", [])
-        for symbol in symbols:
-            if symbol.get("ticker") == ticker:
-                record = {
-                    "Date": as_of_date,
-                    "Ticker": ticker,
-                    "Open": symbol.get("open"),
-                    "High": symbol.get("high"),
-                    "Low": symbol.get("low"),
-                    "Close": symbol.get("close"),
-                    "AdjClose": symbol.get("adjclose"),
-                    "Volume": symbol.get("volume"),
-                }
-                records.append(record)
-                break
-
-    if not records:
-        raise ValueError(f"No data found for ticker: {ticker} in {s3_uri}")
+    # 各オブジェクトから対象銘柄のレコードだけを並列に取り出す
+    max_workers = min(S3_READ_MAX_WORKERS, len(json_keys))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        found = list(
+            executor.map(
+                lambda key: _read_s3_ticker_symbol(s3_client, bucket, key, ticker), json_keys
+            )
+        )
 
-    df = pd.DataFrame(records)
-    df["Date"] = pd.to_datetime(df["Date"])
-    df.sort_values("Date", inplace=True)
-    df.reset_index(drop=True, inplace=True)
+    dates: List[str] = []
+    matched: List[Dict[str, Any]] = []
+    for item in found:
+        if item is None:
+            continue
+        dates.append(item[0])
+        matched.append(item[1])
 
-    return df
+    if not matched:
+        raise ValueError(f"No data found for ticker: {ticker} in {s3_uri}")
+
+    return _ticker_frame(ticker, dates, matched)
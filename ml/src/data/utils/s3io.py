@@ -1,8 +1,8 @@
 # ml/src/data/utils/s3io.py
 from __future__ import annotations
 
-import json
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Optional
 
 try:
     import boto3
@@ -12,8 +12,57 @@ except ImportError:
     BotoCoreError = None
     ClientError = None
 
+from .io import compress_zstd, dumps_json
 
-def put_json(bucket: str, key: str, payload: Dict[str, Any], indent: int = 2) -> None:
+# 共有 S3 クライアント（get_s3_client で遅延生成）
+_S3_CLIENT = None
+_S3_CLIENT_LOCK = threading.Lock()
+
+
+def get_s3_client() -> Any:
+    """
+    共有 S3 クライアントを取得する（初回呼び出し時のみ生成）
+
+    接続プールを大きめに取り、並列アップロード時も同じ接続を再利用する。
+    boto3 クライアントはスレッドセーフなため、複数スレッドから共有してよい。
+
+    Returns:
+        boto3 S3 クライアント
+
+    Raises:
+        RuntimeError: boto3がインストールされていない場合
+    """
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        if boto3 is None:
+            raise RuntimeError(
+                "boto3 is not installed but S3 output is enabled. "
+                "Install it with: pip install boto3"
+            )
+
+        from botocore.config import Config
+
+        with _S3_CLIENT_LOCK:
+            if _S3_CLIENT is None:
+                _S3_CLIENT = boto3.session.Session().client(
+                    "s3",
+                    config=Config(
+                        max_pool_connections=64,
+                        retries={"max_attempts": 5, "mode": "adaptive"},
+                        tcp_keepalive=True,
+                    ),
+                )
+    return _S3_CLIENT
+
+
+def put_json(
+    bucket: str,
+    key: str,
+    payload: Dict[str, Any],
+    indent: int = 2,
+    s3_client: Optional[Any] = None,
+    compress: bool = False,
+) -> None:
     """
     S3 に JSON ファイルを書き出す
 
@@ -22,6 +71,8 @@ def put_json(bucket: str, key: str, payload: Dict[str, Any], indent: int = 2) ->
         key (str): S3 オブジェクトキー
         payload (Dict[str, Any]): 書き出す JSON データ
         indent (int): JSONのインデント（デフォルト: 2）
+        s3_client (Optional[Any]): 使用する boto3 S3 クライアント（None の場合は共有クライアント）
+        compress (bool): zstd 圧縮してアップロードするか（キーは呼び出し側で .json.zst とする）
 
     Returns:
         None
@@ -37,13 +88,18 @@ def put_json(bucket: str, key: str, payload: Dict[str, Any], indent: int = 2) ->
         )
 
     try:
-        s3 = boto3.client("s3")
-        body = json.dumps(payload, ensure_ascii=False, indent=indent).encode("utf-8")
+        s3 = s3_client if s3_client is not None else get_s3_client()
+        body = dumps_json(payload, indent=indent)
+        extra_args: Dict[str, str] = {}
+        if compress:
+            body = compress_zstd(body)
+            extra_args["ContentEncoding"] = "zstd"
         s3.put_object(
             Bucket=bucket,
             Key=key,
             Body=body,
             ContentType="application/json; charset=utf-8",
+            **extra_args,
         )
     except (BotoCoreError, ClientError) as e:
         raise RuntimeError(
@@ -2,24 +2,43 @@
 Universe YAML ローダーの統一モジュール
 """
 
+import os
+import pickle
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 import yaml
 
+from common.error_handler import is_tmp_path
+
+try:
+    # libyaml の C 実装（利用できない環境では純Python実装にフォールバック）
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 # デフォルトのセクターYAMLパス（config/sectors.yaml）
 DEFAULT_SECTORS_YAML = Path(__file__).parent.parent.parent.parent / "config" / "sectors.yaml"
 
+# load_universe_data のパース結果キャッシュ（<name>.yaml.pkl）の拡張子
+UNIVERSE_CACHE_SUFFIX = ".pkl"
+
 
-def load_sector_mapping(sectors_yaml_path: Optional[Path] = None) -> Dict[str, int]:
+def load_sector_mapping(sectors_yaml_path: Optional[Path] = None) -> Mapping[str, int]:
     """
     セクター定義YAMLを読み込み、セクター名からIDへのマッピングを返す
 
+    結果は解決済みの絶対パスごとにキャッシュされる（同一プロセス内の2回目以降は再パースしない）。
+    キャッシュを共有するため読み取り専用のマッピングを返す。変更・JSON化が必要な場合は dict() で複製すること。
+
     Args:
         sectors_yaml_path: セクター定義YAMLのパス（Noneの場合はデフォルト）
 
     Returns:
-        Dict[str, int]: セクター名 -> セクターID のマッピング
+        Mapping[str, int]: セクター名 -> セクターID のマッピング（読み取り専用）
 
     Example:
         >>> mapping = load_sector_mapping()
@@ -31,13 +50,27 @@ def load_sector_mapping(sectors_yaml_path: Optional[Path] = None) -> Dict[str, i
     if sectors_yaml_path is None:
         sectors_yaml_path = DEFAULT_SECTORS_YAML
 
-    sectors_yaml_path = Path(sectors_yaml_path)
+    return _load_sector_mapping_cached(str(Path(sectors_yaml_path).resolve()))
+
+
+@lru_cache(maxsize=8)
+def _load_sector_mapping_cached(path_str: str) -> Mapping[str, int]:
+    """
+    load_sector_mapping の実体（解決済みパス文字列をキーにキャッシュ）
+
+    Args:
+        path_str: セクター定義YAMLの絶対パス
+
+    Returns:
+        Mapping[str, int]: セクター名 -> セクターID の読み取り専用マッピング
+    """
+    sectors_yaml_path = Path(path_str)
 
     if not sectors_yaml_path.exists():
         raise FileNotFoundError(f"Sectors YAML not found: {sectors_yaml_path}")
 
     with open(sectors_yaml_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
 
     sectors = data.get("sectors", [])
 
@@ -48,10 +81,10 @@ def load_sector_mapping(sectors_yaml_path: Optional[Path] = None) -> Dict[str, i
         if name is not None and sector_id is not None:
             mapping[name] = sector_id
 
-    return mapping
+    return MappingProxyType(mapping)
 
 
-def get_sector_id(sector_name: str, sector_mapping: Dict[str, int]) -> int:
+def get_sector_id(sector_name: str, sector_mapping: Mapping[str, int]) -> int:
     """
     セクター名からセクターIDを取得
 
@@ -94,8 +127,36 @@ def load_universe_data(yaml_path: Path) -> Dict[str, Any]:
     if not yaml_path.exists():
         raise FileNotFoundError(f"Universe YAML not found: {yaml_path}")
 
+    # /tmp（S3からダウンロードしたYAMLの置き場所）は誰でも書き込めるため、
+    # 第三者が置いた pickle を読み込まないよう sidecar キャッシュを使わない
+    if is_tmp_path(yaml_path):
+        return _parse_universe_yaml(yaml_path)
+
+    # YAML の mtime とサイズが変わっていなければ pickle キャッシュを使う
+    yaml_stat = yaml_path.stat()
+    sig = (yaml_stat.st_mtime_ns, yaml_stat.st_size)
+    cache_path = yaml_path.with_name(yaml_path.name + UNIVERSE_CACHE_SUFFIX)
+    cached = _read_universe_cache(cache_path, sig)
+    if cached is not None:
+        return cached
+
+    result = _parse_universe_yaml(yaml_path)
+    _write_universe_cache(cache_path, sig, result)
+    return result
+
+
+def _parse_universe_yaml(yaml_path: Path) -> Dict[str, Any]:
+    """
+    Universe YAMLをパースして統一フォーマットに変換する（load_universe_data の実体）
+
+    Args:
+        yaml_path: Universe YAMLファイルのパス
+
+    Returns:
+        Dict[str, Any]: load_universe_data と同じ形式
+    """
     with open(yaml_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_Loader)
 
     # Handle both formats: 'tickers' or 'universe' key
     if "universe" in data:
@@ -128,6 +189,55 @@ def load_universe_data(yaml_path: Path) -> Dict[str, Any]:
     }
 
 
+def _read_universe_cache(cache_path: Path, sig: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """
+    Universe のキャッシュを読み込む
+
+    Args:
+        cache_path: キャッシュファイルのパス
+        sig: YAML の (mtime_ns, size)
+
+    Returns:
+        Optional[Dict[str, Any]]: キャッシュが有効ならパース結果、無効・読めない場合はNone
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            # 自分以外が所有する、またはグループ・他ユーザーが書き込めるファイルは unpickle しない
+            st = os.fstat(f.fileno())
+            if st.st_uid != os.getuid() or st.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+                return None
+            cached_sig, result = pickle.load(f)
+    except Exception:
+        return None
+    if tuple(cached_sig) != sig:
+        return None
+    return result
+
+
+def _write_universe_cache(cache_path: Path, sig: Tuple[int, int], result: Dict[str, Any]) -> None:
+    """
+    Universe のキャッシュを書き出す（一時ファイル経由で置き換え、失敗しても無視）
+
+    Args:
+        cache_path: キャッシュファイルのパス
+        sig: YAML の (mtime_ns, size)
+        result: パース結果
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((sig, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        # 読み込み時の権限チェック（グループ・他ユーザー書き込み不可）を満たすようにする
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # 読み取り専用ディレクトリなどではキャッシュなしで続行
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 def get_tickers_from_universe_yaml(yaml_path: Path) -> List[str]:
     """
     Universe YAMLからティッカーリストを取得（後方互換性のため）
@@ -2,16 +2,34 @@
 
 from __future__ import annotations
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import pandas as pd
 import yfinance as yf
 
+# yf.download 1回あたりの銘柄数（リクエストURL長の制限を考慮）
+YF_BATCH_SIZE = 20
+
+# fields 名 → yfinance の列名
+FIELD_COLUMNS: Dict[str, str] = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "adjclose": "Adj Close",
+    "volume": "Volume",
+}
+
 
 def safe_history(ticker: str, period: str, interval: str, retry: int, sleep_s: float) -> pd.DataFrame:
     """
     yfinance の history() を retry 付きで呼ぶ
 
+    複数銘柄を取得する場合は safe_history_batch を使用する。
+    yf.download は結果をモジュール全体で共有する領域に書き込むため、
+    スレッドプールから並列に呼ばれる本関数では yf.Ticker(...).history() を使う。
+
     Args:
         ticker (str): 株式のティッカーシンボル
         period (str): データ取得期間
@@ -46,21 +64,215 @@ def safe_history(ticker: str, period: str, interval: str, retry: int, sleep_s: f
         f"Last error: {last_err}"
     )
 
+def _split_download_frame(df: pd.DataFrame, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    yf.download(group_by="ticker") の結果を銘柄ごとの DataFrame に分割する
+
+    Args:
+        df (pd.DataFrame): yf.download の結果（列は (ticker, field) の MultiIndex）
+        tickers (List[str]): リクエストしたティッカーのリスト
+    Returns:
+        Dict[str, pd.DataFrame]: ティッカー -> 株価データ（データのない銘柄は含まない）
+    """
+    out: Dict[str, pd.DataFrame] = {}
+    if not isinstance(df.columns, pd.MultiIndex):
+        # 単一銘柄の場合はフラットな列で返ることがある
+        frames = {tickers[0]: df} if len(tickers) == 1 else {}
+    else:
+        available = set(df.columns.get_level_values(0))
+        frames = {tk: df[tk] for tk in tickers if tk in available}
+
+    for tk, sub in frames.items():
+        # 日付は全銘柄で揃えられるため、その銘柄にデータのない行（全列NaN）を落とす
+        sub = sub.dropna(how="all")
+        if not sub.empty:
+            out[tk] = sub
+    return out
+
+
+def safe_history_batch(
+    tickers: List[str],
+    period: str,
+    interval: str,
+    retry: int,
+    sleep_s: float,
+    batch_size: int = YF_BATCH_SIZE,
+) -> Dict[str, pd.DataFrame]:
+    """
+    yf.download で複数銘柄の history をまとめて取得する（バッチごとに retry 付き）
+
+    Args:
+        tickers (List[str]): ティッカーシンボルのリスト
+        period (str): データ取得期間
+        interval (str): 取得間隔
+        retry (int): リトライ回数
+        sleep_s (float): リトライ間の待機時間（秒）
+        batch_size (int): 1リクエストあたりの銘柄数
+    Returns:
+        Dict[str, pd.DataFrame]: ティッカー -> 株価データ
+            （取得できなかった銘柄は含まないため、呼び出し側で個別取得などを行う）
+    """
+    retry_count = max(1, retry)
+    out: Dict[str, pd.DataFrame] = {}
+
+    for start in range(0, len(tickers), batch_size):
+        batch = list(tickers[start:start + batch_size])
+        for attempt in range(retry_count):
+            try:
+                df = yf.download(
+                    tickers=batch,
+                    period=period,
+                    interval=interval,
+                    group_by="ticker",
+                    auto_adjust=False,
+                    threads=True,
+                    progress=False,
+                )
+                if not df.empty:
+                    out.update(_split_download_frame(df, batch))
+                    break
+            except Exception:
+                pass
+
+            # 最後の試行では sleep しない
+            if attempt < retry_count - 1:
+                time.sleep(sleep_s)
+
+    return out
+
+def safe_history_many(
+    tickers: List[str],
+    period: str,
+    interval: str,
+    retry: int,
+    sleep_s: float,
+    max_workers: int = 16,
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+    """
+    複数銘柄の history を個別に並列取得する（retry はラウンド単位で指数バックオフ）
+
+    各ラウンドでは未取得の銘柄をスレッドプールで1回ずつ取得し、失敗した銘柄だけを
+    sleep_s * 2**(ラウンド数-1) 秒待ってから次のラウンドでまとめて再取得する。
+    ワーカースレッドがリトライ待ちの sleep でプールを占有しない。
+
+    Args:
+        tickers (List[str]): ティッカーシンボルのリスト
+        period (str): データ取得期間
+        interval (str): 取得間隔
+        retry (int): 1銘柄あたりの最大試行回数
+        sleep_s (float): 最初のリトライまでの待機時間（秒）
+        max_workers (int): 並列ワーカー数
+    Returns:
+        Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+            - ティッカー -> 株価データ（取得できた銘柄）
+            - ティッカー -> 最後のエラーメッセージ（すべての試行が失敗した銘柄）
+    """
+    fetched: Dict[str, pd.DataFrame] = {}
+    errors: Dict[str, str] = {}
+    pending = list(tickers)
+    retry_count = max(1, retry)
+
+    def _fetch_once(tk: str) -> pd.DataFrame:
+        return safe_history(tk, period, interval, retry=1, sleep_s=0.0)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for attempt in range(retry_count):
+            if attempt > 0:
+                time.sleep(sleep_s * 2 ** (attempt - 1))
+
+            futures = [(tk, executor.submit(_fetch_once, tk)) for tk in pending]
+            pending = []
+            for tk, future in futures:
+                try:
+                    fetched[tk] = future.result()
+                    errors.pop(tk, None)
+                except Exception as e:
+                    errors[tk] = str(e)
+                    pending.append(tk)
+
+            if not pending:
+                break
+
+    return fetched, errors
+
+
 def normalize_history_index(df: pd.DataFrame) -> pd.DataFrame:
     """
     株価データのインデックスをタイムゾーンなしの日時に変換し、ソートする
 
+    すでにタイムゾーンなし・昇順の場合は入力をそのまま返す（コピーしない）。
+    呼び出し側は戻り値を読み取り専用として扱うこと。
+
     Args:
         df (pd.DataFrame): 株価データのデータフレーム
     Returns:
         pd.DataFrame: インデックスが正規化された株価データのデータフレーム
     """
-    dfi = df.copy()
-    dfi.index = pd.to_datetime(dfi.index).tz_localize(None)
-    dfi.sort_index(inplace=True)
+    idx = df.index
+    if isinstance(idx, pd.DatetimeIndex) and idx.tz is None and idx.is_monotonic_increasing:
+        return df
+
+    # 列データはコピーせず、インデックスだけ差し替えた浅いビューを作る
+    dfi = df[:]
+    dfi.index = pd.to_datetime(idx).tz_localize(None)
+    if not dfi.index.is_monotonic_increasing:
+        dfi = dfi.sort_index()
     return dfi
 
-def map_row_fields(row: pd.Series, use_adj: bool, fields: List[str]) -> Dict[str, Any]:
+def resolve_field_columns(
+    columns: Iterable[str],
+    use_adj: bool,
+    fields: List[str],
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    出力フィールドと yfinance の列名の対応を求める（DataFrame ごとに1回だけ計算する）
+
+    use_adj が True の場合、'close' は 'Adj Close' 列に対応付ける
+    （値が欠損している行は 'Close' 列の値にフォールバックする）。
+
+    Args:
+        columns (Iterable[str]): DataFrame の列名（または行の index）
+        use_adj (bool): 'close' フィールドに調整後終値を使用するかどうか
+        fields (List[str]): 取得するフィールドのリスト
+    Returns:
+        List[Tuple[str, Optional[str]]]: (出力フィールド, 列名) のリスト
+            （列が存在しない・未知のフィールドは列名を None とする）
+    """
+    available = set(columns)
+    out: List[Tuple[str, Optional[str]]] = []
+    for f in fields:
+        col = FIELD_COLUMNS.get(f)
+        if f == "close" and use_adj and FIELD_COLUMNS["adjclose"] in available:
+            col = FIELD_COLUMNS["adjclose"]
+        out.append((f, col if col in available else None))
+    return out
+
+
+def convert_field_value(field: str, value: Any) -> Any:
+    """
+    yfinance の値を JSON 化可能な Python 値に変換する
+
+    欠損値は価格系なら None、volume なら 0 とする。
+
+    Args:
+        field (str): フィールド名
+        value (Any): 元の値
+    Returns:
+        Any: 変換後の値
+    """
+    if field == "volume":
+        return int(value) if pd.notnull(value) else 0
+    if field not in FIELD_COLUMNS:
+        return None
+    return float(value) if pd.notnull(value) else None
+
+
+def map_row_fields(
+    row: pd.Series,
+    use_adj: bool,
+    fields: List[str],
+    columns: Optional[List[Tuple[str, Optional[str]]]] = None,
+) -> Dict[str, Any]:
     """
     yfinance の OHLCV 欄を指定の fields に応じて dict 化
 
@@ -68,26 +280,67 @@ def map_row_fields(row: pd.Series, use_adj: bool, fields: List[str]) -> Dict[str
         row (pd.Series): yfinance の株価データの行
         use_adj (bool): 'close' フィールドに調整後終値を使用するかどうか
         fields (List[str]): 取得するフィールドのリスト
+        columns (Optional[List[Tuple[str, Optional[str]]]]):
+            resolve_field_columns で事前計算した対応（None の場合はここで計算）
     Returns:
         Dict[str, Any]: 指定されたフィールドを含む辞書
     """
-    mapping = {
-        "open":     float(row.get("Open")) if pd.notnull(row.get("Open")) else None,
-        "high":     float(row.get("High")) if pd.notnull(row.get("High")) else None,
-        "low":      float(row.get("Low")) if pd.notnull(row.get("Low")) else None,
-        "close":    float(row.get("Close")) if pd.notnull(row.get("Close")) else None,
-        "adjclose": float(row.get("Adj Close")) if pd.notnull(row.get("Adj Close")) else None,
-        "volume":   int(row.get("Volume")) if pd.notnull(row.get("Volume")) else 0,
-    }
+    if columns is None:
+        columns = resolve_field_columns(row.index, use_adj, fields)
+
     out: Dict[str, Any] = {}
-    for k in fields:
-        if k == "close" and use_adj and mapping.get("adjclose") is not None:
-            out["close"] = mapping["adjclose"]
-        else:
-            out[k] = mapping.get(k)
+    for f, col in columns:
+        value = convert_field_value(f, row[col] if col is not None else None)
+        if value is None and f == "close" and col == FIELD_COLUMNS["adjclose"]:
+            # 調整後終値が欠損している行は終値を使用
+            value = convert_field_value(f, row.get(FIELD_COLUMNS["close"]))
+        out[f] = value
     return out
 
 
+def _column_values(df: pd.DataFrame, field: str, col: Optional[str]) -> List[Any]:
+    """
+    指定フィールドの列を JSON 化可能な Python 値のリストに一括変換する（convert_field_value と同じ規則）
+
+    Args:
+        df (pd.DataFrame): 株価データ
+        field (str): フィールド名
+        col (Optional[str]): resolve_field_columns で求めた列名（None なら列なし）
+    Returns:
+        List[Any]: 行ごとの値
+    """
+    if col is None or field not in FIELD_COLUMNS:
+        return [convert_field_value(field, None)] * len(df)
+
+    series = df[col]
+    notna = series.notna().tolist()
+    raw = series.tolist()
+    if field == "volume":
+        return [int(v) if ok else 0 for v, ok in zip(raw, notna)]
+    return [float(v) if ok else None for v, ok in zip(raw, notna)]
+
+
+def map_df_field_columns(df: pd.DataFrame, use_adj: bool, fields: List[str]) -> Dict[str, List[Any]]:
+    """
+    DataFrame 全体の OHLCV 欄を fields ごとの値のリストに変換する（map_row_fields の列単位版）
+
+    Args:
+        df (pd.DataFrame): yfinance の株価データ
+        use_adj (bool): 'close' フィールドに調整後終値を使用するかどうか
+        fields (List[str]): 取得するフィールドのリスト
+    Returns:
+        Dict[str, List[Any]]: フィールド -> 行ごとの値
+    """
+    field_columns = dict(resolve_field_columns(df.columns, use_adj, fields))
+    values = {f: _column_values(df, f, col) for f, col in field_columns.items()}
+    if field_columns.get("close") == FIELD_COLUMNS["adjclose"]:
+        # 調整後終値が欠損している行は終値を使用
+        close_col = FIELD_COLUMNS["close"] if FIELD_COLUMNS["close"] in df.columns else None
+        close = _column_values(df, "close", close_col)
+        values["close"] = [a if a is not None else c for a, c in zip(values["close"], close)]
+    return values
+
+
 def select_row_for_asof(df: pd.DataFrame, as_of_d: Optional[date]) -> Optional[pd.Series]:
     """
     指定日の直近の株価データの行を選択する
@@ -5,11 +5,21 @@ from __future__ import annotations
 import argparse
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
 import yfinance as yf
 
+try:
+    # libyaml の C 実装（利用できない環境では純Python実装にフォールバック）
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
 # Add parent directory to path
 script_dir = Path(__file__).resolve().parent.parent
 if str(script_dir) not in sys.path:
@@ -24,30 +34,54 @@ from data.utils.config import (
     download_universe_from_s3,
     upload_universe_to_s3,
 )
+from data.utils.io import read_json_file, write_json
 
 logger = setup_logger(__name__)
 
+# 銘柄情報を並列取得するワーカー数
+FETCH_INFO_MAX_WORKERS = 16
+
+# 銘柄情報取得のリトライ回数と初回の待機時間（秒、以降は倍々に延ばす）
+FETCH_INFO_RETRY = 3
+FETCH_INFO_SLEEP_SECONDS = 1.0
+
+# 静的特徴量キャッシュの有効期間（秒）
+FEATURE_CACHE_TTL_SECONDS = 86400
 
-def fetch_ticker_info(ticker: str) -> Dict[str, Any]:
+
+def fetch_ticker_info(
+    ticker: str,
+    retry: int = FETCH_INFO_RETRY,
+    sleep_s: float = FETCH_INFO_SLEEP_SECONDS,
+) -> Dict[str, Any]:
     """
     yfinanceから銘柄情報を取得する
 
+    並列取得でレート制限（429）などに当たった場合に備え、失敗時は指数バックオフで再試行する。
+
     Args:
         ticker: ティッカーシンボル（例: "6501.T"）
+        retry: 最大試行回数
+        sleep_s: 最初の再試行までの待機時間（秒）
 
     Returns:
         info辞書（取得失敗時は空辞書）
     """
-    try:
-        tk = yf.Ticker(ticker)
+    retry_count = max(1, retry)
+    for attempt in range(retry_count):
         try:
-            info = tk.get_info()
-        except Exception:
-            info = tk.info
-        return info or {}
-    except Exception as e:
-        logger.warning(f"Failed to fetch info for {ticker}: {e}")
-        return {}
+            tk = yf.Ticker(ticker)
+            try:
+                info = tk.get_info()
+            except Exception:
+                info = tk.info
+            return info or {}
+        except Exception as e:
+            if attempt < retry_count - 1:
+                time.sleep(sleep_s * 2 ** attempt)
+            else:
+                logger.warning(f"Failed to fetch info for {ticker}: {e}")
+    return {}
 
 
 def extract_static_features(info: Dict[str, Any]) -> Dict[str, Optional[Any]]:
@@ -69,10 +103,96 @@ def extract_static_features(info: Dict[str, Any]) -> Dict[str, Optional[Any]]:
     }
 
 
+def _feature_cache_path(cache_dir: Path, ticker: str) -> Path:
+    """銘柄ごとのキャッシュファイルのパス（例: <cache_dir>/6501.T.json）"""
+    return cache_dir / f"{ticker.replace('/', '_')}.json"
+
+
+def load_cached_features(
+    cache_dir: Path,
+    ticker: str,
+    ttl_seconds: float = FEATURE_CACHE_TTL_SECONDS,
+) -> Optional[Dict[str, Optional[Any]]]:
+    """
+    キャッシュから静的特徴量を読み込む
+
+    Args:
+        cache_dir: キャッシュディレクトリ
+        ticker: ティッカーシンボル
+        ttl_seconds: キャッシュの有効期間（秒）
+
+    Returns:
+        静的特徴量の辞書（キャッシュがない・期限切れ・読めない場合はNone）
+    """
+    try:
+        entry = read_json_file(_feature_cache_path(cache_dir, ticker))
+    except (OSError, ValueError):
+        return None
+    if time.time() - float(entry.get("fetched_at", 0)) > ttl_seconds:
+        return None
+    return entry.get("features")
+
+
+def save_cached_features(
+    cache_dir: Path,
+    ticker: str,
+    features: Dict[str, Optional[Any]],
+) -> None:
+    """
+    静的特徴量をキャッシュに書き出す（一時ファイル経由で置き換え、失敗しても無視）
+
+    Args:
+        cache_dir: キャッシュディレクトリ
+        ticker: ティッカーシンボル
+        features: 静的特徴量の辞書
+    """
+    cache_path = _feature_cache_path(cache_dir, ticker)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        write_json(tmp_path, {"fetched_at": time.time(), "features": features})
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Failed to write feature cache for {ticker}: {e}")
+
+
+def fetch_static_features(
+    ticker: str,
+    cache_dir: Optional[Path] = None,
+    cache_ttl: float = FEATURE_CACHE_TTL_SECONDS,
+) -> Dict[str, Optional[Any]]:
+    """
+    銘柄の静的特徴量を取得する（cache_dir 指定時は有効期間内のキャッシュを使用）
+
+    Args:
+        ticker: ティッカーシンボル
+        cache_dir: キャッシュディレクトリ（Noneの場合はキャッシュしない）
+        cache_ttl: キャッシュの有効期間（秒）
+
+    Returns:
+        静的特徴量の辞書（extract_static_features と同じ形式）
+    """
+    if cache_dir is not None:
+        cached = load_cached_features(cache_dir, ticker, cache_ttl)
+        if cached is not None:
+            return cached
+
+    info = fetch_ticker_info(ticker)
+    features = extract_static_features(info)
+
+    # 取得に失敗した銘柄（空の info）はキャッシュせず、次回再取得する
+    if cache_dir is not None and info:
+        save_cached_features(cache_dir, ticker, features)
+    return features
+
+
 def enrich_universe(
     input_path: str,
     output_path: str,
     update_mode: str = "full",
+    max_workers: int = FETCH_INFO_MAX_WORKERS,
+    cache_dir: Optional[str] = None,
+    cache_ttl: float = FEATURE_CACHE_TTL_SECONDS,
 ) -> None:
     """
     銘柄ユニバース（universe）に対して yfinance から静的情報を取得し、
@@ -82,6 +202,9 @@ def enrich_universe(
         input_path: 入力YAMLファイルパス
         output_path: 出力YAMLファイルパス
         update_mode: 更新モード ("full" or "valuation-only")
+        max_workers: 銘柄情報を並列取得するワーカー数
+        cache_dir: 取得結果のキャッシュディレクトリ（Noneの場合はキャッシュしない）
+        cache_ttl: キャッシュの有効期間（秒）
 
     取得する情報:
     - sector: セクター（例: "Industrials"）
@@ -121,7 +244,7 @@ def enrich_universe(
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
     print(f"[INFO] Loading universe from: {input_path}")
-    cfg_in = yaml.safe_load(input_path_obj.read_text(encoding="utf-8")) or {}
+    cfg_in = yaml.load(input_path_obj.read_text(encoding="utf-8"), Loader=_Loader) or {}
 
     universe = cfg_in.get("universe", [])
     if not universe:
@@ -133,41 +256,43 @@ def enrich_universe(
 
     updated_universe = []
 
+    # 銘柄情報の取得（ネットワーク待ち）を先に並列実行し、結果の付与は入力順に行う
+    tickers = list(dict.fromkeys(item.get("ticker") for item in universe if item.get("ticker")))
+    print(f"[INFO] Fetching info for {len(tickers)} tickers (parallel: {max_workers}) ...\n")
+    cache_dir_path = Path(cache_dir) if cache_dir else None
+    if cache_dir_path is not None:
+        print(f"[INFO] Feature cache: {cache_dir_path} (ttl: {cache_ttl:.0f}s)")
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        fetched = executor.map(
+            lambda tk: fetch_static_features(tk, cache_dir_path, cache_ttl), tickers
+        )
+        features_by_ticker = dict(zip(tickers, fetched))
+
     for idx, item in enumerate(universe, 1):
         ticker = item.get("ticker")
         if not ticker:
-            print(f"[WARNING] Skipping item {idx}: no ticker field")
+            logger.warning(f"Skipping item {idx}: no ticker field")
             continue
 
-        print(f"[{idx}/{len(universe)}] Fetching info for {ticker} ({item.get('name', 'N/A')}) ...")
-
-        info = fetch_ticker_info(ticker)
-        features = extract_static_features(info)
+        features = features_by_ticker[ticker]
 
+        # 読み込んだ YAML の dict は他で参照しないため、その場で更新する
         # valuation-onlyモードの場合、sector/industryは既存値を保持
         if valuation_only:
-            enriched_item = {**item}
-            enriched_item["PER"] = features["PER"]
-            enriched_item["PBR"] = features["PBR"]
-            enriched_item["DividendYield"] = features["DividendYield"]
+            item["PER"] = features["PER"]
+            item["PBR"] = features["PBR"]
+            item["DividendYield"] = features["DividendYield"]
+            shown = ("PER", "PBR", "DividendYield")
         else:
             # fullモード: すべてのフィールドを更新
-            enriched_item = {**item, **features}
+            item.update(features)
+            shown = ("sector", "industry", "PER", "PBR", "DividendYield")
 
-        # 取得した情報を表示
-        if valuation_only:
-            print(f"  PER={features['PER']}")
-            print(f"  PBR={features['PBR']}")
-            print(f"  DividendYield={features['DividendYield']}")
-        else:
-            print(f"  sector={features['sector']}")
-            print(f"  industry={features['industry']}")
-            print(f"  PER={features['PER']}")
-            print(f"  PBR={features['PBR']}")
-            print(f"  DividendYield={features['DividendYield']}")
-        print()
+        # 取得した情報は銘柄ごとに1行で出力する
+        summary = ", ".join(f"{key}={features[key]}" for key in shown)
+        logger.info(f"[{idx}/{len(universe)}] {ticker} ({item.get('name', 'N/A')}): {summary}")
 
-        updated_universe.append(enriched_item)
+        updated_universe.append(item)
 
     out_cfg = {
         "universe": updated_universe,
@@ -178,8 +303,9 @@ def enrich_universe(
 
     print(f"[INFO] Saving enriched universe → {output_path}")
     output_path_obj.write_text(
-        yaml.safe_dump(
+        yaml.dump(
             out_cfg,
+            Dumper=_Dumper,
             allow_unicode=True,
             sort_keys=False,
             default_flow_style=False,
@@ -268,6 +394,13 @@ def main() -> None:
             env = cfg.get("env", "local")
             update_mode = cfg.get("update_mode", args.update_mode)
 
+            # 取得結果のキャッシュ設定（未指定の場合はキャッシュしない）
+            cache_cfg = cfg.get("cache", {}) or {}
+            cache_dir = cache_cfg.get("dir")
+            if cache_dir and not Path(cache_dir).is_absolute():
+                cache_dir = str(resolve_path(cache_dir, base_dir))
+            cache_ttl = float(cache_cfg.get("ttl_seconds", FEATURE_CACHE_TTL_SECONDS))
+
             if env == "s3":
                 # S3環境
                 s3_cfg = cfg.get("s3", {})
@@ -294,6 +427,8 @@ def main() -> None:
                     input_path=str(local_input_path),
                     output_path=str(local_output_path),
                     update_mode=update_mode,
+                    cache_dir=cache_dir,
+                    cache_ttl=cache_ttl,
                 )
 
                 # S3にアップロード
@@ -322,6 +457,8 @@ def main() -> None:
                     input_path=input_path,
                     output_path=output_path,
                     update_mode=update_mode,
+                    cache_dir=cache_dir,
+                    cache_ttl=cache_ttl,
                 )
         else:
             # 設定ファイルなし（引数のみ）
@@ -7,12 +7,27 @@
 """
 
 from __future__ import annotations
+import datetime
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
 
 from common.constants import WEEKS_PER_YEAR
 
 
+# (曜日, ISO週番号) -> [day_of_week, week_progress] の事前計算テーブル
+# ISO週番号は 1〜53 のため 54 行（0 行目は未使用）
+_POSITION_LUT = np.stack(
+    np.broadcast_arrays(
+        np.arange(7, dtype=np.float64)[:, None],
+        np.arange(54, dtype=np.float64)[None, :] / float(WEEKS_PER_YEAR),
+    ),
+    axis=-1,
+).astype(np.float32)
+_POSITION_LUT.setflags(write=False)
+
+
 def calc_position_features(as_of_date: pd.Timestamp) -> np.ndarray:
     """
     ポジション特徴量を計算する
@@ -32,11 +47,21 @@ def calc_position_features(as_of_date: pd.Timestamp) -> np.ndarray:
         >>> print(features.shape)
         (2,)
     """
-    # 曜日 (0=Monday, 6=Sunday)
-    day_of_week = as_of_date.dayofweek
+    # 同じ日付で多数の銘柄を処理するため日付ごとにキャッシュする（キーはタイムゾーン上の暦日）
+    # 呼び出し側で torch.from_numpy 等に渡して書き換えられてもキャッシュを汚さないようコピーを返す
+    return _position_features_for_day(as_of_date.date()).copy()
+
+
+@lru_cache(maxsize=4096)
+def _position_features_for_day(day: datetime.date) -> np.ndarray:
+    """
+    暦日に対するポジション特徴量（テーブルの読み取り専用ビュー）を返す
 
-    # ISO週番号から年間進捗を計算
-    week_of_year = as_of_date.isocalendar()[1]
-    week_progress = week_of_year / float(WEEKS_PER_YEAR)
+    Args:
+        day: 日付
 
-    return np.array([day_of_week, week_progress], dtype=np.float32)
+    Returns:
+        (2,) のnumpy配列 [day_of_week, week_progress]
+    """
+    # 曜日 (0=Monday, 6=Sunday) と ISO週番号でテーブルを引く
+    return _POSITION_LUT[day.weekday(), day.isocalendar()[1]]
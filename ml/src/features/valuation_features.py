@@ -9,12 +9,20 @@
 """
 
 from __future__ import annotations
-from typing import Dict, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
 import numpy as np
 import pandas as pd
 import yaml
 from pathlib import Path
 
+try:
+    # libyaml の C 実装（利用できない環境では純Python実装にフォールバック）
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 def calc_long_term_stats(
     weekly_df: pd.DataFrame,
@@ -69,6 +77,91 @@ def calc_long_term_stats(
     }
 
 
+def calc_long_term_stats_all(
+    weekly_df: pd.DataFrame,
+    tickers: Sequence[str],
+    as_of_date: pd.Timestamp,
+    lookback_years: int = 3,
+) -> pd.DataFrame:
+    """
+    全銘柄の長期統計特徴量を1回の groupby でまとめて計算する（calc_long_term_stats と同じ値）
+
+    Args:
+        weekly_df: 週次データ
+        tickers: 対象ティッカー（結果の行順）
+        as_of_date: 基準日
+        lookback_years: ルックバック期間（年）
+
+    Returns:
+        index=Ticker, columns=[LongTermMeanRet, LongTermVol, LongTermMaxDD] のDataFrame
+    """
+    cutoff_date = as_of_date - pd.DateOffset(years=lookback_years)
+
+    sub = weekly_df.loc[
+        (weekly_df["Date"] >= cutoff_date) & (weekly_df["Date"] <= as_of_date),
+        ["Ticker", "Date", "RetWeek", "CloseWeek"],
+    ].sort_values(["Ticker", "Date"], kind="stable")
+    gb = sub.groupby("Ticker", sort=False)
+
+    # 週次リターンの平均と標準偏差（欠損を除いた件数が足りない場合は0）
+    ret_count = gb["RetWeek"].count()
+    long_mean = gb["RetWeek"].mean().where(ret_count > 0, 0.0)
+    long_vol = gb["RetWeek"].std().where(ret_count > 1, 0.0)
+
+    # 最大ドローダウン
+    cummax = gb["CloseWeek"].cummax()
+    drawdown = (sub["CloseWeek"] - cummax) / (cummax + 1e-8)
+    max_dd = drawdown.groupby(sub["Ticker"], sort=False).min()
+
+    stats = pd.DataFrame({
+        "LongTermMeanRet": long_mean,
+        "LongTermVol": long_vol,
+        "LongTermMaxDD": max_dd,
+    }).reindex(pd.Index(tickers, name="Ticker"))
+
+    # 最低10週分のデータがない銘柄は0
+    enough = gb.size().reindex(stats.index, fill_value=0) >= 10
+    return stats.where(enough, 0.0).astype(np.float64)
+
+
+@lru_cache(maxsize=4)
+def _load_universe_index(path_str: str, mtime_ns: int) -> Dict[str, Dict[str, Any]]:
+    """
+    ユニバースYAMLを読み込み、ティッカー -> 銘柄情報 の辞書を返す（パスと更新時刻ごとにキャッシュ）
+
+    Args:
+        path_str: ユニバースYAMLのパス
+        mtime_ns: ファイルの更新時刻（キャッシュキー。更新されたら読み直す）
+
+    Returns:
+        ティッカー -> 銘柄情報 の辞書（キャッシュを共有するため変更しないこと）
+    """
+    with open(path_str, "r", encoding="utf-8") as f:
+        universe_data = yaml.load(f, Loader=_Loader)
+
+    universe = universe_data.get("universe", [])
+
+    # 同じティッカーが複数ある場合は先頭を使う（従来の線形探索と同じ）
+    index: Dict[str, Dict[str, Any]] = {}
+    for item in universe:
+        index.setdefault(item.get("ticker"), item)
+    return index
+
+
+def load_universe_index(universe_yaml_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    ユニバースYAMLのティッカー -> 銘柄情報 の辞書を取得する
+
+    Args:
+        universe_yaml_path: ユニバースYAMLのパス
+
+    Returns:
+        ティッカー -> 銘柄情報 の辞書（キャッシュを共有するため変更しないこと）
+    """
+    path = Path(universe_yaml_path).resolve()
+    return _load_universe_index(str(path), path.stat().st_mtime_ns)
+
+
 def load_valuation_from_universe(
     universe_yaml_path: Path,
     ticker: str,
@@ -81,26 +174,13 @@ def load_valuation_from_universe(
         ticker: ティッカー
 
     Returns:
-        {PER, PBR, DividendYield} の辞書
+        {PER, PBR, DividendYield} の辞書（見つからない場合は各値None）
     """
-    with open(universe_yaml_path, "r", encoding="utf-8") as f:
-        universe_data = yaml.safe_load(f)
-
-    universe = universe_data.get("universe", [])
-
-    for item in universe:
-        if item.get("ticker") == ticker:
-            return {
-                "PER": item.get("PER"),
-                "PBR": item.get("PBR"),
-                "DividendYield": item.get("DividendYield"),
-            }
-
-    # 見つからない場合はNone
+    item = load_universe_index(universe_yaml_path).get(ticker, {})
     return {
-        "PER": None,
-        "PBR": None,
-        "DividendYield": None,
+        "PER": item.get("PER"),
+        "PBR": item.get("PBR"),
+        "DividendYield": item.get("DividendYield"),
     }
 
 
@@ -121,20 +201,17 @@ def fill_missing_valuation_with_sector_median(
     df = static_features_df.copy()
 
     # ユニバースからセクター情報を取得
-    with open(universe_yaml_path, "r", encoding="utf-8") as f:
-        universe_data = yaml.safe_load(f)
+    universe_index = load_universe_index(universe_yaml_path)
+    ticker_to_sector = {ticker: item.get("sector") for ticker, item in universe_index.items()}
 
-    universe = universe_data.get("universe", [])
-    ticker_to_sector = {item["ticker"]: item.get("sector") for item in universe}
-
-    df["Sector"] = df["Ticker"].map(ticker_to_sector)
+    # カテゴリ型にして groupby を整数コードで行う（3指標分の文字列ハッシュを避ける）
+    df["Sector"] = df["Ticker"].map(ticker_to_sector).astype("category")
 
     # バリュエーション指標の欠損値を補完
     for col in ["PER", "PBR", "DividendYield"]:
-        # Step 1: セクター中央値で埋める
-        df[col] = df.groupby("Sector")[col].transform(
-            lambda x: x.fillna(x.median())
-        )
+        # Step 1: セクター中央値で埋める（文字列指定で C 実装の集約を使う）
+        sector_median = df.groupby("Sector", observed=True)[col].transform("median")
+        df[col] = df[col].fillna(sector_median)
         # Step 2: それでも欠損なら全体中央値
         df[col] = df[col].fillna(df[col].median())
         # Step 3: まだ欠損なら0
@@ -167,17 +244,22 @@ def calc_static_features(
     tickers = weekly_df["Ticker"].unique()
     records = []
 
-    for ticker in tickers:
-        # 長期統計
-        long_term = calc_long_term_stats(weekly_df, ticker, as_of_date, lookback_years)
+    # 長期統計（全銘柄まとめて計算）
+    long_term_df = calc_long_term_stats_all(weekly_df, tickers, as_of_date, lookback_years)
 
+    # ユニバースの索引は1回だけ取得する（銘柄ごとにパス解決・stat しない）
+    universe_index = load_universe_index(universe_yaml_path)
+
+    for ticker, long_term in zip(tickers, long_term_df.to_dict("records")):
         # バリュエーション
-        valuation = load_valuation_from_universe(universe_yaml_path, ticker)
+        item = universe_index.get(ticker, {})
 
         record = {
             "Ticker": ticker,
             **long_term,
-            **valuation,
+            "PER": item.get("PER"),
+            "PBR": item.get("PBR"),
+            "DividendYield": item.get("DividendYield"),
         }
         records.append(record)
 
@@ -204,20 +286,77 @@ def get_static_feature_columns() -> list[str]:
     ]
 
 
+@dataclass(frozen=True)
+class StaticFeatureTable:
+    """
+    静的特徴量を銘柄ごとに引くための事前計算テーブル
+
+    サンプルごとに static_df をティッカーで絞り込む代わりに、
+    特徴量配列（NaN/Inf は 0 に置換済み）とティッカー -> 行位置 の辞書を一度だけ作っておく。
+
+    配列はデフォルトで float32（モデル入力と同じ精度）。dtype=np.float16 を指定するとメモリは半分になるが、
+    有効桁数が約3桁に落ち、float16 の最大値（65504）を超える値（極端な PER など）は最大値に丸められる。
+    取り出し時は常に float32 に戻す。
+    """
+    tickers: List[str]
+    index: Dict[str, int]
+    data: np.ndarray
+
+    @classmethod
+    def from_frame(
+        cls,
+        static_df: pd.DataFrame,
+        dtype: type = np.float32,
+    ) -> StaticFeatureTable:
+        """
+        静的特徴量DataFrameからテーブルを作成する
+
+        Args:
+            static_df: 静的特徴量DataFrame
+            dtype: 保持する配列の型（np.float32 または np.float16）
+
+        Returns:
+            StaticFeatureTable（同じティッカーが複数行ある場合は先頭の行を使う）
+        """
+        tickers = static_df["Ticker"].tolist()
+        index: Dict[str, int] = {}
+        for i, ticker in enumerate(tickers):
+            index.setdefault(ticker, i)
+
+        data = static_df[get_static_feature_columns()].to_numpy(dtype=np.float64)
+        data = np.nan_to_num(data, nan=0.0, posinf=0.0, neginf=0.0)
+        if np.dtype(dtype) == np.float16:
+            # 範囲外の値が inf にならないよう float16 の表現範囲に収める
+            limit = np.finfo(np.float16).max
+            data = np.clip(data, -limit, limit)
+        elif np.dtype(dtype) != np.float32:
+            raise ValueError(f"Unsupported dtype for StaticFeatureTable: {dtype}")
+        return cls(tickers=tickers, index=index, data=data.astype(dtype))
+
+
 def extract_static_features(
-    static_df: pd.DataFrame,
+    static_df: Union[pd.DataFrame, StaticFeatureTable],
     ticker: str,
 ) -> Optional[np.ndarray]:
     """
     特定の銘柄に対して静的特徴量を抽出する
 
+    多数のサンプルで繰り返し呼ぶ場合は StaticFeatureTable.from_frame で作ったテーブルを渡す。
+
     Args:
-        static_df: 静的特徴量DataFrame
+        static_df: 静的特徴量DataFrame、または StaticFeatureTable
         ticker: ティッカー
 
     Returns:
         (6,) のnumpy配列、またはNone
     """
+    if isinstance(static_df, StaticFeatureTable):
+        row = static_df.index.get(ticker)
+        if row is None:
+            return None
+        # 常に float32 の新しい配列を返す（torch.from_numpy 等に渡されてもテーブルは書き換わらない）
+        return static_df.data[row].astype(np.float32)
+
     feature_cols = get_static_feature_columns()
 
     ticker_row = static_df[static_df["Ticker"] == ticker]
@@ -8,9 +8,15 @@
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 import numpy as np
 import pandas as pd
+from pandas.api.indexers import BaseIndexer
+from pandas.api.types import is_datetime64_any_dtype
+
+
+# 週次バーの集計に使う日次データの列
+_DAILY_INPUT_COLUMNS = ("Date", "Ticker", "Open", "High", "Low", "AdjClose", "Volume")
 
 
 def create_weekly_bars(
@@ -39,96 +45,270 @@ def create_weekly_bars(
     - 出来高 (1): VolumeRatio
     - ローソク足形状 (2): BodyRatio, ClosePosInRange
     """
-    df = df_daily.copy()
-    df["Date"] = pd.to_datetime(df["Date"])
-
-    # as_of_date時点までのデータのみ使用
+    # 集計に使う列だけを参照する（日次データ全体は複製しない）
+    dates = df_daily["Date"]
+    if not is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
+    columns = {col: df_daily[col] for col in _DAILY_INPUT_COLUMNS}
+    columns["Date"] = dates
+    df = pd.DataFrame(columns, copy=False)
+
+    # as_of_date時点までのデータのみ使用（ソート前に絞り込んで扱う行数を減らす）
     if as_of_date is not None:
-        df = df[df["Date"] <= as_of_date]
+        df = df[dates <= as_of_date]
 
     df = df.sort_values(["Ticker", "Date"])
 
-    # ISO週番号を付与
-    df["YearWeek"] = df["Date"].dt.strftime("%G-W%V")
-
-    weekly_records = []
-
-    for ticker, g_ticker in df.groupby("Ticker"):
-        # 週ごとに集約
-        weekly_bars = []
-
-        for year_week, g_week in g_ticker.groupby("YearWeek"):
-            g_week = g_week.sort_values("Date")
-
-            bar = {
-                "Ticker": ticker,
-                "YearWeek": year_week,
-                "Date": g_week.iloc[-1]["Date"],  # 週末日
-                # OHLCV
-                "OpenWeek": float(g_week.iloc[0]["Open"]),
-                "HighWeek": float(g_week["High"].max()),
-                "LowWeek": float(g_week["Low"].min()),
-                "CloseWeek": float(g_week.iloc[-1]["AdjClose"]),
-                "VolumeWeek": int(g_week["Volume"].sum()),
-            }
-            weekly_bars.append(bar)
-
-        weekly_df = pd.DataFrame(weekly_bars)
-        weekly_df = weekly_df.sort_values("Date")
-
-        # 週次リターン
-        weekly_df["RetWeek"] = weekly_df["CloseWeek"].pct_change()
-
-        # 累積リターン
-        weekly_df["Ret4W"] = weekly_df["CloseWeek"].pct_change(4)
-        weekly_df["Ret13W"] = weekly_df["CloseWeek"].pct_change(13)
-        weekly_df["Ret26W"] = weekly_df["CloseWeek"].pct_change(26)
-        weekly_df["Ret52W"] = weekly_df["CloseWeek"].pct_change(52)
-
-        # 移動平均
-        weekly_df["MA_4W"] = weekly_df["CloseWeek"].rolling(4, min_periods=1).mean()
-        weekly_df["MA_13W"] = weekly_df["CloseWeek"].rolling(13, min_periods=1).mean()
-        weekly_df["MA_26W"] = weekly_df["CloseWeek"].rolling(26, min_periods=1).mean()
-
-        # MAからの乖離率
-        weekly_df["PriceVsMA_4W"] = weekly_df["CloseWeek"] / weekly_df["MA_4W"] - 1
-        weekly_df["PriceVsMA_13W"] = weekly_df["CloseWeek"] / weekly_df["MA_13W"] - 1
-        weekly_df["PriceVsMA_26W"] = weekly_df["CloseWeek"] / weekly_df["MA_26W"] - 1
-
-        # 52週高値・安値
-        weekly_df["High52W"] = weekly_df["HighWeek"].rolling(52, min_periods=1).max()
-        weekly_df["Low52W"] = weekly_df["LowWeek"].rolling(52, min_periods=1).min()
-        weekly_df["PriceVs52WH"] = weekly_df["CloseWeek"] / weekly_df["High52W"] - 1
-        weekly_df["PriceVs52WL"] = weekly_df["CloseWeek"] / weekly_df["Low52W"] - 1
-
-        # ボラティリティ
-        weekly_df["Vol_13W"] = weekly_df["RetWeek"].rolling(13, min_periods=1).std()
-        weekly_df["Vol_26W"] = weekly_df["RetWeek"].rolling(26, min_periods=1).std()
-
-        # 出来高比率
-        weekly_df["VolumeMA_13W"] = weekly_df["VolumeWeek"].rolling(13, min_periods=1).mean()
-        weekly_df["VolumeRatio"] = weekly_df["VolumeWeek"] / (weekly_df["VolumeMA_13W"] + 1e-8)
-
-        # ローソク足形状
-        weekly_df["BodyRatio"] = (
-            abs(weekly_df["CloseWeek"] - weekly_df["OpenWeek"]) /
-            (weekly_df["HighWeek"] - weekly_df["LowWeek"] + 1e-8)
-        )
-        weekly_df["ClosePosInRange"] = (
-            (weekly_df["CloseWeek"] - weekly_df["LowWeek"]) /
-            (weekly_df["HighWeek"] - weekly_df["LowWeek"] + 1e-8)
-        )
-
-        # 最新n_weeks分のみ取得
-        weekly_df = weekly_df.tail(n_weeks).copy()
-
-        weekly_records.append(weekly_df)
-
-    if not weekly_records:
+    # ISO週番号を付与（集約は整数キーで行い、"YYYY-Www" への文字列化は週次バーごとに1回だけ）
+    df["YearWeek"] = _iso_year_week_keys(df["Date"])
+
+    bars = _aggregate_weekly_bars(df)
+    if bars.empty:
+        return pd.DataFrame()
+
+    # 特徴量は全銘柄まとめて numpy 配列で計算し、最後に1回だけ DataFrame を組み立てる
+    # （列ごとの代入で DataFrame を何度も作り直さない）
+    group_start = _ticker_group_starts(bars["Ticker"])
+    open_ = bars["OpenWeek"].to_numpy()
+    high = bars["HighWeek"].to_numpy()
+    low = bars["LowWeek"].to_numpy()
+    close = bars["CloseWeek"].to_numpy()
+    volume = bars["VolumeWeek"].to_numpy()
+    features = {}
+
+    # 週次リターン・累積リターン（pct_change と同じく欠損は直前の値で埋めてから計算）
+    close_filled = _group_ffill(close, group_start)
+    for col, periods in (("RetWeek", 1), ("Ret4W", 4), ("Ret13W", 13), ("Ret26W", 26), ("Ret52W", 52)):
+        features[col] = close_filled / _group_shift(close_filled, group_start, periods) - 1
+
+    # 移動平均
+    features["MA_4W"] = _group_rolling(close, group_start, 4, "mean")
+    features["MA_13W"] = _group_rolling(close, group_start, 13, "mean")
+    features["MA_26W"] = _group_rolling(close, group_start, 26, "mean")
+
+    # MAからの乖離率
+    features["PriceVsMA_4W"] = close / features["MA_4W"] - 1
+    features["PriceVsMA_13W"] = close / features["MA_13W"] - 1
+    features["PriceVsMA_26W"] = close / features["MA_26W"] - 1
+
+    # 52週高値・安値
+    features["High52W"] = _group_rolling(high, group_start, 52, "max")
+    features["Low52W"] = _group_rolling(low, group_start, 52, "min")
+    features["PriceVs52WH"] = close / features["High52W"] - 1
+    features["PriceVs52WL"] = close / features["Low52W"] - 1
+
+    # ボラティリティ
+    features["Vol_13W"] = _group_rolling(features["RetWeek"], group_start, 13, "std")
+    features["Vol_26W"] = _group_rolling(features["RetWeek"], group_start, 26, "std")
+
+    # 出来高比率
+    features["VolumeMA_13W"] = _group_rolling(volume, group_start, 13, "mean")
+    features["VolumeRatio"] = volume / (features["VolumeMA_13W"] + 1e-8)
+
+    # ローソク足形状（共通の分母は1回だけ計算し、一時配列を増やさないよう in-place で計算）
+    candle_range = high - low
+    candle_range += 1e-8
+    body_ratio = close - open_
+    np.abs(body_ratio, out=body_ratio)
+    body_ratio /= candle_range
+    close_pos = close - low
+    close_pos /= candle_range
+    features["BodyRatio"] = body_ratio
+    features["ClosePosInRange"] = close_pos
+
+    # 銘柄ごとに最新n_weeks分のみ取得（残す行だけで DataFrame を組み立てる）
+    keep = _group_tail_mask(group_start, n_weeks)
+    columns = {col: bars[col].to_numpy()[keep] for col in bars.columns}
+    columns.update((col, values[keep]) for col, values in features.items())
+    return pd.DataFrame(columns)
+
+
+class _TickerWindowIndexer(BaseIndexer):
+    """
+    銘柄ごとに区切った後ろ向きの rolling 窓（窓が前の銘柄の行にまたがらない）
+
+    Ticker でソート済みの列に対して使う。group_start には各行の銘柄の先頭行位置を渡す。
+    """
+
+    def get_window_bounds(
+        self,
+        num_values: int = 0,
+        min_periods: Optional[int] = None,
+        center: Optional[bool] = None,
+        closed: Optional[str] = None,
+        step: Optional[int] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        end = np.arange(1, num_values + 1, dtype=np.int64)
+        start = np.maximum(end - self.window_size, self.group_start)
+        return start, end
+
+
+def _ticker_group_starts(tickers: pd.Series) -> np.ndarray:
+    """
+    Ticker でソート済みの列について、各行が属する銘柄の先頭行位置を返す
+
+    Args:
+        tickers: Ticker 列（ソート済み）
+
+    Returns:
+        各行の銘柄の先頭行位置（int64）
+    """
+    values = tickers.to_numpy()
+    positions = np.arange(len(values), dtype=np.int64)
+    is_start = np.ones(len(values), dtype=bool)
+    is_start[1:] = values[1:] != values[:-1]
+    return np.maximum.accumulate(np.where(is_start, positions, 0))
+
+
+def _group_ffill(values: np.ndarray, group_start: np.ndarray) -> np.ndarray:
+    """
+    銘柄ごとに欠損値を直前の値で埋める（groupby().ffill() と同じ。銘柄をまたいで埋めない）
+
+    Args:
+        values: Ticker でソート済みの列
+        group_start: _ticker_group_starts の結果
+
+    Returns:
+        欠損を埋めた配列（float64）
+    """
+    positions = np.arange(len(values), dtype=np.int64)
+    last_valid = np.maximum.accumulate(np.where(np.isnan(values), -1, positions))
+    filled = values[np.maximum(last_valid, 0)]
+    return np.where(last_valid >= group_start, filled, np.nan)
+
+
+def _group_shift(values: np.ndarray, group_start: np.ndarray, periods: int) -> np.ndarray:
+    """
+    銘柄ごとに periods 行前の値を返す（groupby().shift() と同じ。銘柄の先頭側は NaN）
+
+    Args:
+        values: Ticker でソート済みの列
+        group_start: _ticker_group_starts の結果
+        periods: ずらす行数（正の値）
+
+    Returns:
+        ずらした配列（float64）
+    """
+    source = np.arange(len(values), dtype=np.int64) - periods
+    shifted = values[np.maximum(source, 0)]
+    return np.where(source >= group_start, shifted, np.nan)
+
+
+def _group_tail_mask(group_start: np.ndarray, n: int) -> np.ndarray:
+    """
+    銘柄ごとの末尾 n 行を示すマスクを返す（groupby().tail(n) と同じ行）
+
+    Args:
+        group_start: _ticker_group_starts の結果
+        n: 残す行数
+
+    Returns:
+        bool のマスク
+    """
+    total = len(group_start)
+    is_end = np.ones(total, dtype=bool)
+    is_end[:-1] = group_start[1:] != group_start[:-1]
+    # 各行の銘柄の末尾行位置（後ろから見た先頭位置）
+    ends = np.flatnonzero(is_end)
+    group_end = ends[np.searchsorted(ends, np.arange(total, dtype=np.int64))]
+    return group_end - np.arange(total, dtype=np.int64) < n
+
+
+def _group_rolling(values: np.ndarray, group_start: np.ndarray, window: int, how: str) -> np.ndarray:
+    """
+    銘柄ごとの rolling 集計を全銘柄まとめて計算する（min_periods=1）
+
+    groupby().rolling() を使わず、銘柄の境界で切った窓を渡して pandas の rolling を1回だけ呼ぶ
+    （rolling の max/min はもともと単調キューによる O(N) 実装）。
+
+    Args:
+        values: Ticker でソート済みの列
+        group_start: _ticker_group_starts の結果
+        window: 窓幅（週）
+        how: 集計方法（"mean", "max", "min", "std"）
+
+    Returns:
+        values と同じ長さの集計結果（float64）
+    """
+    indexer = _TickerWindowIndexer(window_size=window, group_start=group_start)
+    return getattr(pd.Series(values).rolling(indexer, min_periods=1), how)().to_numpy()
+
+
+def _iso_year_week_keys(dates: pd.Series) -> np.ndarray:
+    """
+    日付から ISO年*100 + ISO週番号 の整数キーを計算する（strftime("%G-W%V") の代わり）
+
+    Args:
+        dates: 日付列（datetime64）
+
+    Returns:
+        整数キー（int64、NaT は -1）
+    """
+    iso = dates.dt.isocalendar()
+    keys = iso["year"].astype("Int64") * 100 + iso["week"].astype("Int64")
+    return keys.fillna(-1).to_numpy(dtype=np.int64)
+
+
+def _format_year_weeks(keys: np.ndarray) -> np.ndarray:
+    """
+    _iso_year_week_keys の整数キーを "YYYY-Www" 形式の文字列に変換する
+
+    Args:
+        keys: 整数キー（-1 を含まないこと）
+
+    Returns:
+        文字列の配列（object）
+    """
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    labels = np.array([f"{key // 100:04d}-W{key % 100:02d}" for key in unique_keys], dtype=object)
+    return labels[inverse.reshape(-1)]
+
+
+def _aggregate_weekly_bars(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    日次データを (Ticker, YearWeek) ごとに週次OHLCVバーへ集約する
+
+    Ticker, Date でソート済みの前提で、同じ週の行が連続することを利用し、
+    週の境界位置から reduceat でまとめて集約する（週ごとの Python ループを回さない）。
+    始値・終値・週末日はその週の最初/最後の行の値（欠損でもそのまま）を使う。
+
+    日付が欠損（キー -1）の行は groupby("YearWeek") と同じく集約対象から除く。
+
+    Args:
+        df: Ticker, Date でソート済みの日次データ（YearWeek 列は _iso_year_week_keys の整数キー）
+
+    Returns:
+        週次バー (columns: Ticker, YearWeek, Date, OpenWeek, HighWeek, LowWeek, CloseWeek, VolumeWeek)
+    """
+    has_week = df["YearWeek"].to_numpy() >= 0
+    if not has_week.all():
+        df = df[has_week]
+
+    n = len(df)
+    if n == 0:
         return pd.DataFrame()
 
-    result = pd.concat(weekly_records, ignore_index=True)
-    return result
+    tickers = df["Ticker"].to_numpy()
+    year_weeks = df["YearWeek"].to_numpy()
+
+    # 銘柄または週が変わる位置が各週の先頭
+    is_start = np.ones(n, dtype=bool)
+    is_start[1:] = (tickers[1:] != tickers[:-1]) | (year_weeks[1:] != year_weeks[:-1])
+    starts = np.flatnonzero(is_start)
+    ends = np.append(starts[1:], n) - 1
+
+    volume = df["Volume"].to_numpy(dtype=np.float64)
+    return pd.DataFrame({
+        "Ticker": tickers[starts],
+        "YearWeek": _format_year_weeks(year_weeks[starts]),
+        "Date": df["Date"].to_numpy()[ends],  # 週末日
+        # OHLCV
+        "OpenWeek": df["Open"].to_numpy(dtype=np.float64)[starts],
+        "HighWeek": np.fmax.reduceat(df["High"].to_numpy(dtype=np.float64), starts),
+        "LowWeek": np.fmin.reduceat(df["Low"].to_numpy(dtype=np.float64), starts),
+        "CloseWeek": df["AdjClose"].to_numpy(dtype=np.float64)[ends],
+        "VolumeWeek": np.add.reduceat(np.nan_to_num(volume), starts).astype(np.int64),
+    })
 
 
 def get_weekly_feature_columns() -> list[str]:
@@ -198,3 +378,58 @@ def extract_weekly_sequence(
         features = np.nan_to_num(features, nan=0.0, posinf=0.0, neginf=0.0)
 
     return features.astype(np.float32)
+
+
+def extract_weekly_sequences(
+    weekly_df: pd.DataFrame,
+    tickers: Sequence[str],
+    end_date: pd.Timestamp,
+    n_weeks: int = 156,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    複数銘柄の週次時系列特徴量シーケンスを一括で抽出する
+
+    銘柄ごとに extract_weekly_sequence を呼ぶと毎回 weekly_df 全体を走査するため、
+    同じ end_date の銘柄はこちらでまとめて抽出する。
+
+    Args:
+        weekly_df: 週次特徴量DataFrame
+        tickers: ティッカーのリスト
+        end_date: 終了日（この日までのデータを使用）
+        n_weeks: 抽出する週数
+
+    Returns:
+        (sequences, has_data) のタプル
+        - sequences: (len(tickers), n_weeks, 23) のnumpy配列（データ不足の銘柄はゼロ）
+        - has_data: (len(tickers),) のbool配列（extract_weekly_sequence が None を返す銘柄はFalse）
+    """
+    feature_cols = get_weekly_feature_columns()
+    tickers = list(tickers)
+
+    sequences = np.zeros((len(tickers), n_weeks, len(feature_cols)), dtype=np.float32)
+    has_data = np.zeros(len(tickers), dtype=bool)
+
+    df = weekly_df[(weekly_df["Date"] <= end_date) & weekly_df["Ticker"].isin(tickers)]
+    df = df.groupby("Ticker", sort=False).tail(n_weeks)
+
+    # n_weeks 分そろっている銘柄のみ（元の行順を保ったまま銘柄ごとに連続させる）
+    ticker_values = df["Ticker"].to_numpy()
+    counts = df["Ticker"].map(df["Ticker"].value_counts()).to_numpy()
+    full = counts == n_weeks
+    codes, uniques = pd.factorize(ticker_values[full])
+    if len(uniques) == 0:
+        return sequences, has_data
+    order = np.argsort(codes, kind="stable")
+
+    features = df[feature_cols].to_numpy()[full][order]
+    # NaN/Infを0で埋める（全銘柄分の連続バッファに1回だけ適用）
+    np.nan_to_num(features, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # 同じティッカーが複数回指定された場合も全ての位置に書き込む
+    positions = pd.Index(uniques).get_indexer(tickers)
+    found = positions >= 0
+    blocks = features.reshape(len(uniques), n_weeks, len(feature_cols))
+    sequences[found] = blocks[positions[found]]
+    has_data[found] = True
+
+    return sequences, has_data
@@ -5,26 +5,45 @@
 Example usage of inference results
 """
 
-import json
+import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict
 
+import numpy as np
+import pandas as pd
 
-def example_1_view_single_ticker():
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.utils.io import read_json_file
+
+PREDICTIONS_PATH = Path("/workspace/ml/predictions/latest.json")
+
+# Prediction fields used by the examples
+PREDICTION_COLUMNS = [
+    "ticker", "as_of_date", "current_price", "predicted_12m_price",
+    "predicted_12m_return", "predicted_12m_log_return", "sector",
+]
+
+
+@lru_cache(maxsize=4)
+def _load_predictions_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse predictions JSON (cached per path and mtime)"""
+    return read_json_file(path_str)
+
+
+def load_predictions(predictions_path: Path = PREDICTIONS_PATH) -> Dict[str, Any]:
+    """Load predictions JSON once; re-parse only when the file changes"""
+    return _load_predictions_cached(str(predictions_path), predictions_path.stat().st_mtime_ns)
+
+
+def example_1_view_single_ticker(results: Dict[str, Any]):
     """Example 1: View prediction for a single ticker"""
     print("=" * 60)
     print("Example 1: Single Ticker Prediction")
     print("=" * 60)
 
-    predictions_path = Path("/workspace/ml/predictions/latest.json")
-
-    if not predictions_path.exists():
-        print(f"\n[ERROR] Predictions file not found: {predictions_path}")
-        print("Please run predict.py first to generate predictions.")
-        return
-
-    with open(predictions_path, "r") as f:
-        results = json.load(f)
-
     # Find JT (2914.T)
     jt_pred = next(
         (p for p in results["predictions"] if p["ticker"] == "2914.T"),
@@ -42,32 +61,19 @@ def example_1_view_single_ticker():
         print("\n[WARNING] Ticker 2914.T not found in predictions")
 
 
-def example_2_top_predictions():
+def example_2_top_predictions(results: Dict[str, Any], predictions_df: pd.DataFrame):
     """Example 2: Show top 10 predicted returns"""
     print("\n" + "=" * 60)
     print("Example 2: Top 10 Predicted Returns (12M)")
     print("=" * 60)
 
-    predictions_path = Path("/workspace/ml/predictions/latest.json")
-
-    if not predictions_path.exists():
-        print(f"\n[ERROR] Predictions file not found: {predictions_path}")
-        return
-
-    with open(predictions_path, "r") as f:
-        results = json.load(f)
-
-    # Sort by predicted return
-    sorted_preds = sorted(
-        results["predictions"],
-        key=lambda x: x["predicted_12m_return"],
-        reverse=True
-    )
+    # Top 10 by predicted return (no need to sort the whole table)
+    top_preds = predictions_df.nlargest(10, "predicted_12m_return")
 
     print(f"\nTimestamp: {results['timestamp']}")
     print(f"Total predictions: {results['num_predictions']}\n")
 
-    for i, pred in enumerate(sorted_preds[:10], 1):
+    for i, pred in enumerate(top_preds.to_dict("records"), 1):
         print(
             f"{i:2d}. {pred['ticker']:8s} | "
             f"¥{pred['current_price']:>7,.0f} → ¥{pred['predicted_12m_price']:>7,.0f} | "
@@ -76,108 +82,56 @@ def example_2_top_predictions():
         )
 
 
-def example_3_sector_analysis():
+def example_3_sector_analysis(predictions_df: pd.DataFrame):
     """Example 3: Sector-wise average returns"""
     print("\n" + "=" * 60)
     print("Example 3: Sector Average Returns (12M)")
     print("=" * 60)
 
-    predictions_path = Path("/workspace/ml/predictions/latest.json")
-
-    if not predictions_path.exists():
-        print(f"\n[ERROR] Predictions file not found: {predictions_path}")
-        return
-
-    with open(predictions_path, "r") as f:
-        results = json.load(f)
-
-    # Group by sector
-    from collections import defaultdict
-    sector_data = defaultdict(list)
-
-    for pred in results["predictions"]:
-        sector = pred["sector"]
-        sector_data[sector].append(pred["predicted_12m_return"])
-
-    # Calculate averages
-    sector_avg = {
-        sector: sum(returns) / len(returns)
-        for sector, returns in sector_data.items()
-    }
-
-    # Sort by average return
-    sorted_sectors = sorted(
-        sector_avg.items(),
-        key=lambda x: x[1],
-        reverse=True
+    # Average return per sector, best first (ties keep first-seen sector order)
+    sector_stats = (
+        predictions_df.groupby("sector", sort=False)["predicted_12m_return"]
+        .agg(["mean", "count"])
+        .sort_values("mean", ascending=False, kind="stable")
     )
 
     print()
-    for sector, avg_return in sorted_sectors:
-        count = len(sector_data[sector])
+    for sector, avg_return, count in sector_stats.itertuples():
         print(f"  {sector:30s} ({count:2d} stocks): {avg_return:+6.2%}")
 
 
-def example_4_price_changes():
+def example_4_price_changes(predictions_df: pd.DataFrame):
     """Example 4: Show expected price changes"""
     print("\n" + "=" * 60)
     print("Example 4: Expected Price Changes (12M)")
     print("=" * 60)
 
-    predictions_path = Path("/workspace/ml/predictions/latest.json")
-
-    if not predictions_path.exists():
-        print(f"\n[ERROR] Predictions file not found: {predictions_path}")
-        return
-
-    with open(predictions_path, "r") as f:
-        results = json.load(f)
-
-    # Calculate price change
-    predictions_with_change = []
-    for pred in results["predictions"]:
-        price_change = pred["predicted_12m_price"] - pred["current_price"]
-        predictions_with_change.append({
-            **pred,
-            "price_change": price_change
-        })
-
-    # Sort by absolute price change
-    sorted_by_change = sorted(
-        predictions_with_change,
-        key=lambda x: abs(x["price_change"]),
-        reverse=True
-    )
+    # Top 10 by absolute price change
+    price_change = predictions_df["predicted_12m_price"] - predictions_df["current_price"]
+    top_by_change = predictions_df.assign(
+        price_change=price_change,
+        abs_price_change=price_change.abs(),
+    ).nlargest(10, "abs_price_change")
 
     print()
-    for i, pred in enumerate(sorted_by_change[:10], 1):
+    for i, pred in enumerate(top_by_change.to_dict("records"), 1):
         direction = "↑" if pred["price_change"] > 0 else "↓"
         print(
             f"{i:2d}. {pred['ticker']:8s} | "
-            f"¥{pred['current_price']:>7,.0f} {direction} ¥{abs(pred['price_change']):>6,.0f} | "
+            f"¥{pred['current_price']:>7,.0f} {direction} ¥{pred['abs_price_change']:>6,.0f} | "
             f"{pred['predicted_12m_return']:+6.2%}"
         )
 
 
-def example_5_summary_statistics():
+def example_5_summary_statistics(results: Dict[str, Any], predictions_df: pd.DataFrame):
     """Example 5: Summary statistics"""
     print("\n" + "=" * 60)
     print("Example 5: Summary Statistics")
     print("=" * 60)
 
-    predictions_path = Path("/workspace/ml/predictions/latest.json")
-
-    if not predictions_path.exists():
-        print(f"\n[ERROR] Predictions file not found: {predictions_path}")
-        return
-
-    with open(predictions_path, "r") as f:
-        results = json.load(f)
-
-    import numpy as np
-
-    returns = [p["predicted_12m_return"] for p in results["predictions"]]
-    log_returns = [p["predicted_12m_log_return"] for p in results["predictions"]]
+    # Columns of the prediction table as float64 ndarrays
+    returns = predictions_df["predicted_12m_return"].to_numpy(dtype=np.float64)
+    log_returns = predictions_df["predicted_12m_log_return"].to_numpy(dtype=np.float64)
 
     print(f"\nTimestamp: {results['timestamp']}")
     print(f"Model: {results['model_path']}")
@@ -199,9 +153,9 @@ def example_5_summary_statistics():
     print(f"  Max:    {np.max(log_returns):+.6f}")
 
     # Count positive/negative predictions
-    positive = sum(1 for r in returns if r > 0)
-    negative = sum(1 for r in returns if r < 0)
-    neutral = sum(1 for r in returns if r == 0)
+    positive = int(np.count_nonzero(returns > 0))
+    negative = int(np.count_nonzero(returns < 0))
+    neutral = int(np.count_nonzero(returns == 0))
 
     print(f"\nDirection:")
     print(f"  Positive: {positive} ({positive/len(returns)*100:.1f}%)")
@@ -215,12 +169,21 @@ def main():
     print("Inference Results - Usage Examples")
     print("=" * 60)
 
+    if not PREDICTIONS_PATH.exists():
+        print(f"\n[ERROR] Predictions file not found: {PREDICTIONS_PATH}")
+        print("Please run predict.py first to generate predictions.")
+        return
+
     try:
-        example_1_view_single_ticker()
-        example_2_top_predictions()
-        example_3_sector_analysis()
-        example_4_price_changes()
-        example_5_summary_statistics()
+        results = load_predictions(PREDICTIONS_PATH)
+        # Columnar view of the predictions shared by the examples below
+        predictions_df = pd.DataFrame(results["predictions"], columns=PREDICTION_COLUMNS)
+
+        example_1_view_single_ticker(results)
+        example_2_top_predictions(results, predictions_df)
+        example_3_sector_analysis(predictions_df)
+        example_4_price_changes(predictions_df)
+        example_5_summary_statistics(results, predictions_df)
 
         print("\n" + "=" * 60)
         print("All examples completed!")
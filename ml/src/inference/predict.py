@@ -9,13 +9,13 @@ Uses ONNX model to predict 12-month returns for all universe tickers
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import argparse
 
-import boto3
 import numpy as np
 import onnxruntime as ort
 import pandas as pd
@@ -23,6 +23,7 @@ import pandas as pd
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from common.constants import ONNX_INPUT_NAMES
 from common.logging_config import setup_logger
 from data.utils.universe_loader import load_universe_data, load_sector_mapping
 from data.utils.config import (
@@ -30,12 +31,32 @@ from data.utils.config import (
     resolve_universe_yaml_path_with_s3,
     get_base_dir,
 )
-from data.utils.io import load_daily_data_from_s3, load_daily_data_from_local
+from data.utils.io import (
+    load_daily_data_from_s3,
+    load_daily_data_from_local,
+    daily_data_version_s3,
+    daily_data_version_local,
+)
+from data.utils.s3io import get_s3_client
 from features.weekly_features import create_weekly_bars
 from features.position_features import calc_position_features
 
 logger = setup_logger(__name__)
 
+# 1回の ONNX Runtime 実行にまとめる銘柄数（モデルの入力はバッチ次元が動的）
+INFERENCE_BATCH_SIZE = 64
+
+# ウォームコンテナ間で保持する状態（Lambdaではモジュールのグローバルが再利用される）
+# ONNXセッション: モデルファイル (path, mtime, size) が変わらなければ再利用
+_SESSION_CACHE: Dict[str, Any] = {"key": None, "session": None}
+# S3からダウンロード済みのファイル: ローカルパス -> ETag
+_DOWNLOADED_ETAGS: Dict[str, str] = {}
+# 銘柄ごとの日次データ: 日次ファイルの版（S3はキーとETag）が変わらなければ再利用
+_DAILY_CACHE: Dict[str, Any] = {"key": None, "frames": None}
+# S3クライアントは data.utils.s3io.get_s3_client の共有クライアントを使う（呼び出しごとに生成しない）
+# ダウンロード用のマルチパート転送設定（初回のダウンロード時に生成して共有）
+_TRANSFER_CONFIG = None
+
 
 def calc_static_features_for_ticker(
     weekly_df: pd.DataFrame,
@@ -54,20 +75,24 @@ def calc_static_features_for_ticker(
     - DividendYield: Dividend yield
     """
     # Long-term statistics (3 years)
+    # pandas の mean/std/cumprod/cummax と同じく欠損は除外し、NumPy 配列で1回ずつ計算する
     lookback_weeks = lookback_years * 52
-    recent_df = weekly_df.iloc[-lookback_weeks:] if len(weekly_df) > lookback_weeks else weekly_df
+    returns = weekly_df["RetWeek"].to_numpy(dtype=np.float64)[-lookback_weeks:]
+    returns = returns[~np.isnan(returns)]
 
-    # Mean return
-    mean_ret = recent_df["RetWeek"].mean()
+    if len(returns) == 0:
+        mean_ret = vol = max_dd = np.nan
+    else:
+        # Mean return
+        mean_ret = returns.mean()
 
-    # Volatility
-    vol = recent_df["RetWeek"].std()
+        # Volatility (ddof=1, pandas の std と同じ)
+        vol = returns.std(ddof=1) if len(returns) > 1 else np.nan
 
-    # Max drawdown
-    cumulative = (1 + recent_df["RetWeek"]).cumprod()
-    running_max = cumulative.cummax()
-    drawdown = (cumulative - running_max) / running_max
-    max_dd = drawdown.min()
+        # Max drawdown
+        cumulative = np.cumprod(1 + returns)
+        running_max = np.maximum.accumulate(cumulative)
+        max_dd = ((cumulative - running_max) / running_max).min()
 
     # Valuation metrics from universe YAML
     per = ticker_info.get("PER", 0.0)
@@ -85,19 +110,24 @@ def calc_static_features_for_ticker(
     return np.array([mean_ret, vol, max_dd, per, pbr, div_yield], dtype=np.float32)
 
 
-def predict_ticker(
+def prepare_ticker_inputs(
     ticker: str,
     ticker_info: Dict[str, Any],
-    all_daily_data: pd.DataFrame,
+    df_daily: Optional[pd.DataFrame],
     sector_mapping: Dict[str, int],
-    ort_session: ort.InferenceSession,
     as_of_date: Optional[pd.Timestamp] = None,
 ) -> Dict[str, Any]:
-    """Generate prediction for a single ticker"""
-    # Filter daily data for this ticker (data already loaded in memory)
-    df_daily = all_daily_data[all_daily_data["Ticker"] == ticker].copy()
+    """
+    1銘柄分のモデル入力（バッチ次元なし）と出力組み立て用のメタ情報を作成する
+
+    Args:
+        df_daily: この銘柄の日次データ（split_daily_data_by_ticker の値。データがなければNone）
 
-    if df_daily.empty:
+    Returns:
+        {"inputs": {weekly_seq (156, 23), static_features (6,), position_features (2,), sector_id ()},
+         "ticker", "as_of_date", "current_price", "sector"}
+    """
+    if df_daily is None or df_daily.empty:
         raise ValueError(f"No data found for ticker: {ticker}")
 
     if as_of_date is None:
@@ -122,63 +152,328 @@ def predict_ticker(
     ]
 
     # Get only ticker-specific data (remove Ticker, YearWeek, Date columns)
-    weekly_seq = weekly_df[feature_cols].values.astype(np.float32)
-
-    # Add batch dimension
-    weekly_seq = weekly_seq[np.newaxis, :, :]  # (1, 156, 23)
+    weekly_seq = weekly_df[feature_cols].values.astype(np.float32)  # (156, 23)
 
     # Static features (6 features)
-    static_features = calc_static_features_for_ticker(weekly_df, ticker_info)
-    static_features = static_features[np.newaxis, :]  # (1, 6)
+    static_features = calc_static_features_for_ticker(weekly_df, ticker_info)  # (6,)
 
     # Position features (2 features) using unified module
-    position_features = calc_position_features(as_of_date)
-    position_features = position_features[np.newaxis, :]  # (1, 2)
+    position_features = calc_position_features(as_of_date)  # (2,)
 
     # Sector ID
     sector = ticker_info.get("sector", "Unknown")
-    sector_id = sector_mapping.get(sector, 0)
-    sector_id_array = np.array([sector_id], dtype=np.int64)  # (1,)
+    sector_id = np.int64(sector_mapping.get(sector, 0))
 
-    # Run inference
-    inputs = {
-        "weekly_seq": weekly_seq,
-        "static_features": static_features,
-        "position_features": position_features,
-        "sector_id": sector_id_array,
+    return {
+        "inputs": {
+            "weekly_seq": weekly_seq,
+            "static_features": static_features,
+            "position_features": position_features,
+            "sector_id": sector_id,
+        },
+        "ticker": ticker,
+        "as_of_date": as_of_date,
+        "current_price": float(weekly_df["CloseWeek"].iloc[-1]),
+        "sector": sector,
     }
 
-    outputs = ort_session.run(None, inputs)
-    log_returns = outputs[0][0]  # shape: (12,) - 1~12ヶ月の対数リターン
 
+def build_prediction(prepared: Dict[str, Any], log_returns: np.ndarray) -> Dict[str, Any]:
+    """
+    モデル出力（1銘柄分の対数リターン）から予測結果の辞書を組み立てる
+
+    Args:
+        prepared: prepare_ticker_inputs の結果
+        log_returns: (12,) 1~12ヶ月の対数リターン
+
+    Returns:
+        1銘柄分の予測結果
+    """
     # Convert to predicted prices for each month
-    current_price = float(weekly_df["CloseWeek"].iloc[-1])
+    current_price = prepared["current_price"]
 
-    # 各月の予測株価と通常リターンを計算
-    predictions_by_month = []
-    for month_idx, log_return in enumerate(log_returns, start=1):
-        log_return_float = float(log_return)
-        predicted_price = current_price * np.exp(log_return_float)
-        normal_return = np.exp(log_return_float) - 1
+    # 各月の予測株価と通常リターンを計算（12ヶ月分をまとめて計算）
+    log_returns = np.asarray(log_returns, dtype=np.float64)
+    growth = np.exp(log_returns)
+    predicted_prices = current_price * growth
+    normal_returns = growth - 1
 
-        predictions_by_month.append({
+    predictions_by_month = [
+        {
             "month": month_idx,
-            "log_return": round(log_return_float, 6),
+            "log_return": round(log_return, 6),
             "predicted_price": round(predicted_price, 2),
             "return": round(normal_return, 6),
-        })
+        }
+        for month_idx, (log_return, predicted_price, normal_return) in enumerate(
+            zip(log_returns.tolist(), predicted_prices.tolist(), normal_returns.tolist()),
+            start=1,
+        )
+    ]
 
     return {
-        "ticker": ticker,
-        "as_of_date": as_of_date.strftime("%Y-%m-%d"),
+        "ticker": prepared["ticker"],
+        "as_of_date": prepared["as_of_date"].strftime("%Y-%m-%d"),
         "current_price": round(current_price, 2),
         "predictions": predictions_by_month,  # 1~12ヶ月の予測
         # 後方互換性のため12ヶ月後も保持
-        "predicted_12m_log_return": round(float(log_returns[-1]), 6),
-        "predicted_12m_price": round(current_price * np.exp(float(log_returns[-1])), 2),
-        "predicted_12m_return": round(np.exp(float(log_returns[-1])) - 1, 6),
-        "sector": sector,
+        "predicted_12m_log_return": predictions_by_month[-1]["log_return"],
+        "predicted_12m_price": predictions_by_month[-1]["predicted_price"],
+        "predicted_12m_return": predictions_by_month[-1]["return"],
+        "sector": prepared["sector"],
+    }
+
+
+def run_batch_inference(
+    ort_session: ort.InferenceSession,
+    prepared_list: List[Dict[str, Any]],
+) -> np.ndarray:
+    """
+    複数銘柄の入力をバッチ次元で積み重ね、ONNX Runtime を1回だけ実行する
+
+    Args:
+        ort_session: 推論セッション（入力のバッチ次元は動的）
+        prepared_list: prepare_ticker_inputs の結果のリスト
+
+    Returns:
+        (len(prepared_list), 12) の対数リターン
+    """
+    inputs = {
+        name: np.stack([prepared["inputs"][name] for prepared in prepared_list])
+        for name in ONNX_INPUT_NAMES
     }
+    outputs = ort_session.run(None, inputs)
+    return outputs[0]
+
+
+def predict_ticker(
+    ticker: str,
+    ticker_info: Dict[str, Any],
+    all_daily_data: pd.DataFrame,
+    sector_mapping: Dict[str, int],
+    ort_session: ort.InferenceSession,
+    as_of_date: Optional[pd.Timestamp] = None,
+) -> Dict[str, Any]:
+    """Generate prediction for a single ticker"""
+    df_daily = all_daily_data[all_daily_data["Ticker"] == ticker]
+    prepared = prepare_ticker_inputs(ticker, ticker_info, df_daily, sector_mapping, as_of_date)
+    log_returns = run_batch_inference(ort_session, [prepared])[0]  # shape: (12,)
+    return build_prediction(prepared, log_returns)
+
+
+def predict_all_tickers(
+    tickers: List[Dict[str, Any]],
+    ticker_frames: Dict[str, pd.DataFrame],
+    sector_mapping: Dict[str, int],
+    ort_session: ort.InferenceSession,
+    batch_size: int = INFERENCE_BATCH_SIZE,
+    max_workers: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    全銘柄の入力を作成してから、batch_size 銘柄ずつまとめて推論する
+
+    Args:
+        tickers: ユニバースの銘柄情報のリスト
+        ticker_frames: ティッカー -> 日次データ（split_daily_data_by_ticker の結果）
+        sector_mapping: セクター名 -> ID
+        ort_session: 推論セッション
+        batch_size: 1回の推論に含める銘柄数
+        max_workers: 入力作成の並列スレッド数（Noneの場合はCPU数、1以下なら逐次）
+
+    Returns:
+        (predictions, errors) のタプル（predictions はユニバースの順序）
+    """
+    n_tickers = len(tickers)
+    errors = []
+
+    def prepare(ticker_data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+        ticker = ticker_data["ticker"]
+        try:
+            return prepare_ticker_inputs(ticker, ticker_data, ticker_frames.get(ticker), sector_mapping), None
+        except Exception as e:
+            return None, e
+
+    # Phase 1: 入力の作成（銘柄ごとに独立なためスレッドで並列化。推論とは重ならないので
+    # ONNX Runtime のスレッドと競合しない。失敗した銘柄はエラーとして記録し、推論対象から外す）
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers > 1 and n_tickers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, n_tickers)) as executor:
+            results = list(executor.map(prepare, tickers))
+    else:
+        results = [prepare(ticker_data) for ticker_data in tickers]
+
+    prepared_list = []
+    positions = []
+    for i, (ticker_data, (prepared, e)) in enumerate(zip(tickers, results)):
+        if e is None:
+            prepared_list.append(prepared)
+            positions.append(i)
+        else:
+            error_msg = f"{ticker_data['ticker']}: {str(e)}"
+            errors.append(error_msg)
+            logger.error(f"[{i+1}/{n_tickers}] {error_msg}")
+
+    # Phase 2: バッチ推論
+    predictions = []
+    for start in range(0, len(prepared_list), batch_size):
+        batch = prepared_list[start:start + batch_size]
+        batch_positions = positions[start:start + batch_size]
+        try:
+            log_returns_batch = run_batch_inference(ort_session, batch)
+        except Exception as e:
+            for i, prepared in zip(batch_positions, batch):
+                error_msg = f"{prepared['ticker']}: {str(e)}"
+                errors.append(error_msg)
+                logger.error(f"[{i+1}/{n_tickers}] {error_msg}")
+            continue
+
+        for i, prepared, log_returns in zip(batch_positions, batch, log_returns_batch):
+            pred = build_prediction(prepared, log_returns)
+            predictions.append(pred)
+            logger.info(f"[{i+1}/{n_tickers}] {pred['ticker']}: {pred['predicted_12m_return']:+.2%}")
+
+    return predictions, errors
+
+
+def _get_transfer_config():
+    """
+    ダウンロード用のマルチパート転送設定を取得（初回呼び出し時のみ生成）
+
+    大きなファイル（ONNXモデル）は 8MB ごとのレンジ GET を並列に発行して取得する。
+
+    Returns:
+        boto3.s3.transfer.TransferConfig
+    """
+    global _TRANSFER_CONFIG
+    if _TRANSFER_CONFIG is None:
+        from boto3.s3.transfer import TransferConfig
+
+        _TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=8 * 1024 ** 2,
+            multipart_chunksize=8 * 1024 ** 2,
+            max_concurrency=8,
+            use_threads=True,
+        )
+    return _TRANSFER_CONFIG
+
+
+def download_if_changed(s3_client, bucket: str, key: str, local_path: Path) -> None:
+    """
+    S3オブジェクトをダウンロード（前回と同じETagでローカルに残っていればスキップ）
+
+    Args:
+        s3_client: boto3 S3クライアント
+        bucket: S3バケット名
+        key: S3オブジェクトキー
+        local_path: 保存先パス
+    """
+    etag = s3_client.head_object(Bucket=bucket, Key=key)["ETag"]
+    local_key = str(local_path)
+    if _DOWNLOADED_ETAGS.get(local_key) == etag and local_path.exists():
+        logger.info(f"  Unchanged since last download, reusing {local_path}")
+        return
+
+    s3_client.download_file(bucket, key, local_key, Config=_get_transfer_config())
+    _DOWNLOADED_ETAGS[local_key] = etag
+
+
+def build_session_options(
+    intra_op_num_threads: int,
+    optimized_model_path: Optional[Path] = None,
+) -> ort.SessionOptions:
+    """
+    ONNX Runtime のセッションオプションを作成する
+
+    グラフ最適化（演算子融合・定数畳み込み）をすべて有効にし、演算子内スレッド数をCPU数に合わせる。
+    モデルは逐次実行のため演算子間の並列は使わない。
+
+    Args:
+        intra_op_num_threads: 演算子内スレッド数
+        optimized_model_path: 最適化済みモデルの保存先（Noneの場合は保存しない）
+
+    Returns:
+        ort.SessionOptions: セッションオプション
+    """
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.intra_op_num_threads = intra_op_num_threads
+    opts.inter_op_num_threads = 1
+    opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    if optimized_model_path is not None:
+        opts.optimized_model_filepath = str(optimized_model_path)
+    return opts
+
+
+def _versioned_optimized_path(optimized_model_path: Path, model_stat: os.stat_result) -> Path:
+    """
+    最適化済みモデルの保存先に元モデルの (サイズ, mtime_ns) を埋め込んだパスを返す
+
+    例: best_model.optim.onnx -> best_model.<size>-<mtime_ns>.optim.onnx
+    元モデルが差し替わるとパスも変わるため、mtime を保ったコピーでも古いグラフを読み込まない。
+    """
+    return optimized_model_path.with_name(
+        f"{_optimized_stem(optimized_model_path)}.{model_stat.st_size}-{model_stat.st_mtime_ns}.optim.onnx"
+    )
+
+
+def _optimized_stem(optimized_model_path: Path) -> str:
+    """最適化済みモデルの保存先から .optim.onnx を除いた名前を返す"""
+    name = optimized_model_path.name
+    return name[: -len(".optim.onnx")] if name.endswith(".optim.onnx") else optimized_model_path.stem
+
+
+def get_ort_session(
+    model_path: Path,
+    intra_op_num_threads: Optional[int] = None,
+    optimized_model_path: Optional[Path] = None,
+) -> ort.InferenceSession:
+    """
+    ONNX Runtimeセッションを取得（モデルファイルが変わっていなければ前回のセッションを再利用）
+
+    optimized_model_path を指定すると、最適化後のグラフを元モデルの (サイズ, mtime_ns) を付けた
+    ファイル名で保存する。同じ元モデルの保存済みファイルがあれば、それを最適化なしで読み込む
+    （最適化を再実行しない）。
+
+    Args:
+        model_path: ONNXモデルファイルパス
+        intra_op_num_threads: 演算子内スレッド数（Noneの場合は環境変数 ORT_INTRA_OP、なければCPU数）
+        optimized_model_path: 最適化済みモデルの保存先
+
+    Returns:
+        ort.InferenceSession: 推論セッション
+    """
+    if intra_op_num_threads is None:
+        intra_op_num_threads = int(os.environ.get("ORT_INTRA_OP", os.cpu_count() or 2))
+
+    stat = model_path.stat()
+    key = (str(model_path), stat.st_mtime_ns, stat.st_size, intra_op_num_threads)
+    if _SESSION_CACHE["key"] == key:
+        logger.info("  Reusing cached ONNX session")
+        return _SESSION_CACHE["session"]
+
+    stale_pattern = None
+    if optimized_model_path is not None:
+        stale_pattern = f"{_optimized_stem(optimized_model_path)}.*-*.optim.onnx"
+        optimized_model_path = _versioned_optimized_path(optimized_model_path, stat)
+
+    if optimized_model_path is not None and optimized_model_path.exists():
+        # 最適化済みのグラフを再利用（同じコンテナのコールドスタートでは最適化を省略）
+        logger.info(f"  Loading pre-optimized model: {optimized_model_path}")
+        opts = build_session_options(intra_op_num_threads)
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+        session = ort.InferenceSession(str(optimized_model_path), sess_options=opts)
+    else:
+        if optimized_model_path is not None:
+            # 以前の元モデル向けの最適化済みファイルは使われないため削除する
+            for stale in optimized_model_path.parent.glob(stale_pattern):
+                stale.unlink(missing_ok=True)
+        opts = build_session_options(intra_op_num_threads, optimized_model_path)
+        session = ort.InferenceSession(str(model_path), sess_options=opts)
+
+    _SESSION_CACHE["session"] = session
+    _SESSION_CACHE["key"] = key
+    return session
 
 
 def load_config(config_path: Path) -> Dict[str, Any]:
@@ -202,6 +497,11 @@ class InferenceConfig:
     output_dir: Path
     s3_bucket: Optional[str]
     predictions_prefix: Optional[str]
+    ort_intra_op_num_threads: Optional[int] = None
+    ort_optimized_model_path: Optional[Path] = None
+    # S3環境のみ: ダウンロード元のモデル/メタデータのキー
+    onnx_key: Optional[str] = None
+    metadata_key: Optional[str] = None
 
     @property
     def is_s3_env(self) -> bool:
@@ -228,20 +528,11 @@ def resolve_inference_config(config: Dict[str, Any], config_path: Path) -> Infer
         predictions_prefix = s3_output_cfg.get("predictions_prefix", "predictions")
         output_dir = Path("/tmp/predictions")
 
-        # ONNXモデルをS3からダウンロード
+        # ONNXモデルとメタデータのダウンロード先（ダウンロードは download_model_artifacts で行う）
         onnx_key = s3_input_cfg.get("onnx_key", "models/onnx/best_model.onnx")
         onnx_model_path = Path("/tmp") / "best_model.onnx"
-        s3_client = boto3.client('s3')
-        logger.info(f"Downloading ONNX model from s3://{s3_bucket}/{onnx_key}...")
-        s3_client.download_file(s3_bucket, onnx_key, str(onnx_model_path))
-
-        # メタデータもダウンロード（存在する場合）
         metadata_key = onnx_key.replace(".onnx", ".json")
         metadata_path = Path("/tmp") / "best_model.json"
-        try:
-            s3_client.download_file(s3_bucket, metadata_key, str(metadata_path))
-        except Exception:
-            metadata_path = None
     else:
         local_cfg = config.get("local", {})
         local_input_cfg = local_cfg.get("input", {})
@@ -256,6 +547,19 @@ def resolve_inference_config(config: Dict[str, Any], config_path: Path) -> Infer
         model_cfg = config.get("model", {})
         onnx_model_path = project_root / model_cfg.get("onnx_path", "models/onnx/best_model.onnx")
         metadata_path = onnx_model_path.with_suffix(".json")
+        onnx_key = None
+        metadata_key = None
+
+    # ONNX Runtime の設定（スレッド数: null の場合は ORT_INTRA_OP 環境変数、なければCPU数）
+    ort_cfg = config.get("model", {}).get("ort", {})
+    ort_intra_op_num_threads = ort_cfg.get("intra_op_num_threads")
+    # 最適化済みモデルの保存: null の場合は S3 環境（/tmp に保存）のみ有効。ローカルではソースツリーに書き出さない
+    save_optimized_model = ort_cfg.get("save_optimized_model")
+    if save_optimized_model is None:
+        save_optimized_model = env == "s3"
+    ort_optimized_model_path = None
+    if save_optimized_model:
+        ort_optimized_model_path = onnx_model_path.with_suffix(".optim.onnx")
 
     return InferenceConfig(
         env=env,
@@ -266,16 +570,78 @@ def resolve_inference_config(config: Dict[str, Any], config_path: Path) -> Infer
         output_dir=output_dir,
         s3_bucket=s3_bucket,
         predictions_prefix=predictions_prefix,
+        ort_intra_op_num_threads=ort_intra_op_num_threads,
+        ort_optimized_model_path=ort_optimized_model_path,
+        onnx_key=onnx_key,
+        metadata_key=metadata_key,
+    )
+
+
+def download_model_artifacts(cfg: InferenceConfig) -> Optional[Path]:
+    """
+    S3環境の場合、ONNXモデルとメタデータ（存在する場合）をS3から並列にダウンロードする
+
+    Args:
+        cfg: 推論設定
+
+    Returns:
+        使用するメタデータのパス（S3環境でメタデータを取得できなかった場合はNone）
+    """
+    if not cfg.is_s3_env:
+        return cfg.metadata_path
+
+    s3_client = get_s3_client()
+    logger.info(f"Downloading ONNX model from s3://{cfg.s3_bucket}/{cfg.onnx_key}...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        model_future = executor.submit(
+            download_if_changed, s3_client, cfg.s3_bucket, cfg.onnx_key, cfg.onnx_model_path
+        )
+        metadata_future = executor.submit(
+            download_if_changed, s3_client, cfg.s3_bucket, cfg.metadata_key, cfg.metadata_path
+        )
+        model_future.result()
+        try:
+            metadata_future.result()
+        except Exception:
+            return None
+    return cfg.metadata_path
+
+
+def load_model(cfg: InferenceConfig) -> Tuple[ort.InferenceSession, Dict[str, int]]:
+    """
+    ONNXモデル（S3環境ではダウンロード後）のセッションとセクターマッピングを用意する
+
+    Args:
+        cfg: 推論設定
+
+    Returns:
+        (ONNX Runtime セッション, セクター名 -> セクターID)
+    """
+    metadata_path = download_model_artifacts(cfg)
+
+    logger.info("Loading ONNX model...")
+    ort_session = get_ort_session(
+        cfg.onnx_model_path,
+        intra_op_num_threads=cfg.ort_intra_op_num_threads,
+        optimized_model_path=cfg.ort_optimized_model_path,
     )
+    logger.info(f"Model loaded: {cfg.onnx_model_path.name}")
+
+    sector_mapping = load_sector_mapping_from_metadata(metadata_path)
+    return ort_session, sector_mapping
+
+
+def _split_s3_path(s3_path: str) -> Tuple[str, str]:
+    """s3://bucket/prefix をバケット名とプレフィックスに分割する"""
+    s3_parts = s3_path[5:].split("/", 1)
+    return s3_parts[0], s3_parts[1] if len(s3_parts) > 1 else ""
 
 
 def load_all_daily_data(cfg: InferenceConfig) -> pd.DataFrame:
     """日次データを一括で読み込む"""
     logger.info("Loading daily data...")
     if cfg.is_s3_env:
-        s3_parts = cfg.daily_data_path[5:].split("/", 1)
-        s3_data_bucket = s3_parts[0]
-        s3_data_prefix = s3_parts[1] if len(s3_parts) > 1 else ""
+        s3_data_bucket, s3_data_prefix = _split_s3_path(cfg.daily_data_path)
         all_daily_data = load_daily_data_from_s3(
             bucket=s3_data_bucket,
             prefix=s3_data_prefix,
@@ -288,6 +654,51 @@ def load_all_daily_data(cfg: InferenceConfig) -> pd.DataFrame:
     return all_daily_data
 
 
+def split_daily_data_by_ticker(all_daily_data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    日次データを銘柄ごとの DataFrame に1回で分割する（銘柄ごとに全行を走査しない）
+
+    Args:
+        all_daily_data: 全銘柄の日次データ
+
+    Returns:
+        ティッカー -> その銘柄の日次データ（元の行順）
+    """
+    return {
+        ticker: group
+        for ticker, group in all_daily_data.groupby("Ticker", sort=False)
+    }
+
+
+def load_ticker_frames(cfg: InferenceConfig) -> Dict[str, pd.DataFrame]:
+    """
+    銘柄ごとの日次データを取得する（日次ファイルが前回から変わっていなければ前回の結果を再利用）
+
+    Lambdaのウォーム起動では、S3の一覧（キーとETag）だけを確認して本文の読み込み・パースを省く。
+
+    Args:
+        cfg: 推論設定
+
+    Returns:
+        ティッカー -> その銘柄の日次データ（split_daily_data_by_ticker の結果。呼び出し側で変更しないこと）
+    """
+    if cfg.is_s3_env:
+        s3_data_bucket, s3_data_prefix = _split_s3_path(cfg.daily_data_path)
+        version = daily_data_version_s3(s3_data_bucket, s3_data_prefix)
+    else:
+        version = daily_data_version_local(Path(cfg.daily_data_path))
+    key = (cfg.daily_data_path, version)
+
+    if _DAILY_CACHE["key"] == key:
+        logger.info(f"Reusing cached daily data for {len(_DAILY_CACHE['frames'])} tickers (unchanged)")
+        return _DAILY_CACHE["frames"]
+
+    ticker_frames = split_daily_data_by_ticker(load_all_daily_data(cfg))
+    _DAILY_CACHE["frames"] = ticker_frames
+    _DAILY_CACHE["key"] = key
+    return ticker_frames
+
+
 def load_sector_mapping_from_metadata(metadata_path: Optional[Path]) -> Dict[str, int]:
     """セクターマッピングを読み込む"""
     if metadata_path and metadata_path.exists():
@@ -297,10 +708,10 @@ def load_sector_mapping_from_metadata(metadata_path: Optional[Path]) -> Dict[str
         sector_mapping = metadata.get("sector_mapping", {})
         if not sector_mapping:
             logger.info("Model metadata has no sector_mapping, using sectors.yaml...")
-            sector_mapping = load_sector_mapping()
+            sector_mapping = dict(load_sector_mapping())
     else:
         logger.info("Loading sector mapping from sectors.yaml...")
-        sector_mapping = load_sector_mapping()
+        sector_mapping = dict(load_sector_mapping())
     logger.info(f"Loaded sector mapping: {len(sector_mapping)} sectors")
     return sector_mapping
 
@@ -328,16 +739,23 @@ def save_predictions(
     # Upload to S3 if S3 environment
     if cfg.is_s3_env:
         try:
-            s3_client = boto3.client('s3')
+            s3_client = get_s3_client()
             logger.info("Uploading to S3...")
 
-            s3_key_date = f"{cfg.predictions_prefix}/{as_of_date}.json"
-            s3_client.upload_file(str(date_output_path), cfg.s3_bucket, s3_key_date)
-            logger.info(f"  Uploaded to s3://{cfg.s3_bucket}/{s3_key_date}")
-
-            s3_key_latest = f"{cfg.predictions_prefix}/latest.json"
-            s3_client.upload_file(str(latest_output_path), cfg.s3_bucket, s3_key_latest)
-            logger.info(f"  Uploaded to s3://{cfg.s3_bucket}/{s3_key_latest}")
+            # 日付ファイルと latest.json は独立しているため並列にアップロード
+            uploads = [
+                (date_output_path, f"{cfg.predictions_prefix}/{as_of_date}.json"),
+                (latest_output_path, f"{cfg.predictions_prefix}/latest.json"),
+            ]
+            with ThreadPoolExecutor(max_workers=len(uploads)) as executor:
+                futures = [
+                    executor.submit(s3_client.upload_file, str(path), cfg.s3_bucket, key)
+                    for path, key in uploads
+                ]
+                for future in futures:
+                    future.result()
+            for _, key in uploads:
+                logger.info(f"  Uploaded to s3://{cfg.s3_bucket}/{key}")
         except Exception as e:
             logger.error(f"Error uploading to S3: {e}")
 
@@ -406,39 +824,27 @@ def main():
     logger.info("=" * 60)
 
     # Load resources
-    logger.info("Loading universe YAML...")
-    universe_data = load_universe_data(cfg.universe_yaml_path)
-    tickers = universe_data["tickers"]
-    logger.info(f"Found {len(tickers)} tickers")
+    # モデルの取得・セッション生成、日次データの読み込み、ユニバースの読み込みは互いに独立なため並行に行う
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        model_future = executor.submit(load_model, cfg)
+        frames_future = executor.submit(load_ticker_frames, cfg)
+        universe_future = executor.submit(load_universe_data, cfg.universe_yaml_path)
 
-    logger.info("Loading ONNX model...")
-    ort_session = ort.InferenceSession(str(cfg.onnx_model_path))
-    logger.info(f"Model loaded: {cfg.onnx_model_path.name}")
+        universe_data = universe_future.result()
+        tickers = universe_data["tickers"]
+        logger.info(f"Found {len(tickers)} tickers")
 
-    sector_mapping = load_sector_mapping_from_metadata(cfg.metadata_path)
-    all_daily_data = load_all_daily_data(cfg)
+        ort_session, sector_mapping = model_future.result()
+        ticker_frames = frames_future.result()
 
     # Run predictions
     logger.info("Running predictions...")
-    predictions = []
-    errors = []
-
-    for i, ticker_data in enumerate(tickers):
-        ticker = ticker_data["ticker"]
-        try:
-            pred = predict_ticker(
-                ticker=ticker,
-                ticker_info=ticker_data,
-                all_daily_data=all_daily_data,
-                sector_mapping=sector_mapping,
-                ort_session=ort_session,
-            )
-            predictions.append(pred)
-            logger.info(f"[{i+1}/{len(tickers)}] {ticker}: {pred['predicted_12m_return']:+.2%}")
-        except Exception as e:
-            error_msg = f"{ticker}: {str(e)}"
-            errors.append(error_msg)
-            logger.error(f"[{i+1}/{len(tickers)}] {error_msg}")
+    predictions, errors = predict_all_tickers(
+        tickers=tickers,
+        ticker_frames=ticker_frames,
+        sector_mapping=sector_mapping,
+        ort_session=ort_session,
+    )
 
     # Determine as_of_date
     if predictions:
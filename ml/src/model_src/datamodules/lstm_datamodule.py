@@ -13,7 +13,6 @@ LSTM用のPyTorch Lightning DataModule
 from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple, Any
-import json
 
 import numpy as np
 import pandas as pd
@@ -22,6 +21,12 @@ import torch
 from torch.utils.data import Dataset, DataLoader
 import yaml
 
+try:
+    # libyaml の C 実装（利用できない環境では純Python実装にフォールバック）
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 # Feature calculation modules
 import sys
 script_dir = Path(__file__).resolve().parent.parent.parent
@@ -30,9 +35,15 @@ if str(script_dir) not in sys.path:
 
 from common.logging_config import setup_logger
 from features.weekly_features import create_weekly_bars, get_weekly_feature_columns, extract_weekly_sequence
-from features.valuation_features import calc_static_features, get_static_feature_columns, extract_static_features
+from features.valuation_features import (
+    StaticFeatureTable,
+    calc_static_features,
+    get_static_feature_columns,
+    extract_static_features,
+)
 from features.position_features import calc_position_features
 from data.utils.universe_loader import load_sector_mapping, get_sector_id
+from data.utils.io import DATE_FORMAT, list_local_daily_files, read_json_file
 
 logger = setup_logger(__name__)
 
@@ -68,6 +79,7 @@ class StockPredictionDataset(Dataset):
         self.samples = samples
         self.weekly_df = weekly_df
         self.static_df = static_df
+        self.static_table = StaticFeatureTable.from_frame(static_df)
         self.sector_mapping = sector_mapping
         self.ticker_to_sector = ticker_to_sector
 
@@ -93,7 +105,7 @@ class StockPredictionDataset(Dataset):
             weekly_seq = np.zeros((156, 23), dtype=np.float32)
 
         # 静的特徴量 (6,)
-        static_feat = extract_static_features(self.static_df, ticker)
+        static_feat = extract_static_features(self.static_table, ticker)
 
         if static_feat is None:
             static_feat = np.zeros(6, dtype=np.float32)
@@ -247,16 +259,14 @@ class LSTMDataModule(pl.LightningDataModule):
 
     def _load_daily_data(self) -> pd.DataFrame:
         """全JSON ファイルから日次データを読み込む"""
-        json_files = sorted(self.daily_data_dir.glob("*.json"))
-        json_files = [f for f in json_files if f.name != "latest.json"]
+        json_files = list_local_daily_files(self.daily_data_dir)
 
         if not json_files:
             raise ValueError(f"No JSON files found in {self.daily_data_dir}")
 
         records = []
         for json_file in json_files:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json_file(json_file)
 
             date_str = data.get("as_of")
             symbols = data.get("symbols", [])
@@ -266,7 +276,7 @@ class LSTMDataModule(pl.LightningDataModule):
                 records.append(sym)
 
         df = pd.DataFrame(records)
-        df["Date"] = pd.to_datetime(df["Date"])
+        df["Date"] = pd.to_datetime(df["Date"], format=DATE_FORMAT, cache=True)
 
         # カラム名を標準化（小文字 → 大文字）
         column_mapping = {
@@ -297,11 +307,11 @@ class LSTMDataModule(pl.LightningDataModule):
         - universe YAML から各ティッカーのセクター名を取得
         """
         # 1. sectors.yaml からマスターマッピングを読み込み
-        sector_mapping = load_sector_mapping()
+        sector_mapping = dict(load_sector_mapping())
 
         # 2. universe YAML から各ティッカーのセクター名を取得
         with open(self.universe_yaml_path, "r", encoding="utf-8") as f:
-            universe_data = yaml.safe_load(f)
+            universe_data = yaml.load(f, Loader=_Loader)
 
         universe = universe_data.get("universe", [])
         ticker_to_sector = {}
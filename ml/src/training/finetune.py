@@ -13,8 +13,10 @@ CPU専用、軽量実装
 
 import argparse
 import json
+import os
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -34,6 +36,7 @@ from common.logging_config import setup_logger
 from common.constants import (
     N_WEEKS_INPUT,
     N_STATIC_FEATURES,
+    SHAPE_WEEKLY,
     FINETUNE_LOOKBACK_YEARS,
     MIN_DAILY_RECORDS_PER_TICKER,
 )
@@ -166,12 +169,12 @@ def save_results(
 
             # ONNX モデル
             s3_key_onnx = f"{cfg.onnx_prefix}/{onnx_path.name}"
-            s3_client.upload_file(str(onnx_path), cfg.bucket, s3_key_onnx)
+            s3_client.upload_file(os.fspath(onnx_path), cfg.bucket, s3_key_onnx)
             logger.info(f"  Uploaded to s3://{cfg.bucket}/{s3_key_onnx}")
 
             # メタデータ
             s3_key_meta = f"{cfg.onnx_prefix}/{metadata_path.name}"
-            s3_client.upload_file(str(metadata_path), cfg.bucket, s3_key_meta)
+            s3_client.upload_file(os.fspath(metadata_path), cfg.bucket, s3_key_meta)
             logger.info(f"  Uploaded to s3://{cfg.bucket}/{s3_key_meta}")
 
         except Exception as e:
@@ -244,8 +247,12 @@ def prepare_finetuning_data(
     """
     import pandas as pd
 
-    from features.weekly_features import create_weekly_bars, extract_weekly_sequence
-    from features.valuation_features import calc_static_features, extract_static_features
+    from features.weekly_features import create_weekly_bars, extract_weekly_sequences
+    from features.valuation_features import (
+        StaticFeatureTable,
+        calc_static_features,
+        extract_static_features,
+    )
     from data.utils.universe_loader import load_sector_mapping, load_universe_data
 
     logger.info("\n[INFO] Preparing finetuning data (optimized)...")
@@ -291,11 +298,12 @@ def prepare_finetuning_data(
         as_of_date=latest_date,
         lookback_years=3,
     )
+    static_table = StaticFeatureTable.from_frame(static_df)
     logger.info(f"[OK] Generated static features for {len(static_df)} tickers")
 
     # 4. セクターマッピング
     logger.info("\n[INFO] Creating sector mapping...")
-    sector_mapping = load_sector_mapping()
+    sector_mapping = dict(load_sector_mapping())
     universe_data = load_universe_data(universe_yaml_path)
     ticker_to_sector = {
         item["ticker"]: item.get("sector", "Unknown")
@@ -315,24 +323,32 @@ def prepare_finetuning_data(
 
     # 6. 特徴量を抽出
     logger.info("\n[INFO] Extracting features...")
-    weekly_seqs = []
     static_features_list = []
     position_features_list = []
     sector_ids = []
     targets = []
 
+    # 週次時系列特徴量 (N_WEEKS_INPUT, N_WEEKLY_FEATURES)
+    # 同じ base_date のサンプルはまとめて抽出する（データ不足の銘柄はゼロ埋め）
+    weekly_seqs = np.zeros((len(samples), *SHAPE_WEEKLY), dtype=np.float32)
+    indices_by_date: Dict[Any, List[int]] = {}
+    for i, sample in enumerate(samples):
+        indices_by_date.setdefault(sample["base_date"], []).append(i)
+    for base_date, indices in indices_by_date.items():
+        weekly_seqs[indices], _ = extract_weekly_sequences(
+            weekly_df,
+            [samples[i]["ticker"] for i in indices],
+            pd.Timestamp(base_date),
+            n_weeks=N_WEEKS_INPUT,
+        )
+
     for sample in samples:
         ticker = sample["ticker"]
         base_date = pd.Timestamp(sample["base_date"])
         target_returns = sample["target_returns"]
 
-        # 週次時系列特徴量 (N_WEEKS_INPUT, N_WEEKLY_FEATURES)
-        weekly_seq = extract_weekly_sequence(weekly_df, ticker, base_date, n_weeks=N_WEEKS_INPUT)
-        if weekly_seq is None:
-            weekly_seq = np.zeros((N_WEEKS_INPUT, 23), dtype=np.float32)
-
         # 静的特徴量 (N_STATIC_FEATURES,)
-        static_feat = extract_static_features(static_df, ticker)
+        static_feat = extract_static_features(static_table, ticker)
         if static_feat is None:
             static_feat = np.zeros(N_STATIC_FEATURES, dtype=np.float32)
 
@@ -343,14 +359,12 @@ def prepare_finetuning_data(
         sector = ticker_to_sector.get(ticker, "Unknown")
         sector_id = sector_mapping.get(sector, 0)
 
-        weekly_seqs.append(weekly_seq)
         static_features_list.append(static_feat)
         position_features_list.append(position_feat)
         sector_ids.append(sector_id)
         targets.append(target_returns)
 
     # NumPy配列に変換
-    weekly_seqs = np.array(weekly_seqs, dtype=np.float32)
     static_features_list = np.array(static_features_list, dtype=np.float32)
     position_features_list = np.array(position_features_list, dtype=np.float32)
     sector_ids = np.array(sector_ids, dtype=np.int64)
@@ -678,7 +692,7 @@ def main():
     # 5. ONNX エクスポート
     logger.info("\n[INFO] Exporting to ONNX...")
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())  # UTC
     onnx_filename = "best_model.onnx"
 
     cfg.output_dir.mkdir(parents=True, exist_ok=True)